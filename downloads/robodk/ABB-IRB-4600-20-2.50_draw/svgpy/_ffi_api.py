@@ -13,6 +13,11 @@
 # limitations under the License.
 
 
+import importlib
+import os
+import threading
+from functools import lru_cache
+
 from cffi import FFI
 
 _API = r"""
@@ -988,9 +993,7 @@ hb_version (unsigned int *major,
             unsigned int *micro);
 """
 
-ffi = FFI()
-ffi.cdef(_API)
-del _API
+_lock = threading.RLock()
 
 
 def dlopen(_ffi, names):
@@ -1004,3 +1007,148 @@ def dlopen(_ffi, names):
     if lib is None:
         raise OSError('Cannot open shared object file: ' + repr(names))
     return lib
+
+
+@lru_cache(maxsize=None)
+def load_compiled(name):
+    """Imports the FFI module compiled in the out-of-line API mode.
+
+    The compiled modules are built by 'python -m svgpy._ffi_build'.
+    Setting the environment variable 'SVGPY_FFI_MODE' to 'abi' disables
+    them.
+
+    Arguments:
+        name (str): The name of the compiled module in the svgpy package.
+    Returns:
+        module: The compiled module, or None if it is not available.
+    """
+    if name is None or os.environ.get('SVGPY_FFI_MODE', '').lower() == 'abi':
+        return None
+    try:
+        return importlib.import_module('.' + name, __package__)
+    except ImportError:
+        return None
+
+
+class LazyFFI(object):
+    """A proxy of the FFI object that parses the C declarations on first use.
+
+    Parsing the C declarations is the most expensive part of importing the
+    text stack, so it is deferred until the FFI object is actually used.
+    """
+
+    def __init__(self, source, compiled=None, **kwargs):
+        """Constructs a LazyFFI object.
+
+        Arguments:
+            source (str, callable): The C declarations, or a function that
+                returns them.
+            compiled (str, optional): The name of the compiled module that
+                is used instead of parsing the C declarations if available.
+            **kwargs: The keyword arguments passed to FFI.cdef().
+        """
+        self._source = source
+        self._compiled = compiled
+        self._kwargs = kwargs
+        self._ffi = None
+
+    def __getattr__(self, name):
+        value = getattr(self.load(), name)
+        setattr(self, name, value)
+        return value
+
+    def load(self):
+        """Parses the C declarations if they have not been parsed yet.
+
+        Returns:
+            FFI: The FFI object.
+        """
+        if self._ffi is None:
+            with _lock:
+                if self._ffi is None:
+                    module = load_compiled(self._compiled)
+                    if module is not None:
+                        _ffi = module.ffi
+                    else:
+                        _ffi = FFI()
+                        source = (self._source() if callable(self._source)
+                                  else self._source)
+                        _ffi.cdef(source, **self._kwargs)
+                    self._source = None
+                    self._ffi = _ffi
+        return self._ffi
+
+
+class LazyLibrary(object):
+    """A proxy of the library object that opens the shared library on first
+    use.
+    """
+
+    def __init__(self, _ffi, names, compiled=None):
+        """Constructs a LazyLibrary object.
+
+        Arguments:
+            _ffi (FFI, LazyFFI): The FFI object.
+            names (list[str]): A list of the shared library names to try.
+            compiled (str, optional): The name of the compiled module that
+                is used instead of opening the shared library if available.
+        """
+        self._ffi = _ffi
+        self._names = names
+        self._compiled = compiled
+        self._lib = None
+
+    def __getattr__(self, name):
+        value = getattr(self.load(), self._get_symbol_name(name))
+        setattr(self, name, value)
+        return value
+
+    def _get_symbol_name(self, name):
+        return name
+
+    def _open(self):
+        module = load_compiled(self._compiled)
+        if module is not None:
+            return module.lib
+        return dlopen(self._ffi, self._names)
+
+    @property
+    def loaded(self):
+        """bool: True if the shared library has been opened."""
+        return self._lib is not None
+
+    def load(self):
+        """Opens the shared library if it has not been opened yet.
+
+        Returns:
+            Lib: The library object.
+        """
+        if self._lib is None:
+            with _lock:
+                if self._lib is None:
+                    self._lib = self._open()
+        return self._lib
+
+
+class lazy_class_attribute(object):
+    """A decorator that turns a function into a class attribute computed on
+    first access.
+    """
+
+    def __init__(self, func):
+        self._func = func
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    def __get__(self, instance, owner):
+        with _lock:
+            value = owner.__dict__.get(self._name, self)
+            if value is self:
+                value = self._func()
+                setattr(owner, self._name, value)
+        return value
+
+
+ffi = LazyFFI(_API, compiled='_ffi_api_cffi')
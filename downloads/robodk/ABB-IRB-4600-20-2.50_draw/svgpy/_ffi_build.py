@@ -0,0 +1,197 @@
+# Copyright (C) 2018 Tetsuya Miura <miute.dev@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Builds the native bindings in the cffi out-of-line API mode.
+
+The compiled modules are generated from the same C declarations as the ABI
+mode bindings, and are placed next to them in the svgpy package. The
+bindings fall back to the ABI mode if a module cannot be built or imported.
+
+Usage:
+    python -m svgpy._ffi_build [-h] [-v] [target ...]
+"""
+
+import argparse
+import importlib
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from cffi import FFI
+
+_TARGETS = {
+    '_ffi_api_cffi': (
+        ['freetype2', 'harfbuzz'],
+        ['freetype', 'harfbuzz'],
+        r"""
+#include <ft2build.h>
+#include FT_FREETYPE_H
+#include FT_MODULE_H
+#include FT_OUTLINE_H
+#include FT_SFNT_NAMES_H
+#include FT_SYNTHESIS_H
+#include FT_TRUETYPE_IDS_H
+#include <hb.h>
+#include <hb-ft.h>
+#include <hb-ot.h>
+"""),
+    '_fontconfig_cffi': (
+        ['fontconfig'],
+        ['fontconfig'],
+        r"""
+#include <fontconfig/fontconfig.h>
+"""),
+    '_icu_cffi': (
+        ['icu-uc'],
+        ['icuuc'],
+        r"""
+#include <uchar.h>
+#include <unicode/ubidi.h>
+#include <unicode/ubrk.h>
+#include <unicode/uloc.h>
+#include <unicode/ustring.h>
+#include <unicode/utypes.h>
+#include <unicode/uversion.h>
+"""),
+}
+
+# the private structures of fontconfig (src/fcint.h) are opaque in the
+# public headers
+_RE_PRIVATE_STRUCT = re.compile(
+    r'^(typedef )?struct \w+ \{[^}]*\}[^;]*;\s*// src/\w+\.h\n', re.M)
+
+
+def _get_source(target):
+    if target == '_ffi_api_cffi':
+        from ._ffi_api import _API
+        return _API
+    elif target == '_fontconfig_cffi':
+        from .fontconfig import _API
+        return _RE_PRIVATE_STRUCT.sub('', _API)
+    # the ICU headers rename the unversioned symbols
+    from .icu import _API
+    return _API.replace('${modifier}', '')
+
+
+def _pkg_config(packages, libraries):
+    flags = {'include_dirs': [],
+             'library_dirs': [],
+             'libraries': []}
+    for package, library in zip(packages, libraries):
+        try:
+            result = subprocess.run(
+                ['pkg-config', '--cflags', '--libs', package],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                universal_newlines=True)
+        except FileNotFoundError:
+            result = None
+        if result is None or result.returncode != 0:
+            flags['libraries'].append(library)
+            continue
+        for arg in result.stdout.split():
+            if arg.startswith('-I'):
+                key, value = 'include_dirs', arg[2:]
+            elif arg.startswith('-L'):
+                key, value = 'library_dirs', arg[2:]
+            elif arg.startswith('-l'):
+                key, value = 'libraries', arg[2:]
+            else:
+                continue
+            if value not in flags[key]:
+                flags[key].append(value)
+    return flags
+
+
+def _verify(target):
+    module = importlib.import_module('.' + target, __package__)
+    _ffi = module.ffi
+    _, structs, unions = _ffi.list_types()
+    # the struct layouts are checked against the C compiler on first use
+    ctypes = (['struct ' + name for name in structs]
+              + ['union ' + name for name in unions])
+    for ctype in ctypes:
+        try:
+            _ffi.sizeof(ctype)
+        except _ffi.error as exp:
+            if not str(exp).startswith("don't know the size"):
+                raise  # not an opaque type
+
+
+def build(target, verbose=False):
+    """Builds the compiled module of the native binding.
+
+    Arguments:
+        target (str): The name of the compiled module.
+        verbose (bool, optional): If True, shows the compiler output.
+    Returns:
+        str: The path of the compiled module.
+    """
+    if target not in _TARGETS:
+        raise ValueError('Unknown target: ' + repr(target))
+    packages, libraries, header = _TARGETS[target]
+    ffibuilder = FFI()
+    ffibuilder.cdef(_get_source(target))
+    ffibuilder.set_source(__package__ + '.' + target,
+                          header,
+                          **_pkg_config(packages, libraries))
+    tmpdir = tempfile.mkdtemp(prefix='svgpy-ffi-')
+    try:
+        built = ffibuilder.compile(tmpdir=tmpdir, verbose=verbose)
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            os.path.basename(built))
+        shutil.copyfile(built, path)
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+    try:
+        _verify(target)
+    except Exception:
+        os.remove(path)
+        raise
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m svgpy._ffi_build',
+        description='Builds the native bindings in the cffi out-of-line'
+                    ' API mode.')
+    parser.add_argument(
+        'targets', nargs='*', metavar='target',
+        help='modules to build (default: {})'.format(
+            ' '.join(sorted(_TARGETS))))
+    parser.add_argument(
+        '-v', '--verbose', action='store_true',
+        help='show the compiler output')
+    args = parser.parse_args(argv)
+
+    failed = 0
+    for target in args.targets if len(args.targets) > 0 else sorted(_TARGETS):
+        try:
+            path = build(target, args.verbose)
+        except Exception as exp:
+            failed += 1
+            print('{}: skipped (the ABI mode is used): {}'.format(
+                target, str(exp).strip().splitlines()[-1:]))
+            continue
+        print('{}: {}'.format(target, path))
+    return 1 if failed > 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
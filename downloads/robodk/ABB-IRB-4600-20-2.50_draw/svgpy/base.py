@@ -13,7 +13,10 @@
 # limitations under the License.
 
 
+import re
 from abc import abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
 
 from .core import SVGLength
 from .css.screen import Screen
@@ -22,11 +25,59 @@ from .formatter import format_coordinate_pair_sequence, \
     to_coordinate_pair_sequence
 from .geometry.matrix import DOMMatrix
 from .geometry.rect import DOMRect
-from .path import PathParser
+from .path import PathDataArray, PathParser
 from .transform import SVGTransformList
 from .utils import QualifiedName
 
 
+@lru_cache(maxsize=1024)
+def _get_transform_matrix(transform):
+    """Returns the matrix of the 'transform' attribute value.
+    The returned matrix is shared and must not be modified.
+
+    Arguments:
+        transform (str, None): The value of the 'transform' attribute.
+    Returns:
+        DOMMatrix: The matrix or None.
+    """
+    if transform is None or transform == 'none':
+        return None
+    transform_list = SVGTransformList.parse(transform)
+    return transform_list.matrix
+
+
+@lru_cache(maxsize=1024)
+def _get_cumulative_transform_matrix(transforms):
+    """Returns the product of the matrices of the 'transform' attribute
+    values, from the outermost element to the innermost element.
+    The returned matrix is shared and must not be modified.
+
+    Arguments:
+        transforms (tuple[str, ...]): The values of the 'transform' attribute.
+    Returns:
+        DOMMatrix: The matrix or None.
+    """
+    if len(transforms) == 0:
+        return None
+    parent_matrix = _get_cumulative_transform_matrix(transforms[:-1])
+    matrix = _get_transform_matrix(transforms[-1])
+    if parent_matrix is None:
+        return matrix
+    elif matrix is None:
+        return parent_matrix
+    return parent_matrix * matrix
+
+
+_PATH_DATA_ARRAY_CACHE_SIZE = 256
+
+# the lengths that are resolved against the viewport or the font of the
+# element
+_RE_CONTEXT_DEPENDENT_LENGTH = re.compile(
+    r'[0-9.](?:%|em|ex|cap|ch|ic|rem|vw|vh|vmin|vmax)', re.IGNORECASE)
+
+_path_data_arrays = OrderedDict()
+
+
 class HTMLOrSVGElement(Element):
     """Represents the [HTML] HTMLOrSVGElement."""
 
@@ -398,55 +449,79 @@ class SVGGraphicsElement(SVGElement):
             vtm = root.get_viewport_transformation_matrix(recursive=False)
             ctm *= vtm
 
-        transform_list = SVGTransformList()
+        transforms = list()
         element = self
         while element is not None:
             if element.istransformable():
-                transform = element.transform
-                if transform is not None:
-                    transform_list[0:0] = transform
+                transform = element.get('transform')
+                if transform is not None and transform != 'none':
+                    transforms.append(transform)
             if element.local_name in ('svg', 'symbol'):
                 break
             element = element.getparent()
-        if len(transform_list) > 0:
-            matrix = transform_list.matrix
+        transforms.reverse()
+        matrix = _get_cumulative_transform_matrix(tuple(transforms))
+        if matrix is not None:
             ctm *= matrix
         return ctm
 
-    def get_bbox(self, options=None, _depth=0):
+    def get_bbox(self, options=None, _matrix=None):
         """Returns the bounding box of the current element.
 
         Arguments:
             options (SVGBoundingBoxOptions, optional): Reserved.
-            _depth (int, optional): For internal use only.
+            _matrix (DOMMatrix, optional): For internal use only.
         Returns:
             DOMRect: The bounding box of the current element.
         """
         # TODO: implement SVGBoundingBoxOptions option.
-        _depth += 1
         bbox = DOMRect()
         if self.local_name in ('defs', 'symbol'):
             return bbox  # not rendered directly
         if self.iscontainer():
-            for child in iter(self):
-                if isinstance(child, SVGGraphicsElement):
-                    display = child.get('display', 'inline')
-                    if display == 'none':
-                        continue
-                    bbox |= child.get_bbox(options, _depth)
-            if _depth > 1:
-                transform_list = self.transform  # type: SVGTransformList
-                if transform_list is not None:
-                    matrix = transform_list.matrix
-                    bbox.transform_self(matrix)
+            self._unite_children_bbox(bbox, options, _matrix)
         else:
-            settings = SVGPathDataSettings()
-            settings.normalize = True
-            path_data = self.get_transformed_path_data(settings)
+            path_data = self.get_transformed_path_data(as_array=True)
             if len(path_data) > 0:
-                bbox = PathParser.get_bbox(path_data, options)
+                if _matrix is not None and not _matrix.isidentity:
+                    path_data = path_data.transform(_matrix)
+                bbox = path_data.get_bbox()
         return bbox
 
+    def _unite_children_bbox(self, bbox, options, _matrix):
+        """Unites the bounding boxes of the children into bbox in place.
+        The descendant containers and shapes are walked without creating a
+        DOMRect for each of them.
+        """
+        if _matrix is None:
+            matrix = DOMMatrix()
+        else:
+            matrix = _matrix
+            transform_matrix = _get_transform_matrix(self.get('transform'))
+            if transform_matrix is not None:
+                matrix = matrix * transform_matrix
+        for child in iter(self):
+            if not isinstance(child, SVGGraphicsElement):
+                continue
+            display = child.get('display', 'inline')
+            if display == 'none':
+                continue
+            elif type(child).get_bbox is not SVGGraphicsElement.get_bbox:
+                bbox |= child.get_bbox(options, matrix)
+            elif child.local_name in ('defs', 'symbol'):
+                continue  # not rendered directly
+            elif child.iscontainer():
+                child._unite_children_bbox(bbox, options, matrix)
+            else:
+                path_data = child.get_transformed_path_data(as_array=True)
+                if len(path_data) == 0:
+                    continue
+                if not matrix.isidentity:
+                    path_data = path_data.transform(matrix)
+                x1, y1, x2, y2 = path_data.get_extrema()
+                if x1 is not None:
+                    bbox.unite_self(x1, y1, x2 - x1, y2 - y1)
+
     def get_ctm(self):
         """Returns the current transformation matrix (CTM). The matrix that
         transforms the current element's coordinate system to its SVG
@@ -489,20 +564,40 @@ class SVGGraphicsElement(SVGElement):
         ctm = self._get_ctm(SVGElement.FARTHEST_VIEWPORT)
         return ctm
 
-    def get_transformed_path_data(self, settings=None):
+    def get_transformed_path_data(self, settings=None, as_array=False):
+        """Returns the path data that is transformed by the 'transform'
+        property of the current element.
+
+        Arguments:
+            settings (SVGPathDataSettings, optional): If normalize is set to
+                True then the returned list of path segments is converted to
+                the base set of absolute commands ('M', 'L', 'C' and 'Z').
+            as_array (bool, optional): If True, the path data is normalized
+                and returned as a PathDataArray object, and transformed with
+                a single matrix multiplication.
+        Returns:
+            list[SVGPathSegment], PathDataArray: The path data.
+        """
+        if as_array:
+            settings = SVGPathDataSettings()
+            settings.normalize = True
         path_data = self.get_path_data(settings)
+        if as_array:
+            path_data = PathDataArray.from_path_data(path_data)
         if len(path_data) == 0:
             return path_data
+        matrix = _get_transform_matrix(self.get('transform'))
         if self.local_name == 'use':
-            transform_list = self.instance_root.transform
-            if transform_list is not None:
-                matrix = transform_list.matrix
-                path_data = PathParser.transform(path_data, matrix)
-        transform_list = self.transform  # type: SVGTransformList
-        if transform_list is not None:
-            matrix = transform_list.matrix
-            path_data = PathParser.transform(path_data, matrix)
-        return path_data
+            root_matrix = _get_transform_matrix(
+                self.instance_root.get('transform'))
+            if root_matrix is not None:
+                matrix = root_matrix if matrix is None \
+                    else matrix * root_matrix
+        if matrix is None:
+            return path_data
+        elif as_array:
+            return path_data.transform(matrix)
+        return PathParser.transform(path_data, matrix)
 
     def get_viewport_transformation_matrix(self, recursive=True):
         """Returns the transformation matrix of an SVG viewport.
@@ -622,9 +717,53 @@ class SVGGeometryElement(SVGGraphicsElement):
         """
         raise NotImplementedError  # implement in a subclass
 
+    def _get_path_data_array(self):
+        """Returns the normalized path data with its arc-length table.
+        The result is cached on the tag and the attributes of the current
+        element, so that it is rebuilt when the 'd' attribute or any
+        geometry attribute is changed. The path data that has percentage,
+        font-relative or viewport-relative lengths is not cached because it
+        depends on the context of the current element.
+
+        Returns:
+            PathDataArray: The normalized path data.
+        """
+        items = tuple(self.attrib.items())
+        if any(_RE_CONTEXT_DEPENDENT_LENGTH.search(value) is not None
+               for _, value in items):
+            return PathParser.to_array(self.get_path_data())
+        key = self.tag, items
+        path_data = _path_data_arrays.get(key)
+        if path_data is not None:
+            _path_data_arrays.move_to_end(key)
+            return path_data
+        path_data = PathParser.to_array(self.get_path_data())
+        _path_data_arrays[key] = path_data
+        if len(_path_data_arrays) > _PATH_DATA_ARRAY_CACHE_SIZE:
+            _path_data_arrays.popitem(last=False)
+        return path_data
+
     def get_point_at_length(self, distance):
-        # TODO: implement SVGGeometryElement.getPointAtLength().
-        pass
+        """Returns the point at the given distance along the path.
+
+        Arguments:
+            distance (float): The distance along the path. The distance is
+                clamped to the range [0, total length].
+        Returns:
+            tuple[float, float]: The point at the distance. Returns None if
+                the path is empty.
+        """
+        return self._get_path_data_array().get_point_at_length(distance)
+
+    def get_points_at_lengths(self, distances):
+        """Returns the points at the given distances along the path.
+
+        Arguments:
+            distances (array_like): The distances along the path.
+        Returns:
+            numpy.ndarray: The points with shape (N, 2).
+        """
+        return self._get_path_data_array().get_points_at_lengths(distances)
 
     def get_total_length(self):
         """Returns the total length of the path.
@@ -632,10 +771,7 @@ class SVGGeometryElement(SVGGraphicsElement):
         Returns:
             float: The total length of the path.
         """
-        path_data = self.get_path_data()
-        if len(path_data) == 0:
-            return 0
-        return PathParser.get_total_length(path_data)
+        return self._get_path_data_array().get_total_length()
 
 
 class SVGPathData(Element):
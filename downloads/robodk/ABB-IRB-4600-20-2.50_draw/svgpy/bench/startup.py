@@ -0,0 +1,275 @@
+# Copyright (C) 2018 Tetsuya Miura <miute.dev@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Measures the import time of the svgpy modules.
+
+Each target module is imported in a fresh interpreter with '-X importtime',
+and the self and cumulative import times of every module are reported.
+The deferred native bindings (the C declaration parsing and the shared
+library loading) can be measured as well.
+
+Usage:
+    python -m svgpy.bench.startup [-h] [-n REPEAT] [--native] [--all]
+                                  [--top N] [--save FILE]
+                                  [--baseline FILE] [--threshold PERCENT]
+                                  [--min-time MSEC]
+                                  [module ...]
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+
+_DEFAULT_MODULES = ['svgpy.path', 'svgpy.base', 'svgpy.element']
+
+_NATIVE_BINDINGS = [
+    ('svgpy._ffi_api', 'ffi', None),
+    ('svgpy.fontconfig', 'ffi', 'lib'),
+    ('svgpy.freetype', None, 'lib'),
+    ('svgpy.harfbuzz', None, 'lib'),
+    ('svgpy.icu', None, 'lib'),
+]
+
+_NATIVE_SCRIPT = r'''
+import importlib, json, sys, time
+results = dict()
+for name, ffi_name, lib_name in json.loads(sys.argv[1]):
+    try:
+        module = importlib.import_module(name)
+        for kind, attr in (('cdef', ffi_name), ('dlopen', lib_name)):
+            if attr is None:
+                continue
+            t0 = time.perf_counter()
+            getattr(module, attr).load()
+            elapsed = int((time.perf_counter() - t0) * 1e6)
+            results['{} ({})'.format(name, kind)] = elapsed
+    except Exception as exp:
+        results['{} (error)'.format(name)] = repr(exp)
+print(json.dumps(results))
+'''
+
+_RE_IMPORT_TIME = re.compile(
+    r'^import time:\s*(?P<self>\d+)\s*\|\s*(?P<cumulative>\d+)\s*\|'
+    r'(?P<indent>\s*)(?P<name>\S+)\s*$')
+
+
+def _is_svgpy_module(name):
+    return name == 'svgpy' or name.startswith('svgpy.')
+
+
+def _get_environment():
+    env = os.environ.copy()
+    root = os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__))))
+    python_path = env.get('PYTHONPATH')
+    env['PYTHONPATH'] = (root if python_path is None
+                         else os.pathsep.join([root, python_path]))
+    return env
+
+
+def measure_import_time(module):
+    """Imports the module in a fresh interpreter and returns the import time
+    of every module that was loaded.
+
+    Arguments:
+        module (str): The name of the module to import.
+    Returns:
+        dict[str, tuple[int, int]]: The self and cumulative import times in
+            microseconds, keyed by the module name.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=_get_environment(),
+        universal_newlines=True)
+    if result.returncode != 0:
+        raise RuntimeError('Cannot import {}: {}'.format(
+            module, result.stderr.strip().splitlines()[-1:]))
+    timings = dict()
+    for line in result.stderr.splitlines():
+        matched = _RE_IMPORT_TIME.match(line)
+        if matched is None:
+            continue
+        timings[matched.group('name')] = (int(matched.group('self')),
+                                          int(matched.group('cumulative')))
+    return timings
+
+
+def measure_native_bindings():
+    """Measures the deferred C declaration parsing and the shared library
+    loading of the native bindings in a fresh interpreter.
+
+    Returns:
+        dict[str, int | str]: The elapsed times in microseconds, or the error
+            messages of the bindings that cannot be loaded.
+    """
+    result = subprocess.run(
+        [sys.executable, '-c', _NATIVE_SCRIPT, json.dumps(_NATIVE_BINDINGS)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=_get_environment(),
+        universal_newlines=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip())
+    return json.loads(result.stdout)
+
+
+def merge_timings(runs):
+    """Takes the minimum of the timings over the repeated runs.
+
+    Arguments:
+        runs (list[dict[str, tuple[int, int]]]): The timings of each run.
+    Returns:
+        dict[str, tuple[int, int]]: The merged timings.
+    """
+    merged = dict()
+    for timings in runs:
+        for name, (self_time, cumulative) in timings.items():
+            if name in merged:
+                self_time = min(self_time, merged[name][0])
+                cumulative = min(cumulative, merged[name][1])
+            merged[name] = self_time, cumulative
+    return merged
+
+
+def find_regressions(timings, baseline, threshold, min_time):
+    """Compares the timings with the baseline.
+
+    Arguments:
+        timings (dict[str, tuple[int, int]]): The current timings.
+        baseline (dict[str, tuple[int, int]]): The baseline timings.
+        threshold (float): The allowed increase in percent.
+        min_time (int): The cumulative time in microseconds below which the
+            modules are ignored.
+    Returns:
+        list[tuple[str, int, int]]: The module name, the baseline and the
+            current cumulative times of the regressed modules.
+    """
+    regressions = list()
+    for name, (_, cumulative) in sorted(timings.items()):
+        if name not in baseline or cumulative < min_time:
+            continue
+        base = baseline[name][1]
+        if cumulative > base * (1 + threshold / 100):
+            regressions.append((name, base, cumulative))
+    return regressions
+
+
+def print_timings(module, timings, top=None, show_all=False):
+    print('import {}'.format(module))
+    print('{:>10} {:>10}  {}'.format('self[ms]', 'cumul[ms]', 'module'))
+    items = [(name, values) for name, values in timings.items()
+             if show_all or _is_svgpy_module(name)]
+    items.sort(key=lambda x: x[1][1], reverse=True)
+    if top is not None:
+        items = items[:top]
+    for name, (self_time, cumulative) in items:
+        print('{:10.2f} {:10.2f}  {}'.format(self_time / 1000,
+                                             cumulative / 1000,
+                                             name))
+    print()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m svgpy.bench.startup',
+        description='Measures the import time of the svgpy modules.')
+    parser.add_argument(
+        'modules', nargs='*', metavar='module',
+        help='modules to import (default: {})'.format(
+            ' '.join(_DEFAULT_MODULES)))
+    parser.add_argument(
+        '-n', '--repeat', type=int, default=3,
+        help='number of runs; the minimum is reported (default: 3)')
+    parser.add_argument(
+        '--native', action='store_true',
+        help='also measure the deferred loading of the native bindings')
+    parser.add_argument(
+        '--all', action='store_true', dest='show_all',
+        help='report the non-svgpy modules as well')
+    parser.add_argument(
+        '--top', type=int,
+        help='report only the N slowest modules')
+    parser.add_argument(
+        '--save', metavar='FILE',
+        help='save the timings as a JSON baseline')
+    parser.add_argument(
+        '--baseline', metavar='FILE',
+        help='compare the timings with a JSON baseline')
+    parser.add_argument(
+        '--threshold', type=float, default=20.0, metavar='PERCENT',
+        help='allowed increase over the baseline (default: 20)')
+    parser.add_argument(
+        '--min-time', type=float, default=1.0, metavar='MSEC',
+        help='ignore the modules faster than this (default: 1)')
+    args = parser.parse_args(argv)
+
+    modules = args.modules if len(args.modules) > 0 else _DEFAULT_MODULES
+    report = dict()
+    for module in modules:
+        runs = [measure_import_time(module)
+                for _ in range(max(1, args.repeat))]
+        timings = merge_timings(runs)
+        report[module] = timings
+        print_timings(module, timings, args.top, args.show_all)
+
+    if args.native:
+        print('native bindings')
+        print('{:>10}  {}'.format('time[ms]', 'binding'))
+        for name, value in measure_native_bindings().items():
+            if isinstance(value, int):
+                print('{:10.2f}  {}'.format(value / 1000, name))
+            else:
+                print('{:>10}  {}: {}'.format('-', name, value))
+        print()
+
+    if args.save is not None:
+        with open(args.save, 'w', encoding='utf-8') as fp:
+            json.dump(report, fp, indent=2, sort_keys=True)
+
+    if args.baseline is not None:
+        with open(args.baseline, encoding='utf-8') as fp:
+            baseline = json.load(fp)
+        failed = False
+        for module, timings in report.items():
+            if module not in baseline:
+                continue
+            if not args.show_all:
+                timings = dict((name, values)
+                               for name, values in timings.items()
+                               if _is_svgpy_module(name))
+            regressions = find_regressions(timings,
+                                           baseline[module],
+                                           args.threshold,
+                                           args.min_time * 1000)
+            for name, base, cumulative in regressions:
+                failed = True
+                print('REGRESSION: import {}: {}: {:.2f} ms -> {:.2f} ms'
+                      ' (+{:.0f}%)'.format(module,
+                                           name,
+                                           base / 1000,
+                                           cumulative / 1000,
+                                           (cumulative / base - 1) * 100))
+        if failed:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
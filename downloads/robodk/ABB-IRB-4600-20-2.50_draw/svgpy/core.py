@@ -13,13 +13,19 @@
 # limitations under the License.
 
 
+import atexit
 import copy
 import html
 import math
+import mmap
 import re
 import shlex
+import threading
 import unicodedata
+import weakref
+from collections import OrderedDict
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 
 import numpy as np
 
@@ -628,9 +634,14 @@ class Font(object):
         """
         self._context = context
         self._style = context.get_computed_style()
-        self._face = FontManager.get_face(self._style,
-                                          context.owner_document,
-                                          context.text)
+        self._filename, self._face_index = FontManager._find_face(
+            self._style, context.text)
+        self._face = FontManager.get_sized_face(
+            self._filename,
+            self._face_index,
+            0,
+            FontManager._get_point_size(self._style),
+            *FontManager._get_resolution(context.owner_document))
 
     def __eq__(self, other):
         if not isinstance(other, Font):
@@ -737,12 +748,40 @@ class Font(object):
 
     def set_point_size(self, width, height, hori_resolution=0,
                        vert_resolution=0):
-        self._face.request_size(FreeType.FT_SIZE_REQUEST_TYPE_NOMINAL,
-                                width, height,
-                                hori_resolution, vert_resolution)
+        # the pooled faces are shared, so that the face of the requested
+        # size is taken from the pool instead of resizing the current face.
+        self._face = FontManager.get_sized_face(self._filename,
+                                                self._face_index,
+                                                width, height,
+                                                hori_resolution,
+                                                vert_resolution)
 
 
 class FontManager(object):
+    MAX_FACES = 32
+    """int: The maximum number of the sized font faces in the face pool of
+    each thread.
+    """
+
+    _faces = weakref.WeakKeyDictionary()
+    """WeakKeyDictionary[threading.Thread, OrderedDict[tuple, FTFace]]: The
+    face pools of the threads, keyed by (file name, face index, width,
+    height, horizontal resolution, vertical resolution).
+    """
+
+    _memory_bases = dict()
+    """dict[str, mmap.mmap]: The memory-mapped font files."""
+
+    _lock = threading.RLock()
+
+    _catalogue = None
+    """dict[str, numpy.ndarray]: The snapshot of the installed fonts."""
+
+    _catalogue_family_map = None
+    """dict[str, numpy.ndarray]: The row indices of the snapshot for each
+    normalized family name.
+    """
+
     @staticmethod
     def __debug_print(matched):
         # for style in matched:
@@ -752,18 +791,159 @@ class FontManager(object):
 
     @staticmethod
     def _find_face(style, text=None):
+        candidates = FontManager._resolve_faces(
+            tuple(style['font-family']),
+            style['font-stretch'],
+            style['font-style'],
+            style['font-weight'],
+            style['font-size'])
+
+        # check the glyph
+        for filename, face_index in iter(candidates):
+            face = FontManager.get_sized_face(filename, face_index)
+            glyph_not_found = False
+            if text is not None:
+                for ch in iter(text):
+                    if ch in ['\t', '\r', '\n', '\x20']:
+                        continue
+                    index = face.get_char_index(ch)
+                    if index == 0:
+                        glyph_not_found = True
+                        break
+                    # for encoding in [FreeType.FT_ENCODING_MS_SYMBOL,
+                    #                  FreeType.FT_ENCODING_ADOBE_CUSTOM,
+                    #                  FreeType.FT_ENCODING_UNICODE]:
+                    #     index = face.get_char_index(ch)
+                    #     if index == 0:
+                    #         face.select_charmap(encoding)
+                    #     else:
+                    #         if face.charmap.encoding \
+                    #                 != FreeType.FT_ENCODING_UNICODE:
+                    #             face.select_charmap(
+                    #                 FreeType.FT_ENCODING_UNICODE)
+                    #         break
+                    # else:
+                    #     glyph_not_found = True
+                    # if glyph_not_found:
+                    #     break
+            if not glyph_not_found:
+                return filename, face_index
+
+        # fallback font
+        filename = FontManager._get_fallback_file()
+        return filename, 0
+
+    @staticmethod
+    def _get_catalogue():
+        """Returns the snapshot of the installed fonts.
+        The fontconfig font list is read only once per process.
+
+        Returns:
+            tuple[dict[str, numpy.ndarray], dict[str, numpy.ndarray]]: The
+                columns of the snapshot, and the row indices for each
+                normalized family name.
+        """
+        if FontManager._catalogue is not None:
+            return FontManager._catalogue, FontManager._catalogue_family_map
+        fc_elements = [FontConfig.FC_FAMILY, FontConfig.FC_FILE,
+                       FontConfig.FC_FONT_FORMAT, FontConfig.FC_INDEX,
+                       FontConfig.FC_PIXEL_SIZE, FontConfig.FC_SLANT,
+                       FontConfig.FC_WEIGHT, FontConfig.FC_WIDTH]
+        fc_format = '\t'.join(['%{{{}}}'.format(x) for x in fc_elements])
+        rows = list()
+        family_map = dict()
+        for line in iter(FontConfig.list(None, fc_elements, fc_format)):
+            items = line.split('\t')
+            try:
+                row = (items[0],
+                       items[1],
+                       items[2],
+                       int(items[3]),
+                       float(items[4]) if len(items[4]) > 0 else 0,
+                       int(items[5]),
+                       FontConfig.weight_to_open_type(int(items[6])),
+                       int(items[7]))
+            except (IndexError, ValueError):
+                continue  # e.g. variable fonts
+            for name in iter(items[0].split(',')):
+                family_map.setdefault(
+                    FontManager._normalize_family_name(name),
+                    list()).append(len(rows))
+            rows.append(row)
+        columns = list(zip(*rows)) if len(rows) > 0 else [()] * 8
+        catalogue = dict()
+        for key, values, dtype in zip(fc_elements, columns,
+                                      [object, object, object, int,
+                                       float, int, int, int]):
+            catalogue[key] = np.array(values, dtype=dtype)
+        FontManager._catalogue = catalogue
+        FontManager._catalogue_family_map = dict(
+            (name, np.array(indices)) for name, indices in family_map.items())
+        return FontManager._catalogue, FontManager._catalogue_family_map
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _get_fallback_file():
+        return FontConfig.match(Font.default_font_family, '%{file}')[0]
+
+    @staticmethod
+    def _get_point_size(style):
+        pixel_size = style['font-size']
+        return int(SVGLength(pixel_size).value(SVGLength.TYPE_PT) * 64)
+
+    @staticmethod
+    def _get_resolution(owner_document):
+        if (owner_document is not None
+                and owner_document.default_view is not None):
+            screen = owner_document.default_view.screen
+            return screen.horizontal_resolution, screen.vertical_resolution
+        return (Screen.DEFAULT_HORIZONTAL_RESOLUTION,
+                Screen.DEFAULT_VERTICAL_RESOLUTION)
+
+    @staticmethod
+    def _new_face(filename, face_index):
+        memory_base = FontManager._memory_bases.get(filename)
+        if memory_base is None:
+            try:
+                with open(filename, 'rb') as fp:
+                    memory_base = mmap.mmap(fp.fileno(), 0,
+                                            access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                return FTFace.new_face(filename, face_index)
+            FontManager._memory_bases[filename] = memory_base
+        return FTFace.new_memory_face(memory_base, face_index=face_index)
+
+    @staticmethod
+    def _normalize_family_name(name):
+        # fontconfig compares the family names ignoring blanks and case
+        return name.replace(' ', '').lower()
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _resolve_faces(font_family, font_stretch, font_style, font_weight,
+                       font_size):
+        """Returns the font files that match the font properties, in order
+        of preference.
+        The result is cached per process.
+
+        Arguments:
+            font_family (tuple[str, ...]): The 'font-family' property.
+            font_stretch (str): The 'font-stretch' property.
+            font_style (str): The 'font-style' property.
+            font_weight (int): The 'font-weight' property.
+            font_size (float): The 'font-size' property.
+        Returns:
+            tuple[tuple[str, int], ...]: The file names and the face indices.
+        """
         font_family_names = list()
-        for font_family_name in iter(style['font-family']):
+        for font_family_name in iter(font_family):
             name = FontManager.match(font_family_name)
             if name is not None and name not in font_family_names:
                 font_family_names.append(name)
-        font_stretch = style['font-stretch']
         fc_width = FontConfig.FC_WIDTH_MAP.get(font_stretch)
-        font_style = style['font-style']
-        font_weight = style['font-weight']
-        font_size = style['font-size']
         # font_size_adjust = style['font-size-adjust']
 
+        candidates = list()
         for font_family_name in iter(font_family_names):
             # narrow down by font family name
             matched = FontManager.list(font_family_name)
@@ -862,96 +1042,108 @@ class FontManager(object):
                                  key=lambda x: x[FontConfig.FC_FILE])
             FontManager.__debug_print(matched)
 
-            # check the glyph
-            for fc in iter(matched):
-                face = FTFace.new_face(fc[FontConfig.FC_FILE],
-                                       fc[FontConfig.FC_INDEX])
-                glyph_not_found = False
-                if text is not None:
-                    for ch in iter(text):
-                        if ch in ['\t', '\r', '\n', '\x20']:
-                            continue
-                        index = face.get_char_index(ch)
-                        if index == 0:
-                            glyph_not_found = True
-                            break
-                        # for encoding in [FreeType.FT_ENCODING_MS_SYMBOL,
-                        #                  FreeType.FT_ENCODING_ADOBE_CUSTOM,
-                        #                  FreeType.FT_ENCODING_UNICODE]:
-                        #     index = face.get_char_index(ch)
-                        #     if index == 0:
-                        #         face.select_charmap(encoding)
-                        #     else:
-                        #         if face.charmap.encoding \
-                        #                 != FreeType.FT_ENCODING_UNICODE:
-                        #             face.select_charmap(
-                        #                 FreeType.FT_ENCODING_UNICODE)
-                        #         break
-                        # else:
-                        #     glyph_not_found = True
-                        # if glyph_not_found:
-                        #     break
-                if not glyph_not_found:
-                    return face
-
-        # fallback font
-        filename = FontConfig.match(Font.default_font_family, '%{file}')[0]
-        face = FTFace.new_face(filename)
-        return face
+            candidates.extend(
+                (fc[FontConfig.FC_FILE], fc[FontConfig.FC_INDEX])
+                for fc in iter(matched))
+        return tuple(candidates)
 
     @staticmethod
     def get_face(style, owner_document, text=None):
-        face = FontManager._find_face(style, text)
-        face.select_charmap(FreeType.FT_ENCODING_UNICODE)
-        pixel_size = style['font-size']
-        point_size = int(SVGLength(pixel_size).value(SVGLength.TYPE_PT) * 64)
-        if (owner_document is not None
-                and owner_document.default_view is not None):
-            screen = owner_document.default_view.screen
-            horizontal_resolution = screen.horizontal_resolution
-            vertical_resolution = screen.vertical_resolution
-        else:
-            horizontal_resolution = Screen.DEFAULT_HORIZONTAL_RESOLUTION
-            vertical_resolution = Screen.DEFAULT_VERTICAL_RESOLUTION
-        face.request_size(FreeType.FT_SIZE_REQUEST_TYPE_NOMINAL,
-                          0,
-                          point_size,
-                          horizontal_resolution,
-                          vertical_resolution)
-        return face
+        filename, face_index = FontManager._find_face(style, text)
+        return FontManager.get_sized_face(
+            filename,
+            face_index,
+            0,
+            FontManager._get_point_size(style),
+            *FontManager._get_resolution(owner_document))
+
+    @staticmethod
+    def get_sized_face(filename, face_index=0, width=None, height=None,
+                       hori_resolution=0, vert_resolution=0):
+        """Returns the font face of the requested size from the face pool
+        of the calling thread.
+        The FreeType faces are not thread-safe, so that each thread has its
+        own face pool; the font file is memory-mapped once and shared by the
+        faces of all threads.
+        The least recently used face is evicted from the pool when the pool
+        is full, but it remains valid while it is referenced.
+        The returned face is shared in the thread, and must not be resized.
+
+        Arguments:
+            filename (str): The path of the font file.
+            face_index (int, optional): The index of the face in the font
+                file.
+            width (int, optional): The nominal width in 26.6 fractional
+                points.
+            height (int, optional): The nominal height in 26.6 fractional
+                points. If width and height are None, the size of the face
+                is not set.
+            hori_resolution (int, optional): The horizontal resolution in
+                dpi.
+            vert_resolution (int, optional): The vertical resolution in dpi.
+        Returns:
+            FTFace: The font face.
+        """
+        key = (filename, face_index, width, height, hori_resolution,
+               vert_resolution)
+        with FontManager._lock:
+            faces = FontManager._faces.get(threading.current_thread())
+            if faces is None:
+                faces = OrderedDict()
+                FontManager._faces[threading.current_thread()] = faces
+            face = faces.get(key)
+            if face is not None:
+                faces.move_to_end(key)
+                return face
+            face = FontManager._new_face(filename, face_index)
+            face.select_charmap(FreeType.FT_ENCODING_UNICODE)
+            if width is not None or height is not None:
+                face.request_size(FreeType.FT_SIZE_REQUEST_TYPE_NOMINAL,
+                                  width or 0,
+                                  height or 0,
+                                  hori_resolution,
+                                  vert_resolution)
+            faces[key] = face
+            if len(faces) > FontManager.MAX_FACES:
+                faces.popitem(last=False)
+            return face
 
     @staticmethod
     def list(family):
-        fc_elements = [FontConfig.FC_FAMILY, FontConfig.FC_FILE,
-                       FontConfig.FC_FONT_FORMAT, FontConfig.FC_INDEX,
-                       FontConfig.FC_PIXEL_SIZE, FontConfig.FC_SLANT,
-                       FontConfig.FC_WEIGHT, FontConfig.FC_WIDTH]
-        fc_format = '\t'.join(['%{{{}}}'.format(x) for x in fc_elements])
-        matched = FontConfig.list(family, fc_elements, fc_format)
-        style_sequence = list()
-        for line in iter(matched):
-            items = line.split('\t')
-            style = dict()
-            style[FontConfig.FC_FAMILY] = items[0]
-            style[FontConfig.FC_FILE] = items[1]
-            style[FontConfig.FC_FONT_FORMAT] = items[2]
-            style[FontConfig.FC_INDEX] = int(items[3])
-            pixel_size = float(items[4]) if len(items[4]) > 0 else 0
-            style[FontConfig.FC_PIXEL_SIZE] = pixel_size
-            style[FontConfig.FC_SLANT] = int(items[5])
-            style[FontConfig.FC_WEIGHT] = FontConfig.weight_to_open_type(
-                int(items[6]))
-            style[FontConfig.FC_WIDTH] = int(items[7])
-            style_sequence.append(style)
-        return style_sequence
+        catalogue, family_map = FontManager._get_catalogue()
+        indices = family_map.get(FontManager._normalize_family_name(family))
+        if indices is None:
+            return []
+        keys = list(catalogue.keys())
+        columns = [catalogue[key][indices].tolist() for key in keys]
+        return [dict(zip(keys, values)) for values in zip(*columns)]
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def match(family):
         matched = FontConfig.match(family, '%{family[0]}')
         if len(matched) == 0:
             return None
         return matched[0]
 
+    @staticmethod
+    def clear_cache():
+        """Clears the font catalogue snapshot, the font face resolution
+        cache and the face pool, e.g. after installing fonts.
+        """
+        FontManager._catalogue = None
+        FontManager._catalogue_family_map = None
+        with FontManager._lock:
+            FontManager._faces.clear()
+            FontManager._memory_bases.clear()
+        FontManager._get_fallback_file.cache_clear()
+        FontManager._resolve_faces.cache_clear()
+        FontManager.match.cache_clear()
+
+
+# release the pooled faces before the FreeType library is finalized
+atexit.register(FontManager.clear_cache)
+
 
 class SVGLength(object):
     TYPE_NUMBER = ''  # pixel
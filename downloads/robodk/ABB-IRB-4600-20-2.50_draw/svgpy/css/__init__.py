@@ -13,12 +13,19 @@
 # limitations under the License.
 
 
+import hashlib
+import os
 import re
+import threading
+import time
 from abc import ABC, abstractmethod
 from collections import OrderedDict
 from collections.abc import MutableMapping, MutableSequence
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
 from logging import getLogger
-from urllib.error import URLError
+from urllib.error import HTTPError, URLError
+from urllib.request import url2pathname
 
 import tinycss2
 
@@ -26,7 +33,8 @@ from .longhands import Longhand
 from .props import PropertyDescriptor, PropertySyntax, \
     css_color_keyword_set, css_property_descriptor_map, css_wide_keyword_set
 from .screen import Screen, ScreenOrientation
-from .shorthands import Shorthand, font_sub_property_list
+from .shorthands import Shorthand, create_component_list, \
+    font_sub_property_list
 from .types import CSSKeywordValue, CSSImageValue, CSSMathClamp, \
     CSSMathInvert, CSSMathMax, CSSMathMin, CSSMathNegate, CSSMathOperator, \
     CSSMathProduct, CSSMathSum, CSSMathValue, CSSNumericBaseType, \
@@ -34,11 +42,24 @@ from .types import CSSKeywordValue, CSSImageValue, CSSMathClamp, \
     CSSUnitValue, CSSUnparsedValue, CSSVariableReferenceValue, \
     StylePropertyMap, StylePropertyMapReadOnly, UnitType
 from ..exception import NoModificationAllowedError
+from ..url import URL
 from ..utils import CaseInsensitiveMapping, dict_to_style, get_content_type, \
     load, normalize_url, style_to_dict
 
+_DECLARATION_VALUE_CACHE_SIZE = 4096
+
 _RE_COLLAPSIBLE_WHITESPACE = re.compile(r'(\x20){2,}')
 
+_css_keyword_set = css_color_keyword_set | css_wide_keyword_set
+
+
+@lru_cache(maxsize=_DECLARATION_VALUE_CACHE_SIZE)
+def _serialize_declaration_value(value):
+    value = tinycss2.serialize(create_component_list(value)).strip()
+    if value.lower() in _css_keyword_set:
+        value = value.lower()
+    return value
+
 
 def normalize_text(text):
     out_text = text.strip().replace(
@@ -1427,14 +1448,12 @@ class CSSStyleDeclaration(MutableMapping):
                 priority = 'important' if node.important else ''
                 self.set_property(property_name, value, priority)
 
-    def _set_css_declaration(self, declarations, property_name,
-                             component_list, priority):
+    def _set_css_declaration(self, declarations, property_name, value,
+                             priority):
         _ = self
-        value = tinycss2.serialize(component_list).strip()
+        value = _serialize_declaration_value(value)
         if len(value) == 0:
             return False
-        if value.lower() in css_color_keyword_set | css_wide_keyword_set:
-            value = value.lower()
         if property_name in declarations:
             declarations.move_to_end(property_name)
         declarations[property_name] = value, priority
@@ -1442,9 +1461,7 @@ class CSSStyleDeclaration(MutableMapping):
 
     def _set_property_internal(self, declarations, property_name, value,
                                priority):
-        component_list = tinycss2.parse_component_value_list(
-            value,
-            skip_comments=True)
+        component_list = create_component_list(value)
         if len(component_list) == 0:
             return False, ''
         result = ''
@@ -1458,7 +1475,7 @@ class CSSStyleDeclaration(MutableMapping):
         else:
             updated = self._set_css_declaration(declarations,
                                                 property_name,
-                                                component_list,
+                                                value,
                                                 priority)
             if updated:
                 result = declarations[property_name][0]
@@ -1685,6 +1702,195 @@ class CSSStyleSheet(StyleSheet):
 
 
 class CSSParser(object):
+    MAX_CACHE_ENTRIES = 128
+
+    PREFETCH_MAX_AGE = 60
+    """float: The number of seconds that the prefetched style sheets are
+    used without revalidation.
+    """
+
+    PREFETCH_MAX_WORKERS = 8
+    """int: The maximum number of the threads to fetch the style sheets."""
+
+    _cache = OrderedDict()
+    _lock = threading.RLock()
+
+    @classmethod
+    def _get_cached(cls, key):
+        with cls._lock:
+            value = cls._cache.get(key)
+            if value is not None:
+                cls._cache.move_to_end(key)
+            return value
+
+    @classmethod
+    def _set_cached(cls, key, value):
+        with cls._lock:
+            cls._cache[key] = value
+            cls._cache.move_to_end(key)
+            while len(cls._cache) > cls.MAX_CACHE_ENTRIES:
+                cls._cache.popitem(last=False)
+
+    @classmethod
+    def _pop_cached(cls, key):
+        with cls._lock:
+            return cls._cache.pop(key, None)
+
+    @classmethod
+    def _load_rules(cls, url, encoding=None):
+        # the parsed rules are cached by the URL with its validator (mtime,
+        # ETag or Last-Modified), and by the SHA-1 digest of the content
+        location = URL(url)
+        prefetched = cls._pop_cached(('prefetched', location.href, encoding))
+        if (prefetched is not None
+                and time.monotonic() - prefetched[0] < cls.PREFETCH_MAX_AGE):
+            return prefetched[1]
+        url_key = ('url', location.href, encoding)
+        entry = cls._get_cached(url_key)
+        validator = None
+        request_headers = None
+        if location.protocol == 'file:':
+            try:
+                stat = os.stat(url2pathname(location.pathname))
+                validator = stat.st_mtime_ns, stat.st_size
+            except OSError:
+                pass
+            if entry is not None and entry[0] == validator:
+                return entry[1]
+        elif entry is not None and location.protocol in ('http:', 'https:'):
+            etag, last_modified = entry[0]
+            request_headers = dict()
+            if etag is not None:
+                request_headers['If-None-Match'] = etag
+            if last_modified is not None:
+                request_headers['If-Modified-Since'] = last_modified
+
+        try:
+            data, headers = load(location, headers=request_headers)
+        except HTTPError as exp:
+            if exp.code == 304 and entry is not None:
+                return entry[1]
+            raise
+        if location.protocol in ('http:', 'https:'):
+            etag = headers.get('ETag')
+            last_modified = headers.get('Last-Modified')
+            if etag is not None or last_modified is not None:
+                validator = etag, last_modified
+
+        protocol_encoding = encoding
+        if protocol_encoding is None:
+            content_type = get_content_type(headers)
+            if content_type is None:
+                protocol_encoding = 'utf-8'
+            else:
+                protocol_encoding = content_type.get('charset', 'utf-8')
+        if isinstance(data, str):
+            # already decoded (e.g. 'data:' URL)
+            content_key = ('text', hashlib.sha1(
+                data.encode('utf-8', 'surrogatepass')).hexdigest())
+        else:
+            content_key = ('bytes', hashlib.sha1(data).hexdigest(),
+                           protocol_encoding)
+        rules = cls._get_cached(content_key)
+        if rules is None:
+            if isinstance(data, str):
+                rules = tinycss2.parse_stylesheet(data,
+                                                  skip_comments=True,
+                                                  skip_whitespace=True)
+            else:
+                rules, _ = tinycss2.parse_stylesheet_bytes(
+                    css_bytes=data,
+                    protocol_encoding=protocol_encoding,
+                    skip_comments=True,
+                    skip_whitespace=True)
+            rules = tuple(rules)
+            cls._set_cached(content_key, rules)
+        if validator is not None:
+            cls._set_cached(url_key, (validator, rules))
+        return rules
+
+    @classmethod
+    def clear_cache(cls):
+        """Clears the cache of the parsed style sheets."""
+        with cls._lock:
+            cls._cache.clear()
+
+    @staticmethod
+    def get_import_urls(rules, base_url=None):
+        """Returns the URLs of the '@import' at-rules.
+
+        Arguments:
+            rules (list): A list of the parsed CSS rule objects.
+            base_url (str, optional): A base URL for the relative-URLs.
+        Returns:
+            list[str]: A list of the URLs.
+        """
+        urls = list()
+        for rule in rules:
+            if rule.type != 'at-rule' or rule.lower_at_keyword != 'import':
+                continue
+            for token in rule.prelude:
+                if token.type in ('string', 'url'):
+                    urls.append(normalize_url(token.value, base_url).href)
+                    break
+        return urls
+
+    @classmethod
+    def prefetch(cls, urls, max_workers=None):
+        """Fetches and parses the style sheets concurrently, including the
+        style sheets that are imported by them. The results are used by the
+        subsequent CSSParser.parse() calls for the same URLs.
+        The prefetch is best-effort: the errors are logged and ignored, and
+        the 'data:' URLs are skipped.
+
+        Arguments:
+            urls (list[tuple[str, str]]): A list of the URLs and the advisory
+                character encodings (or None).
+            max_workers (int, optional): The maximum number of the threads.
+                Defaults to CSSParser.PREFETCH_MAX_WORKERS.
+        """
+        logger = getLogger('{}.{}'.format(__name__, cls.__name__))
+
+        def _prefetch(_url, _encoding):
+            _rules = cls._load_rules(_url, _encoding)
+            _location = URL(_url)
+            if _location.protocol in ('http:', 'https:'):
+                # 'file:' URLs are revalidated by stat() instead
+                cls._set_cached(('prefetched', _location.href, _encoding),
+                                (time.monotonic(), _rules))
+            return CSSParser.get_import_urls(_rules, _url)
+
+        if max_workers is None:
+            max_workers = cls.PREFETCH_MAX_WORKERS
+        seen = set()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = dict()
+            for url, encoding in urls:
+                if url.startswith('data:'):
+                    continue
+                if (url, encoding) not in seen:
+                    seen.add((url, encoding))
+                    future = executor.submit(_prefetch, url, encoding)
+                    pending[future] = url
+            while len(pending) > 0:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url = pending.pop(future)
+                    try:
+                        import_urls = future.result()
+                    except Exception as exp:
+                        logger.info('failed to prefetch: \'{}\': {}'.format(
+                            url, repr(exp)))
+                        continue
+                    for import_url in import_urls:
+                        if import_url.startswith('data:'):
+                            continue
+                        if (import_url, None) not in seen:
+                            seen.add((import_url, None))
+                            future = executor.submit(_prefetch, import_url,
+                                                     None)
+                            pending[future] = import_url
+
     @classmethod
     def fromstring(cls, stylesheet, parent_style_sheet=None,
                    parent_rule=None):
@@ -1699,10 +1905,15 @@ class CSSParser(object):
             list[CSSRule]: A list of CSS rules.
        """
         try:
-            rules = tinycss2.parse_stylesheet(
-                stylesheet,
-                skip_comments=True,
-                skip_whitespace=True)
+            key = ('text', hashlib.sha1(
+                stylesheet.encode('utf-8', 'surrogatepass')).hexdigest())
+            rules = cls._get_cached(key)
+            if rules is None:
+                rules = tuple(tinycss2.parse_stylesheet(
+                    stylesheet,
+                    skip_comments=True,
+                    skip_whitespace=True))
+                cls._set_cached(key, rules)
             css_rules = CSSParser.parse_rules(
                 rules,
                 parent_style_sheet=parent_style_sheet,
@@ -1729,9 +1940,11 @@ class CSSParser(object):
         Returns:
             CSSStyleSheet: A new CSSStyleSheet object.
         """
+        # the location of the style sheet is the base URL of its '@import'
+        # at-rules
         extra = dict({
             'type_': None,
-            'href': None,
+            'href': url,
             'owner_node': owner_node,
             'parent_style_sheet': parent_style_sheet,
             'title': None,
@@ -1740,7 +1953,6 @@ class CSSParser(object):
         if owner_node is not None:
             extra.update({
                 'type_': owner_node.get('type'),
-                'href': owner_node.get('href'),
                 'title': owner_node.get('title'),
                 'media': owner_node.get('media'),
             })
@@ -1748,18 +1960,7 @@ class CSSParser(object):
         logger = getLogger('{}.{}'.format(__name__, cls.__name__))
         try:
             logger.debug('urlopen \'{}\''.format(url))
-            data, headers = load(url)
-            if encoding is None:
-                content_type = get_content_type(headers)
-                if content_type is None:
-                    encoding = 'utf-8'
-                else:
-                    encoding = content_type.get('charset', 'utf-8')
-            rules, encoding = tinycss2.parse_stylesheet_bytes(
-                css_bytes=data,
-                protocol_encoding=encoding,
-                skip_comments=True,
-                skip_whitespace=True)
+            rules = cls._load_rules(url, encoding)
             css_rules = CSSParser.parse_rules(
                 rules,
                 parent_style_sheet=css_style_sheet,
@@ -51,6 +51,7 @@ class Screen(object):
         self._monochrome = 0
         self._color_gamut = Screen.COLOR_GAMUT_SRGB
         self._media = Screen.MEDIA_SCREEN
+        self._state = 0
 
     def __repr__(self):
         return repr({
@@ -78,6 +79,7 @@ class Screen(object):
     @color_depth.setter
     def color_depth(self, color_depth):
         self._color_depth = int(color_depth)
+        self._state += 1
 
     @property
     def color_gamut(self):
@@ -87,6 +89,7 @@ class Screen(object):
     @color_gamut.setter
     def color_gamut(self, color_gamut):
         self._color_gamut = color_gamut
+        self._state += 1
 
     @property
     def device_pixel_ratio(self):
@@ -95,6 +98,7 @@ class Screen(object):
     @device_pixel_ratio.setter
     def device_pixel_ratio(self, ratio):
         self._device_pixel_ratio = float(ratio)
+        self._state += 1
 
     @property
     def height(self):
@@ -104,6 +108,7 @@ class Screen(object):
     @height.setter
     def height(self, height):
         self._height = int(height)
+        self._state += 1
 
     @property
     def horizontal_resolution(self):
@@ -112,6 +117,7 @@ class Screen(object):
     @horizontal_resolution.setter
     def horizontal_resolution(self, resolution):
         self._horizontal_resolution = int(resolution)
+        self._state += 1
 
     @property
     def media(self):
@@ -121,6 +127,7 @@ class Screen(object):
     @media.setter
     def media(self, media):
         self._media = media
+        self._state += 1
 
     @property
     def monochrome(self):
@@ -130,6 +137,7 @@ class Screen(object):
     @monochrome.setter
     def monochrome(self, monochrome):
         self._monochrome = int(monochrome)
+        self._state += 1
 
     @property
     def orientation(self):
@@ -149,6 +157,14 @@ class Screen(object):
     @scan.setter
     def scan(self, scan):
         self._scan = scan
+        self._state += 1
+
+    @property
+    def state(self):
+        """int: A counter that is incremented whenever the screen properties
+        are changed.
+        """
+        return self._state
 
     @property
     def update(self):
@@ -158,6 +174,7 @@ class Screen(object):
     @update.setter
     def update(self, update):
         self._update = update
+        self._state += 1
 
     @property
     def vertical_resolution(self):
@@ -166,6 +183,7 @@ class Screen(object):
     @vertical_resolution.setter
     def vertical_resolution(self, resolution):
         self._vertical_resolution = int(resolution)
+        self._state += 1
 
     @property
     def width(self):
@@ -175,6 +193,7 @@ class Screen(object):
     @width.setter
     def width(self, width):
         self._width = int(width)
+        self._state += 1
 
 
 class ScreenOrientation(object):
@@ -216,6 +235,7 @@ class ScreenOrientation(object):
         while angle < 0:
             angle += 360
         self._angle = angle
+        self._screen._state += 1
 
     @property
     def type(self):
@@ -16,19 +16,28 @@
 import re
 from abc import ABC, abstractmethod
 from collections import OrderedDict
+from functools import lru_cache
 
 import tinycss2
 
 from .props import css_property_descriptor_map, css_wide_keyword_set, \
     PropertySyntax
 
+_COMPONENT_LIST_CACHE_SIZE = 4096
+
 _RE_CSS_VERSION = re.compile(r'-css[0-9]$')
 
 
+@lru_cache(maxsize=_COMPONENT_LIST_CACHE_SIZE)
+def _parse_component_value_list(value):
+    return tuple(tinycss2.parse_component_value_list(value,
+                                                     skip_comments=True))
+
+
 def create_component_list(value):
-    component_list = tinycss2.parse_component_value_list(
-        value,
-        skip_comments=True)
+    # the component values are shared between the lists of the same value,
+    # but the lists are not
+    component_list = list(_parse_component_value_list(value))
     return component_list
 
 
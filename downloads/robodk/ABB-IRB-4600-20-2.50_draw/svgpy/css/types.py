@@ -22,6 +22,7 @@ from collections import OrderedDict
 from collections.abc import Iterable, Mapping, MutableMapping, MutableSequence
 from decimal import Decimal
 from enum import Enum
+from functools import lru_cache
 
 import tinycss2
 
@@ -231,6 +232,12 @@ class CSSNumericType(CSSNumericBaseType, OrderedDict):
         type_[CSSNumericType.PERCENT_HINT] = hint
         return type_
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _create_type(unit):
+        # the shared type object of the unit; callers must copy it
+        return CSSNumericType.create_type(unit)
+
     @staticmethod
     def create_type(unit):
         """Creates a type from a string `unit`.
@@ -466,6 +473,8 @@ class CSSStyleValue(object):
     API.
     """
 
+    __slots__ = ('_associated_property', '_value', '_css_text')
+
     def __init__(self, value=None):
         self._associated_property = None
         self._value = value
@@ -816,6 +825,8 @@ class CSSImageValue(CSSStyleValue):
 class CSSKeywordValue(CSSStyleValue):
     """Represents the CSS keywords and other identifiers."""
 
+    __slots__ = ()
+
     def __init__(self, value):
         """Constructs a CSSKeywordValue object.
 
@@ -869,6 +880,8 @@ class _MathExpression(object):
 class CSSNumericValue(CSSStyleValue):
     """Represents the base class of all numeric CSS values."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -1050,6 +1063,11 @@ class CSSNumericValue(CSSStyleValue):
         return expression(*args)
 
     def add(self, *values):
+        if isinstance(self, CSSUnitValue):
+            # fast path: the operands share a unit
+            sum_value = self._unit_value_fold(values, sum)
+            if sum_value is not None:
+                return sum_value
         values = CSSNumericValue.rectify_values(values)
         if isinstance(self, CSSMathSum):
             values = self.values + values
@@ -1067,8 +1085,8 @@ class CSSNumericValue(CSSStyleValue):
         raise NotImplementedError
 
     def div(self, *values):
-        # TODO: implement CSSNumericValue.div().
-        pass
+        values = CSSNumericValue.rectify_values(values)
+        return self.mul(*[item.invert() for item in values])
 
     def equals(self, *values):
         values = CSSNumericValue.rectify_values(values)
@@ -1094,21 +1112,62 @@ class CSSNumericValue(CSSStyleValue):
                 return False
         return True
 
+    def invert(self):
+        if isinstance(self, CSSMathInvert):
+            return self._value
+        elif isinstance(self, CSSUnitValue) and self._unit == UnitType.NUMBER:
+            if self._value == 0:
+                raise ZeroDivisionError('Cannot invert zero')
+            return CSSUnitValue._create(1 / self._value, UnitType.NUMBER)
+        return CSSMathInvert(self)
+
     def max(self, *values):
-        # TODO: implement CSSNumericValue.max().
-        pass
+        if isinstance(self, CSSUnitValue):
+            max_value = self._unit_value_fold(values, max)
+            if max_value is not None:
+                return max_value
+        values = CSSNumericValue.rectify_values(values)
+        if isinstance(self, CSSMathMax):
+            values = self.values + values
+        else:
+            values = [self] + values
+        return CSSMathMax(*values)
 
     def min(self, *values):
-        # TODO: implement CSSNumericValue.min().
-        pass
+        if isinstance(self, CSSUnitValue):
+            min_value = self._unit_value_fold(values, min)
+            if min_value is not None:
+                return min_value
+        values = CSSNumericValue.rectify_values(values)
+        if isinstance(self, CSSMathMin):
+            values = self.values + values
+        else:
+            values = [self] + values
+        return CSSMathMin(*values)
 
     def mul(self, *values):
-        # TODO: implement CSSNumericValue.mul().
-        pass
+        values = CSSNumericValue.rectify_values(values)
+        if isinstance(self, CSSMathProduct):
+            values = self.values + values
+        else:
+            values = [self] + values
+        if all(isinstance(item, CSSUnitValue) for item in values):
+            units = [item.unit for item in values
+                     if item.unit != UnitType.NUMBER]
+            if len(units) <= 1:
+                product = Decimal(1)
+                for item in values:
+                    product *= item._value
+                unit = units[0] if len(units) == 1 else UnitType.NUMBER
+                return CSSUnitValue._create(product, unit)
+        return CSSMathProduct(*values)
 
     def negate(self):
-        # TODO: implement CSSNumericValue.negate().
-        pass
+        if isinstance(self, CSSMathNegate):
+            return self._value
+        elif isinstance(self, CSSUnitValue):
+            return CSSUnitValue._create(-self._value, self._unit)
+        return CSSMathNegate(self)
 
     @staticmethod
     def parse(css_text, unused=None, unused2=None):
@@ -1143,8 +1202,8 @@ class CSSNumericValue(CSSStyleValue):
         return rectified
 
     def sub(self, *values):
-        # TODO: implement CSSNumericValue.sub().
-        pass
+        values = CSSNumericValue.rectify_values(values)
+        return self.add(*[item.negate() for item in values])
 
     def to(self, unit):
         _ = CSSNumericType.create_type(unit)
@@ -1201,6 +1260,8 @@ class CSSNumericValue(CSSStyleValue):
 class CSSMathValue(CSSNumericValue):
     """Represents the [css-typed-om] CSSMathValue."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def operator(self):
@@ -1263,9 +1324,10 @@ class CSSMathInvert(CSSMathValue):
         super().__init__()
         values = CSSNumericValue.rectify_values([arg])
         self._value = values[0]
-        self._type = self._value.type()
+        self._type = self._value.type().copy()
         for key in list(self._type):
-            self._type[key] *= -1
+            if key != CSSNumericType.PERCENT_HINT:
+                self._type[key] *= -1
 
     @property
     def operator(self):
@@ -1603,6 +1665,8 @@ class CSSMathSum(CSSMathValue):
 class CSSUnitValue(CSSNumericValue):
     """Represents the numeric values."""
 
+    __slots__ = ('_unit', '_type')
+
     rel_tol = 1e-09
     abs_tol = 0.0
 
@@ -1615,7 +1679,8 @@ class CSSUnitValue(CSSNumericValue):
         """
         super().__init__()
         self._unit = unit.lower()
-        self._type = CSSNumericType.create_type(self._unit)
+        CSSNumericType._create_type(self._unit)  # validates the unit
+        self._type = None
         self._value = Decimal(value)
 
     def __eq__(self, other):
@@ -1691,6 +1756,30 @@ class CSSUnitValue(CSSNumericValue):
     def value(self, value):
         self._value = Decimal(value)
 
+    @staticmethod
+    def _create(value, unit):
+        # creates a value from a Decimal and a validated lower-case unit
+        item = CSSUnitValue.__new__(CSSUnitValue)
+        item._associated_property = None
+        item._css_text = None
+        item._unit = unit
+        item._type = None
+        item._value = value
+        return item
+
+    def _unit_value_fold(self, values, func):
+        unit = self._unit
+        operands = [self._value]
+        for item in values:
+            if isinstance(item, CSSUnitValue) and item._unit == unit:
+                operands.append(item._value)
+            elif (isinstance(item, (int, float))
+                  and unit == UnitType.NUMBER):
+                operands.append(Decimal(item))
+            else:
+                return None
+        return CSSUnitValue._create(func(operands), unit)
+
     @staticmethod
     def create_from_sum_value_item(item):
         value, unit_map = item
@@ -1729,7 +1818,7 @@ class CSSUnitValue(CSSNumericValue):
         old_unit = self._unit
         old_value = self._value
         if old_unit == unit:
-            return CSSUnitValue(old_value, old_unit)
+            return CSSUnitValue._create(old_value, old_unit)
         canonical_unit1 = UnitType.get_canonical_unit(old_unit)
         canonical_unit2 = UnitType.get_canonical_unit(unit)
         if (canonical_unit1 is None
@@ -1751,6 +1840,8 @@ class CSSUnitValue(CSSNumericValue):
         return s + self._unit
 
     def type(self):
+        if self._type is None:
+            self._type = CSSNumericType._create_type(self._unit).copy()
         return self._type
 
 
@@ -13,6 +13,8 @@
 # limitations under the License.
 
 
+import functools
+import os
 import re
 from abc import ABC, abstractmethod
 from collections.abc import KeysView, MutableMapping, MutableSequence
@@ -23,8 +25,8 @@ from .core import CSSUtils, Font, SVGLength
 from .css import CSSStyleDeclaration
 from .exception import HierarchyRequestError, InUseAttributeError, \
     InvalidCharacterError, NotFoundError
-from .style import get_css_rules, get_css_style, \
-    get_css_style_sheet_from_element
+from .style import get_css_rules, get_css_style_sheet_from_element, \
+    get_css_styles
 from .utils import QualifiedName, get_elements_by_class_name, \
     get_elements_by_tag_name, get_elements_by_tag_name_ns, \
     is_ascii_whitespace, style_to_dict
@@ -32,6 +34,9 @@ from .utils import QualifiedName, get_elements_by_class_name, \
 
 _RE_DOM_STRING_MAP_INVALID_SYNTAX = re.compile(r'-[a-z]')
 
+# the encodings that lxml serializes without the XML declaration by default
+_DEFAULT_ENCODINGS = 'ASCII', 'US-ASCII', 'UTF-8', 'UTF8'
+
 # https://www.w3.org/TR/xml/#NT-Name
 _RE_XML_NAME = re.compile(
     r"^(:|[A-Z]|_|[a-z]|[\xc0-\xd6]|[\xd8-\xf6]"
@@ -88,6 +93,104 @@ def node_prepend_data(node, data, tail=True):
         node.text = text
 
 
+def node_write_to(fileobj, tree, chunk_size=None, **kwargs):
+    """Serializes an XML tree or a node into a file.
+    The tree is serialized directly into the output buffer of lxml, which
+    is written to the file piece by piece, instead of building the whole
+    serialized string in memory.
+
+    Arguments:
+        fileobj (str, os.PathLike, file-like object): A filename or a file
+            object opened in binary mode.
+        tree (lxml.etree._ElementTree, lxml.etree._Element): An XML tree or
+            a node to be serialized. Unlike the tree, the node is serialized
+            alone, as lxml.etree.tostring() does.
+        chunk_size (int, optional): The size in bytes of each write to the
+            file. If it is None, the data is written as it is produced.
+        **kwargs: See lxml.etree._ElementTree.write() for the tree, or
+            lxml.etree.tostring() for the node.
+    """
+    if isinstance(tree, etree._ElementTree):
+        write = tree.write
+    else:
+        write = functools.partial(_node_write, tree)
+    if chunk_size is None:
+        write(fileobj, **kwargs)
+        return
+    elif isinstance(fileobj, (str, os.PathLike)):
+        with open(fileobj, 'wb') as fp:
+            node_write_to(fp, tree, chunk_size=chunk_size, **kwargs)
+        return
+    writer = _ChunkedWriter(fileobj, chunk_size)
+    write(writer, **kwargs)
+    writer.flush()
+
+
+def _node_write(node, fileobj, encoding=None, method='xml',
+                xml_declaration=None, pretty_print=False, with_tail=True,
+                standalone=None, doctype=None, compression=0):
+    if not isinstance(node.tag, str):
+        # comment or processing instruction
+        data = etree.tostring(node,
+                              encoding=encoding,
+                              method=method,
+                              xml_declaration=xml_declaration,
+                              pretty_print=pretty_print,
+                              with_tail=with_tail,
+                              standalone=standalone,
+                              doctype=doctype)
+        if isinstance(fileobj, (str, os.PathLike)):
+            with open(fileobj, 'wb') as fp:
+                fp.write(data)
+            return
+        fileobj.write(data)
+        return
+    if xml_declaration is None:
+        xml_declaration = (encoding is not None
+                           and encoding.upper() not in _DEFAULT_ENCODINGS)
+    with etree.xmlfile(fileobj,
+                       encoding=encoding,
+                       compression=compression) as xf:
+        if xml_declaration:
+            xf.write_declaration(standalone=standalone)
+        if doctype is not None:
+            xf.write_doctype(doctype)
+        xf.write(node,
+                 method=method,
+                 pretty_print=pretty_print,
+                 with_tail=with_tail)
+
+
+class _ChunkedWriter(object):
+    """Gathers the serialized data into the chunks of the specified size."""
+
+    def __init__(self, fileobj, chunk_size):
+        if chunk_size <= 0:
+            raise ValueError(
+                'Expected positive chunk size, got {}'.format(chunk_size))
+        self._fileobj = fileobj
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+
+    def flush(self):
+        if len(self._buffer) > 0:
+            self._fileobj.write(bytes(self._buffer))
+            del self._buffer[:]
+
+    def write(self, data):
+        buffer = self._buffer
+        buffer += data
+        chunk_size = self._chunk_size
+        if len(buffer) < chunk_size:
+            return
+        view = memoryview(buffer)
+        end = len(buffer) - len(buffer) % chunk_size
+        for start in range(0, end, chunk_size):
+            self._fileobj.write(bytes(view[start:start + chunk_size]))
+        view.release()
+        del buffer[:end]
+
+
 class DOMStringMap(MutableMapping):
     """Represents the [HTML] DOMStringMap."""
 
@@ -241,6 +344,7 @@ class DOMTokenList(MutableSequence):
         if len(value) == 0:
             if self._local_name in self._owner_element.attrib:
                 del self._owner_element.attrib[self._local_name]
+                self._owner_element._invalidate_index(self._local_name)
         else:
             self._owner_element.set(self._local_name, value)
 
@@ -383,6 +487,7 @@ class NamedNodeMap(MutableMapping):
         if attr is not None:
             attr.detach_element()
         del self._attrib[name]
+        self._owner_element._invalidate_index(name)
 
     def __getitem__(self, name):
         """Gets an attribute with the specified `name`.
@@ -424,6 +529,7 @@ class NamedNodeMap(MutableMapping):
                     del self[name]
                 return
             self._attrib[name] = value
+            self._owner_element._invalidate_index(name)
             self._set_default_named_item(name)
         elif isinstance(value, Attr):
             if name != value.name:
@@ -676,6 +782,10 @@ class Node(ABC):
         Returns:
             bool: Returns True if successful; otherwise False.
         """
+        owner_document = self._owner_document
+        if owner_document is not None and owner_document is not document:
+            # the node is moved out of the previous document
+            owner_document._invalidate_index()
         if document is None:
             return False
         self._owner_document = document
@@ -782,6 +892,23 @@ class Node(ABC):
         """
         raise NotImplementedError
 
+    def write_to(self, fileobj, chunk_size=None, **kwargs):
+        """Serializes a node incrementally into a file.
+        The output is the same as Node.tostring(), but the whole serialized
+        string is never held in memory.
+
+        Arguments:
+            fileobj (str, os.PathLike, file-like object): A filename or a
+                file object opened in binary mode.
+            chunk_size (int, optional): The size in bytes of each write to
+                the file.
+            **kwargs: See lxml.etree.tostring().
+        """
+        node_write_to(fileobj,
+                      self,
+                      chunk_size=chunk_size,
+                      **kwargs)
+
 
 class NonDocumentTypeChildNode(ABC):
     """Represents the [DOM] NonDocumentTypeChildNode."""
@@ -1004,6 +1131,8 @@ class Attr(Node):
             if value is None or len(value) == 0:
                 if self._qualified_name in self._owner_element.attrib:
                     del self._owner_element.attrib[self._qualified_name]
+                    self._owner_element._invalidate_index(
+                        self._qualified_name)
                 return
             self._owner_element.set(self._qualified_name, value)
         else:
@@ -1104,6 +1233,25 @@ class Attr(Node):
             value = ''
         return value.encode()
 
+    def write_to(self, fileobj, chunk_size=None, **kwargs):
+        """Reimplemented from Node.write_to().
+
+        Writes the attribute's value into a file.
+
+        Arguments:
+            fileobj (str, os.PathLike, file-like object): A filename or a
+                file object opened in binary mode.
+            chunk_size (int, optional): Reserved.
+            **kwargs: Reserved.
+        """
+        _ = chunk_size, kwargs
+        data = self.tostring()
+        if isinstance(fileobj, (str, os.PathLike)):
+            with open(fileobj, 'wb') as fp:
+                fp.write(data)
+            return
+        fileobj.write(data)
+
 
 class CharacterData(Node, NonDocumentTypeChildNode):
     """Represents the [DOM] CharacterData."""
@@ -1218,8 +1366,11 @@ class Comment(etree.CommentBase, CharacterData):
                 "This node type '{}' cannot insert as a sibling node of type "
                 "'{}'".format(node.__class__.__name__,
                               self.__class__.__name__))
-        node.attach_document(self.owner_document)
+        owner_document = self.owner_document
+        node.attach_document(owner_document)
         super().addnext(node)
+        if owner_document is not None:
+            owner_document._invalidate_index()
 
     def addprevious(self, node):
         """Reimplemented from lxml.etree.CommentBase.addprevious().
@@ -1233,8 +1384,11 @@ class Comment(etree.CommentBase, CharacterData):
                 "This node type '{}' cannot insert as a sibling node of type "
                 "'{}'".format(node.__class__.__name__,
                               self.__class__.__name__))
-        node.attach_document(self.owner_document)
+        owner_document = self.owner_document
+        node.attach_document(owner_document)
         super().addprevious(node)
+        if owner_document is not None:
+            owner_document._invalidate_index()
 
     def append(self, node):
         """Reimplemented from lxml.etree.CommentBase.append().
@@ -1358,6 +1512,8 @@ class Element(etree.ElementBase, Node, ParentNode, NonDocumentTypeChildNode):
     STRUCTURALLY_EXTERNAL_ELEMENTS = \
         ['audio', 'foreignObject', 'iframe', 'image', 'script', 'use', 'video']
 
+    INDEXED_ATTRIBUTES = ('class', 'id')
+
     CONTAINER_ELEMENTS = \
         ['a', 'clipPath', 'defs', 'g', 'marker', 'mask', 'pattern', 'svg',
          'switch', 'symbol', 'unknown']
@@ -1392,6 +1548,29 @@ class Element(etree.ElementBase, Node, ParentNode, NonDocumentTypeChildNode):
 
     RE_DIGIT_SEQUENCE_SPLITTER = re.compile(r'\s*,\s*|\s+')
 
+    _NON_INHERITED_PROPS = {
+        'alignment-baseline': 'baseline',
+        'baseline-shift': '0',
+        'clip': 'auto',
+        'clip-path': 'none',
+        'display': 'inline',
+        'dominant-baseline': 'auto',
+        'filter': 'none',
+        'flood-color': 'black',
+        'flood-opacity': '1',
+        'inline-size': '0',
+        'lighting-color': 'white',
+        'mask': 'no',
+        'opacity': '1',
+        'overflow': 'visible',
+        'stop-color': 'black',
+        'stop-opacity': '1',
+        'text-decoration': 'none',
+        'transform': 'none',
+        'unicode-bidi': 'normal',
+        'vector-effect': 'none',
+    }
+
     def _init(self):
         Node.__init__(self)
         self._attributes = NamedNodeMap(self)
@@ -1563,6 +1742,195 @@ class Element(etree.ElementBase, Node, ParentNode, NonDocumentTypeChildNode):
                     chars.append(child.tail)
         return chars
 
+    def _cascade_style(self, css_style, css_style_important,
+                       parent_cascaded=None):
+        """Cascades the properties specified on this element over the
+        properties cascaded from the parent element.
+
+        Arguments:
+            css_style (dict): The declarations of the style rules that match
+                this element.
+            css_style_important (dict): The important declarations of the
+                style rules that match this element.
+            parent_cascaded (dict, optional): The cascaded properties of the
+                parent element.
+        Returns:
+            dict: The cascaded properties of this element. A property that
+                is mapped to None is reset by a shorthand property.
+        """
+        def _update_font_prop(_value, _style, _inherited_style):
+            _other = CSSUtils.parse_font(_value)
+            for _key in _other:
+                if _key not in _style:
+                    _style[_key] = _other[_key]
+                    if _key == 'font-variant':
+                        _update_font_variant_prop(_other[_key],
+                                                  _style,
+                                                  _inherited_style)
+            _inherited_style.pop('font-style', None)
+            _inherited_style.pop('font-variant', None)
+            _inherited_style.pop('font-weight', None)
+            _inherited_style.pop('font-stretch', None)
+            _inherited_style.pop('font-size', None)
+            _inherited_style.pop('line-height', None)
+            _inherited_style.pop('font-size-adjust', None)
+            _inherited_style.pop('font-kerning', None)
+            _inherited_style.pop('font-language-override', None)
+            _inherited_style.pop('font-family', None)
+            _inherited_style.pop('font', None)
+
+        def _update_font_variant_prop(_value, _style, _inherited_style):
+            _other = CSSUtils.parse_font_variant(_value)
+            for _key in _other:
+                if _key not in _style:
+                    _style[_key] = _other[_key]
+            _inherited_style.pop('font-variant-alternates', None)
+            _inherited_style.pop('font-variant-caps', None)
+            _inherited_style.pop('font-variant-east-asian', None)
+            _inherited_style.pop('font-variant-ligatures', None)
+            _inherited_style.pop('font-variant-numeric', None)
+            _inherited_style.pop('font-variant-position', None)
+            _inherited_style.pop('font-variant', None)
+
+        css_style = dict(css_style)
+        css_style.update(self.attrib)
+        _style = css_style.pop('style', None)
+        if _style is not None:
+            css_style.update(style_to_dict(_style))
+        css_style.update(css_style_important)
+
+        style = dict()
+        initial_props = Element._get_initial_inherited_props()
+        inherited_props = initial_props.copy()
+        for key in iter(list(inherited_props.keys())):
+            value = css_style.get(key)
+            if value is not None and value not in ['inherit']:
+                if key == 'font':
+                    # 'font' shorthand property
+                    style[key] = value
+                    _update_font_prop(value, style, inherited_props)
+                elif key == 'font-family':
+                    # 'font-family' property
+                    style[key] = CSSUtils.parse_font_family(value)
+                    inherited_props.pop(key, None)
+                elif key == 'font-variant':
+                    # 'font-variant' shorthand property
+                    style[key] = value
+                    _update_font_variant_prop(value, style,
+                                              inherited_props)
+                elif key == 'marker':
+                    # TODO: parse the 'marker' shorthand property.
+                    raise NotImplementedError
+                else:
+                    if key in ['font-variant-alternates',
+                               'font-variant-east-asian',
+                               'font-variant-ligatures',
+                               'font-variant-numeric']:
+                        style[key] = value.split()
+                    else:
+                        style[key] = value
+                    inherited_props.pop(key, None)
+
+        cascaded = dict() if parent_cascaded is None \
+            else parent_cascaded.copy()
+        for key in iter(initial_props.keys()):
+            if key in style:
+                cascaded[key] = style[key]
+            elif key not in inherited_props:
+                cascaded[key] = None
+
+        # 'display' property
+        display = css_style.get('display')
+        if display is not None and display == 'none':
+            cascaded['display'] = 'none'
+        return cascaded
+
+    @staticmethod
+    def _get_initial_inherited_props():
+        # 'color-interpolation-filters', 'font-feature-settings',
+        # 'gradientTransform', 'glyph-orientation-horizontal',
+        # 'isolation',
+        # 'patternTransform',
+        # 'solid-color', 'solid-opacity',
+        # 'text-align', 'text-align-all', 'text-align-last',
+        # 'text-decoration-color', 'text-decoration-line',
+        # 'text-decoration-style', 'text-indent',
+        # 'text-overflow',
+        # 'transform', 'transform-box', 'transform-origin',
+        # 'vertical-align',
+        return {'clip-rule': 'nonzero',
+                'color': 'black',  # depends on user agent
+                'color-interpolation': 'sRGB',
+                'color-rendering': 'auto',
+                'cursor': 'auto',
+                'direction': 'ltr',
+                'fill': 'black',
+                'fill-opacity': '1',
+                'fill-rule': 'nonzero',
+                'font': None,
+                'font-family': None,
+                'font-feature-settings': 'normal',
+                'font-kerning': Font.CSS_DEFAULT_FONT_KERNING,
+                'font-language-override':
+                    Font.CSS_DEFAULT_FONT_LANGUAGE_OVERRIDE,
+                'font-size': Font.CSS_DEFAULT_FONT_SIZE,
+                'font-size-adjust': Font.CSS_DEFAULT_FONT_SIZE_ADJUST,
+                'font-stretch': Font.CSS_DEFAULT_FONT_STRETCH,
+                'font-style': Font.CSS_DEFAULT_FONT_STYLE,
+                'font-synthesis': 'weight style',
+                'font-variant': Font.CSS_DEFAULT_FONT_VARIANT,
+                'font-variant-alternates': ['normal'],
+                'font-variant-caps': 'normal',
+                'font-variant-east-asian': ['normal'],
+                'font-variant-ligatures': ['normal'],
+                'font-variant-numeric': ['normal'],
+                'font-variant-position': 'normal',
+                'font-weight': Font.CSS_DEFAULT_FONT_WEIGHT,
+                # 'glyph-orientation-vertical': 'auto',  # deprecated
+                'image-rendering': 'auto',
+                'lang': None,
+                'letter-spacing': 'normal',
+                'line-height': Font.CSS_DEFAULT_LINE_HEIGHT,
+                'marker': None,
+                'marker-end': 'none',
+                'marker-mid': 'none',
+                'marker-start': 'none',
+                'paint-order': 'normal',
+                'pointer-events': 'visiblePainted',
+                'shape-rendering': 'auto',
+                'stroke': 'none',
+                'stroke-dasharray': 'none',
+                'stroke-dashoffset': '0',
+                'stroke-linecap': 'butt',
+                'stroke-linejoin': 'miter',
+                'stroke-miterlimit': '4',
+                'stroke-opacity': '1',
+                'stroke-width': '1',
+                'tab-size': '8',
+                'text-anchor': 'start',
+                'text-orientation': 'mixed',
+                'text-rendering': 'auto',
+                'visibility': 'visible',
+                'white-space': 'normal',
+                'word-spacing': 'normal',
+                'writing-mode': 'horizontal-tb',
+                Element.XML_LANG: None,
+                }
+
+    def _invalidate_index(self, name=None):
+        """Discards the element index of the owner document after the
+        subtree or the indexed attribute `name` has been changed.
+
+        Arguments:
+            name (str, optional): The qualified name of the changed
+                attribute. If it is None, the structure has been changed.
+        """
+        if name is not None and name not in Element.INDEXED_ATTRIBUTES:
+            return
+        owner_document = self.owner_document
+        if owner_document is not None:
+            owner_document._invalidate_index()
+
     def addnext(self, node):
         """Reimplemented from lxml.etree.ElementBase.addnext().
 
@@ -1575,8 +1943,11 @@ class Element(etree.ElementBase, Node, ParentNode, NonDocumentTypeChildNode):
                 "This node type '{}' cannot insert as a sibling node of type "
                 "'{}'".format(node.__class__.__name__,
                               self.__class__.__name__))
-        node.attach_document(self.owner_document)
+        owner_document = self.owner_document
+        node.attach_document(owner_document)
         super().addnext(node)
+        if owner_document is not None:
+            owner_document._invalidate_index()
 
     def addprevious(self, node):
         """Reimplemented from lxml.etree.ElementBase.addprevious().
@@ -1590,8 +1961,11 @@ class Element(etree.ElementBase, Node, ParentNode, NonDocumentTypeChildNode):
                 "This node type '{}' cannot insert as a sibling node of type "
                 "'{}'".format(node.__class__.__name__,
                               self.__class__.__name__))
-        node.attach_document(self.owner_document)
+        owner_document = self.owner_document
+        node.attach_document(owner_document)
         super().addprevious(node)
+        if owner_document is not None:
+            owner_document._invalidate_index()
 
     def append(self, *nodes):
         """Inserts sub-nodes after the last child node.
@@ -1599,6 +1973,7 @@ class Element(etree.ElementBase, Node, ParentNode, NonDocumentTypeChildNode):
         Arguments:
             *nodes (Node, str, ...): A list of nodes to be added.
         """
+        owner_document = self.owner_document
         data = ''
         target = self
         for node in nodes:
@@ -1610,13 +1985,15 @@ class Element(etree.ElementBase, Node, ParentNode, NonDocumentTypeChildNode):
                 tail = False if target == self else True
                 node_append_data(target, data, tail)
                 data = ''
-            node.attach_document(self.owner_document)
+            node.attach_document(owner_document)
             super().append(node)
             target = node
 
         if len(data) > 0:
             tail = False if target == self else True
             node_append_data(target, data, tail)
+        if target is not self and owner_document is not None:
+            owner_document._invalidate_index()
 
     def append_child(self, node):
         """Adds a sub-node to the end of this node.
@@ -1737,6 +2114,8 @@ class Element(etree.ElementBase, Node, ParentNode, NonDocumentTypeChildNode):
             self.ensure_pre_insertion_validity(node)
             node.attach_document(owner_document)
         super().extend(nodes)
+        if owner_document is not None:
+            owner_document._invalidate_index()
 
     def get_attribute(self, qualified_name):
         """Returns an attribute's value with the specified name.
@@ -1792,10 +2171,10 @@ class Element(etree.ElementBase, Node, ParentNode, NonDocumentTypeChildNode):
     def get_computed_geometry(self):
         return {}  # override with a subclass
 
-    def get_computed_style(self):
+    def get_computed_style(self, _cascaded=None):
         """Gets the presentation attributes from ancestor elements."""
         # TODO: implement Window.get_computed_style()
-        style = self.get_inherited_style()
+        style = self.get_inherited_style(_cascaded)
 
         # 'font-feature-settings' property
         style['font-feature-settings'] = CSSUtils.parse_font_feature_settings(
@@ -1860,185 +2239,35 @@ class Element(etree.ElementBase, Node, ParentNode, NonDocumentTypeChildNode):
         style.update(geometry)
         return style
 
-    def get_inherited_style(self):
-        def _update_font_prop(_value, _style, _inherited_style):
-            _other = CSSUtils.parse_font(_value)
-            for _key in _other:
-                if _key not in _style:
-                    _style[_key] = _other[_key]
-                    if _key == 'font-variant':
-                        _update_font_variant_prop(_other[_key],
-                                                  _style,
-                                                  _inherited_style)
-            _inherited_style.pop('font-style', None)
-            _inherited_style.pop('font-variant', None)
-            _inherited_style.pop('font-weight', None)
-            _inherited_style.pop('font-stretch', None)
-            _inherited_style.pop('font-size', None)
-            _inherited_style.pop('line-height', None)
-            _inherited_style.pop('font-size-adjust', None)
-            _inherited_style.pop('font-kerning', None)
-            _inherited_style.pop('font-language-override', None)
-            _inherited_style.pop('font-family', None)
-            _inherited_style.pop('font', None)
-
-        def _update_font_variant_prop(_value, _style, _inherited_style):
-            _other = CSSUtils.parse_font_variant(_value)
-            for _key in _other:
-                if _key not in _style:
-                    _style[_key] = _other[_key]
-            _inherited_style.pop('font-variant-alternates', None)
-            _inherited_style.pop('font-variant-caps', None)
-            _inherited_style.pop('font-variant-east-asian', None)
-            _inherited_style.pop('font-variant-ligatures', None)
-            _inherited_style.pop('font-variant-numeric', None)
-            _inherited_style.pop('font-variant-position', None)
-            _inherited_style.pop('font-variant', None)
+    def get_inherited_style(self, _cascaded=None):
+        if _cascaded is None:
+            css_rules = get_css_rules(self)
+            root = self.getroottree().getroot()
+            css_styles = get_css_styles(root, css_rules)
+            no_style = dict(), dict()
+            elements = [self] + list(self.iterancestors())
+            for element in reversed(elements):
+                css_style, css_style_important = css_styles.get(element,
+                                                                no_style)
+                _cascaded = element._cascade_style(css_style,
+                                                   css_style_important,
+                                                   _cascaded)
 
         # See https://svgwg.org/svg2-draft/propidx.html
         style = dict()
-        non_inherited_props = \
-            {'alignment-baseline': 'baseline',
-             'baseline-shift': '0',
-             'clip': 'auto',
-             'clip-path': 'none',
-             'display': 'inline',
-             'dominant-baseline': 'auto',
-             'filter': 'none',
-             'flood-color': 'black',
-             'flood-opacity': '1',
-             'inline-size': '0',
-             'lighting-color': 'white',
-             'mask': 'no',
-             'opacity': '1',
-             'overflow': 'visible',
-             'stop-color': 'black',
-             'stop-opacity': '1',
-             'text-decoration': 'none',
-             'transform': 'none',
-             'unicode-bidi': 'normal',
-             'vector-effect': 'none',
-             }
-        for key in iter(non_inherited_props):
-            style.setdefault(key,
-                             self.get(key, non_inherited_props[key]))
-
-        inherited_props = \
-            {'clip-rule': 'nonzero',
-             'color': 'black',  # depends on user agent
-             'color-interpolation': 'sRGB',
-             'color-rendering': 'auto',
-             'cursor': 'auto',
-             'direction': 'ltr',
-             'fill': 'black',
-             'fill-opacity': '1',
-             'fill-rule': 'nonzero',
-             'font': None,
-             'font-family': None,
-             'font-feature-settings': 'normal',
-             'font-kerning': Font.CSS_DEFAULT_FONT_KERNING,
-             'font-language-override': Font.CSS_DEFAULT_FONT_LANGUAGE_OVERRIDE,
-             'font-size': Font.CSS_DEFAULT_FONT_SIZE,
-             'font-size-adjust': Font.CSS_DEFAULT_FONT_SIZE_ADJUST,
-             'font-stretch': Font.CSS_DEFAULT_FONT_STRETCH,
-             'font-style': Font.CSS_DEFAULT_FONT_STYLE,
-             'font-synthesis': 'weight style',
-             'font-variant': Font.CSS_DEFAULT_FONT_VARIANT,
-             'font-variant-alternates': ['normal'],
-             'font-variant-caps': 'normal',
-             'font-variant-east-asian': ['normal'],
-             'font-variant-ligatures': ['normal'],
-             'font-variant-numeric': ['normal'],
-             'font-variant-position': 'normal',
-             'font-weight': Font.CSS_DEFAULT_FONT_WEIGHT,
-             # 'glyph-orientation-vertical': 'auto',  # deprecated
-             'image-rendering': 'auto',
-             'lang': None,
-             'letter-spacing': 'normal',
-             'line-height': Font.CSS_DEFAULT_LINE_HEIGHT,
-             'marker': None,
-             'marker-end': 'none',
-             'marker-mid': 'none',
-             'marker-start': 'none',
-             'paint-order': 'normal',
-             'pointer-events': 'visiblePainted',
-             'shape-rendering': 'auto',
-             'stroke': 'none',
-             'stroke-dasharray': 'none',
-             'stroke-dashoffset': '0',
-             'stroke-linecap': 'butt',
-             'stroke-linejoin': 'miter',
-             'stroke-miterlimit': '4',
-             'stroke-opacity': '1',
-             'stroke-width': '1',
-             'tab-size': '8',
-             'text-anchor': 'start',
-             'text-orientation': 'mixed',
-             'text-rendering': 'auto',
-             'visibility': 'visible',
-             'white-space': 'normal',
-             'word-spacing': 'normal',
-             'writing-mode': 'horizontal-tb',
-             Element.XML_LANG: None,
-             }
-        # 'color-interpolation-filters', 'font-feature-settings',
-        # 'gradientTransform', 'glyph-orientation-horizontal',
-        # 'isolation',
-        # 'patternTransform',
-        # 'solid-color', 'solid-opacity',
-        # 'text-align', 'text-align-all', 'text-align-last',
-        # 'text-decoration-color', 'text-decoration-line',
-        # 'text-decoration-style', 'text-indent',
-        # 'text-overflow',
-        # 'transform', 'transform-box', 'transform-origin',
-        # 'vertical-align',
-        css_rules = get_css_rules(self)
-        element = self
-        while element is not None:
-            css_style, css_style_important = get_css_style(element, css_rules)
-            css_style.update(element.attrib)
-            _style = css_style.pop('style', None)
-            if _style is not None:
-                css_style.update(style_to_dict(_style))
-            css_style.update(css_style_important)
-            for key in iter(list(inherited_props.keys())):
-                value = css_style.get(key)
-                if value is not None and value not in ['inherit']:
-                    if key == 'font':
-                        # 'font' shorthand property
-                        style[key] = value
-                        _update_font_prop(value, style, inherited_props)
-                    elif key == 'font-family':
-                        # 'font-family' property
-                        style[key] = CSSUtils.parse_font_family(value)
-                        del inherited_props[key]
-                    elif key == 'font-variant':
-                        # 'font-variant' shorthand property
-                        style[key] = value
-                        _update_font_variant_prop(value, style,
-                                                  inherited_props)
-                    elif key == 'marker':
-                        # TODO: parse the 'marker' shorthand property.
-                        raise NotImplementedError
-                    else:
-                        if key in ['font-variant-alternates',
-                                   'font-variant-east-asian',
-                                   'font-variant-ligatures',
-                                   'font-variant-numeric']:
-                            style[key] = value.split()
-                        else:
-                            style[key] = value
-                        inherited_props.pop(key, None)
-            # 'display' property
-            display = css_style.get('display')
-            if display is not None and display == 'none':
-                style['display'] = 'none'
-            element = element.getparent()
-
-        for key, value in iter(inherited_props.items()):
+        for key, value in iter(Element._NON_INHERITED_PROPS.items()):
+            style[key] = self.get(key, value)
+
+        for key, value in iter(
+                Element._get_initial_inherited_props().items()):
+            value = _cascaded.get(key, value)
             if value is not None:
                 style[key] = value
 
+        # 'display' property
+        if _cascaded.get('display') == 'none':
+            style['display'] = 'none'
+
         font_family = style.get('font-family')
         if font_family is None:
             style['font-family'] = CSSUtils.parse_font_family(
@@ -2149,8 +2378,11 @@ class Element(etree.ElementBase, Node, ParentNode, NonDocumentTypeChildNode):
         Inserts a sub-node at the given position in this node.
         """
         self.ensure_pre_insertion_validity(node)
-        node.attach_document(self.owner_document)
+        owner_document = self.owner_document
+        node.attach_document(owner_document)
         super().insert(index, node)
+        if owner_document is not None:
+            owner_document._invalidate_index()
 
     def insert_before(self, node, child):
         """Inserts a node into a parent before a child.
@@ -2249,6 +2481,7 @@ class Element(etree.ElementBase, Node, ParentNode, NonDocumentTypeChildNode):
             return
         self.ensure_pre_remove_validity(node)
         super().remove(node)
+        self._invalidate_index()
 
     def remove_attribute(self, qualified_name):
         """Removes an attribute with the specified name.
@@ -2304,8 +2537,11 @@ class Element(etree.ElementBase, Node, ParentNode, NonDocumentTypeChildNode):
         """
         self.ensure_pre_insertion_validity(new_node, old_node)
         self.ensure_pre_remove_validity(old_node)
-        new_node.attach_document(self.owner_document)
+        owner_document = self.owner_document
+        new_node.attach_document(owner_document)
         super().replace(old_node, new_node)
+        if owner_document is not None:
+            owner_document._invalidate_index()
 
     def replace_child(self, node, child):
         """Replaces a child with node.
@@ -2319,6 +2555,14 @@ class Element(etree.ElementBase, Node, ParentNode, NonDocumentTypeChildNode):
         self.replace(child, node)
         return child
 
+    def set(self, key, value):
+        """Reimplemented from lxml.etree.ElementBase.set().
+
+        Sets an element attribute.
+        """
+        super().set(key, value)
+        self._invalidate_index(key)
+
     def set_attribute(self, qualified_name, value):
         """Sets an attribute with the specified name.
 
@@ -2520,8 +2764,11 @@ class ProcessingInstruction(etree.PIBase, CharacterData):
                 "This node type '{}' cannot insert as a sibling node of type "
                 "'{}'".format(node.__class__.__name__,
                               self.__class__.__name__))
-        node.attach_document(self.owner_document)
+        owner_document = self.owner_document
+        node.attach_document(owner_document)
         super().addnext(node)
+        if owner_document is not None:
+            owner_document._invalidate_index()
 
     def addprevious(self, node):
         """Reimplemented from lxml.etree.PIBase.addprevious().
@@ -2535,8 +2782,11 @@ class ProcessingInstruction(etree.PIBase, CharacterData):
                 "This node type '{}' cannot insert as a sibling node of type "
                 "'{}'".format(node.__class__.__name__,
                               self.__class__.__name__))
-        node.attach_document(self.owner_document)
+        owner_document = self.owner_document
+        node.attach_document(owner_document)
         super().addprevious(node)
+        if owner_document is not None:
+            owner_document._invalidate_index()
 
     def append(self, node):
         """Reimplemented from lxml.etree.PIBase.append().
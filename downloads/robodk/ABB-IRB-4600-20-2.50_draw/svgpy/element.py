@@ -887,6 +887,14 @@ class SVGSVGElement(SVGGraphicsElement, SVGFitToViewBox, SVGZoomAndPan):
 
         return geometry
 
+    def _get_indexed_document(self):
+        # The element index of the document covers the whole subtree only
+        # if this element is the document element.
+        doc = self._owner_document
+        if doc is not None and doc.document_element is self:
+            return doc
+        return None
+
     def get_element_by_id(self, element_id, nsmap=None):
         """Finds the first matching sub-element, by id.
 
@@ -897,6 +905,9 @@ class SVGSVGElement(SVGGraphicsElement, SVGFitToViewBox, SVGZoomAndPan):
             Element: The first matching sub-element. Returns None if there is
                 no such element.
         """
+        doc = self._get_indexed_document()
+        if doc is not None:
+            return doc.get_element_by_id(element_id, nsmap=nsmap)
         return get_element_by_id(self, element_id, nsmap=nsmap)
 
     def get_elements_by_class_name(self, class_names, nsmap=None):
@@ -911,6 +922,9 @@ class SVGSVGElement(SVGGraphicsElement, SVGFitToViewBox, SVGZoomAndPan):
         Returns:
             list[Element]: A list of elements.
         """
+        doc = self._get_indexed_document()
+        if doc is not None:
+            return doc.get_elements_by_class_name(class_names, nsmap=nsmap)
         return get_elements_by_class_name(self,
                                           class_names,
                                           nsmap=nsmap,
@@ -927,6 +941,9 @@ class SVGSVGElement(SVGGraphicsElement, SVGFitToViewBox, SVGZoomAndPan):
         Returns:
             list[Element]: A list of elements.
         """
+        doc = self._get_indexed_document()
+        if doc is not None:
+            return doc.get_elements_by_tag_name(qualified_name, nsmap=nsmap)
         return get_elements_by_tag_name(self,
                                         qualified_name,
                                         nsmap=nsmap,
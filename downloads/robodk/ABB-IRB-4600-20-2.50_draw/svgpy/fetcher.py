@@ -0,0 +1,589 @@
+# Copyright (C) 2018 Tetsuya Miura <miute.dev@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import hashlib
+import http.client
+import json
+import mimetypes
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from email.utils import formatdate, parsedate_to_datetime
+from io import BytesIO
+from logging import getLogger
+from urllib.error import HTTPError, URLError
+from urllib.parse import urljoin, urlsplit
+from urllib.request import Request, getproxies, proxy_bypass, \
+    url2pathname, urlopen
+
+from .url import URL
+
+_CACHE_DIRNAME = 'http'
+
+_CONDITIONAL_HEADERS = ('if-modified-since', 'if-none-match')
+
+_MAX_REDIRECTS = 10
+
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+_USER_AGENT = 'svgpy'
+
+_fetcher = None
+
+_fetcher_lock = threading.Lock()
+
+logger = getLogger(__name__)
+
+
+def _get_cache_path():
+    cache_home = os.environ.get('XDG_CACHE_HOME')
+    if cache_home is None and os.name == 'nt':
+        cache_home = os.environ.get('LOCALAPPDATA')
+    if cache_home is None:
+        cache_home = os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'svgpy', _CACHE_DIRNAME)
+
+
+def _get_header(headers, name):
+    name = name.lower()
+    for key, value in headers:
+        if key.lower() == name:
+            return value
+    return None
+
+
+def _make_message(headers):
+    message = http.client.HTTPMessage()
+    for key, value in headers:
+        message[key] = value
+    return message
+
+
+def _parse_cache_control(value):
+    directives = dict()
+    if value is None:
+        return directives
+    for directive in value.split(','):
+        name, _, argument = directive.strip().partition('=')
+        if len(name) > 0:
+            directives[name.lower()] = argument.strip().strip('"')
+    return directives
+
+
+def _parse_http_date(value):
+    if value is None:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+def _read_file(path):
+    # the unbuffered read allocates the content once from the file size
+    with open(path, 'rb', buffering=0) as fp:
+        return fp.read()
+
+
+def get_fetcher():
+    """Returns the fetcher that is used by svgpy.utils.load().
+    The default fetcher is a DefaultFetcher object without the on-disk HTTP
+    cache. To enable the cache, e.g.:
+
+        >>> set_fetcher(DefaultFetcher(cache=HTTPCache()))
+
+    Returns:
+        Fetcher: The current fetcher.
+    """
+    global _fetcher
+    with _fetcher_lock:
+        if _fetcher is None:
+            _fetcher = DefaultFetcher()
+        return _fetcher
+
+
+def set_fetcher(fetcher):
+    """Replaces the fetcher that is used by svgpy.utils.load().
+
+    Arguments:
+        fetcher (Fetcher): A new fetcher, or None to restore the default
+            fetcher.
+    Returns:
+        Fetcher: The previous fetcher, or None if the default fetcher was
+            not created yet.
+    """
+    global _fetcher
+    if fetcher is not None and not isinstance(fetcher, Fetcher):
+        raise TypeError('Expected Fetcher, got {}'.format(type(fetcher)))
+    with _fetcher_lock:
+        previous = _fetcher
+        _fetcher = fetcher
+    return previous
+
+
+class Fetcher(ABC):
+    """Abstract base class for fetching the external resources."""
+
+    def close(self):
+        """Releases the resources held by the fetcher."""
+        pass
+
+    @abstractmethod
+    def fetch(self, url, headers=None, timeout=None):
+        """Fetches the resource, and returns the content and the response
+        headers.
+
+        Arguments:
+            url (URL): The location of the resource.
+            headers (dict, optional): The request headers.
+            timeout (float, optional): The timeout in seconds for blocking
+                operations.
+        Returns:
+            tuple[bytes, list[tuple[str, str]]]: The content and the response
+                headers.
+        Raises:
+            urllib.error.HTTPError: If the server returns an error status, or
+                the 304 status for the conditional request headers.
+            urllib.error.URLError: If the resource cannot be fetched.
+        """
+        raise NotImplementedError
+
+
+class DefaultFetcher(Fetcher):
+    """A fetcher that reads 'file:' URLs directly, and 'http:' and 'https:'
+    URLs with persistent (keep-alive) connections and an optional on-disk
+    HTTP cache. Other URLs are opened with urllib.request.urlopen().
+    """
+
+    MAX_IDLE_CONNECTIONS = 4
+    """int: The maximum number of the idle connections per host."""
+
+    def __init__(self, cache=None, timeout=None, context=None):
+        """Constructs a DefaultFetcher object.
+
+        Arguments:
+            cache (HTTPCache, optional): The on-disk HTTP cache.
+            timeout (float, optional): The default timeout in seconds for
+                blocking operations.
+            context (ssl.SSLContext, optional): The SSL context for the
+                'https:' connections.
+        """
+        if cache is not None and not isinstance(cache, HTTPCache):
+            raise TypeError('Expected HTTPCache, got {}'.format(type(cache)))
+        self._cache = cache
+        self._timeout = timeout
+        self._context = context
+        self._connections = dict()
+        self._lock = threading.Lock()
+
+    @property
+    def cache(self):
+        """HTTPCache: The on-disk HTTP cache or None."""
+        return self._cache
+
+    def _acquire(self, key, timeout):
+        with self._lock:
+            idle = self._connections.get(key)
+            if idle:
+                connection = idle.pop()
+                connection.timeout = timeout
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout)
+                return connection, True
+        scheme, host, port = key
+        if scheme == 'https':
+            connection = http.client.HTTPSConnection(
+                host, port, timeout=timeout, context=self._context)
+        else:
+            connection = http.client.HTTPConnection(host, port,
+                                                    timeout=timeout)
+        return connection, False
+
+    def _release(self, key, connection):
+        with self._lock:
+            idle = self._connections.setdefault(key, list())
+            if len(idle) < DefaultFetcher.MAX_IDLE_CONNECTIONS:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def _request(self, href, headers, timeout):
+        """Sends a GET request, and returns the status code, the reason
+        phrase, the response headers, the content and the final URL.
+        """
+        for _ in range(_MAX_REDIRECTS + 1):
+            components = urlsplit(href)
+            scheme = components.scheme.lower()
+            host = components.hostname
+            proxies = getproxies()
+            if scheme in proxies and not proxy_bypass(host or ''):
+                return self._request_urlopen(href, headers, timeout)
+            target = components.path or '/'
+            if len(components.query) > 0:
+                target += '?' + components.query
+            key = scheme, host, components.port
+            status, reason, response_headers, data = self._send(
+                key, target, headers, timeout)
+            location = _get_header(response_headers, 'Location')
+            if status not in _REDIRECT_CODES or location is None:
+                return status, reason, response_headers, data, href
+            href = urljoin(href, location)
+        raise URLError('too many redirects: {}'.format(href))
+
+    @staticmethod
+    def _request_urlopen(href, headers, timeout):
+        extra = dict() if timeout is None else {'timeout': timeout}
+        try:
+            with urlopen(Request(href, headers=headers), **extra) as response:
+                return (response.status,
+                        response.reason,
+                        response.getheaders(),
+                        response.read(),
+                        response.geturl())
+        except HTTPError as exp:
+            if exp.code != 304:
+                raise
+            return exp.code, exp.reason, list(exp.headers.items()), b'', href
+
+    def _send(self, key, target, headers, timeout):
+        while True:
+            connection, reused = self._acquire(key, timeout)
+            try:
+                connection.request('GET', target, headers=headers)
+                response = connection.getresponse()
+                data = response.read()
+            except (http.client.HTTPException, OSError) as exp:
+                connection.close()
+                if reused:
+                    continue  # closed by the server while idle
+                raise URLError(exp)
+            if response.will_close:
+                connection.close()
+            else:
+                self._release(key, connection)
+            return response.status, response.reason, response.getheaders(), \
+                data
+
+    def close(self):
+        """Closes the idle connections."""
+        with self._lock:
+            connections = self._connections
+            self._connections = dict()
+        for idle in connections.values():
+            for connection in idle:
+                connection.close()
+
+    def fetch(self, url, headers=None, timeout=None):
+        """Fetches the resource, and returns the content and the response
+        headers.
+        See Fetcher.fetch().
+        """
+        if isinstance(url, str):
+            url = URL(url)
+        if timeout is None:
+            timeout = self._timeout
+        scheme = url.protocol
+        if scheme == 'file:' and url.hostname in ('', 'localhost'):
+            return self._fetch_file(url)
+        elif scheme in ('http:', 'https:'):
+            return self._fetch_http(url, headers, timeout)
+        request = Request(url.href, headers=dict(headers or {}))
+        extra = dict() if timeout is None else {'timeout': timeout}
+        with urlopen(request, **extra) as response:
+            return response.read(), response.getheaders()
+
+    @staticmethod
+    def _fetch_file(url):
+        path = url2pathname(url.pathname)
+        try:
+            stat = os.stat(path)
+            data = _read_file(path)
+        except OSError as exp:
+            raise URLError(exp)
+        content_type = mimetypes.guess_type(path)[0]
+        headers = [
+            ('Content-type', content_type or 'text/plain'),
+            ('Content-length', str(stat.st_size)),
+            ('Last-modified', formatdate(stat.st_mtime, usegmt=True)),
+        ]
+        return data, headers
+
+    def _fetch_http(self, url, headers, timeout):
+        href = url.tostring(exclude_fragment=True)
+        request_headers = {'User-Agent': _USER_AGENT}
+        request_headers.update(headers or {})
+        conditional = any(key.lower() in _CONDITIONAL_HEADERS
+                          for key in request_headers)
+        cache = self._cache
+        entry = cache.get(href) if cache is not None else None
+        if entry is not None:
+            if entry.isfresh():
+                if conditional and entry.matches(request_headers):
+                    raise HTTPError(href, 304, 'Not Modified',
+                                    _make_message(entry.headers), None)
+                logger.debug('fresh in cache: \'{}\''.format(href))
+                return entry.read(), entry.headers
+            if not conditional:
+                request_headers.update(entry.get_validators())
+
+        status, reason, response_headers, data, _ = self._request(
+            href, request_headers, timeout)
+        if status == 304:
+            if entry is not None and not conditional:
+                logger.debug('not modified: \'{}\''.format(href))
+                entry = cache.revalidate(entry, response_headers)
+                return entry.read(), entry.headers
+            raise HTTPError(href, status, reason,
+                            _make_message(response_headers), None)
+        elif status >= 400:
+            raise HTTPError(href, status, reason,
+                            _make_message(response_headers), BytesIO(data))
+        if cache is not None and status == 200:
+            cache.put(href, request_headers, response_headers, data)
+        return data, response_headers
+
+
+class HTTPCache(object):
+    """An on-disk cache of the HTTP responses, that follows the
+    Cache-Control, Expires, ETag and Last-Modified response headers.
+    The entries are not evicted; see also HTTPCache.clear().
+    """
+
+    def __init__(self, directory=None):
+        """Constructs an HTTPCache object.
+
+        Arguments:
+            directory (str, optional): The cache directory. Defaults to
+                'svgpy/http' in the user's cache directory.
+        """
+        self._directory = (directory if directory is not None
+                           else _get_cache_path())
+
+    @property
+    def directory(self):
+        """str: The cache directory."""
+        return self._directory
+
+    def _get_paths(self, href):
+        key = hashlib.sha1(href.encode('utf-8')).hexdigest()
+        path = os.path.join(self._directory, key[:2], key)
+        return path + '.json', path + '.body'
+
+    def _write(self, path, data):
+        tmp_path = '{}.{}.{}.tmp'.format(path, os.getpid(),
+                                         threading.get_ident())
+        with open(tmp_path, 'wb') as fp:
+            fp.write(data)
+        os.replace(tmp_path, path)
+
+    def clear(self):
+        """Removes all entries from the cache."""
+        if not os.path.isdir(self._directory):
+            return
+        for root, _, filenames in os.walk(self._directory):
+            for filename in filenames:
+                if filename.endswith(('.json', '.body')):
+                    try:
+                        os.remove(os.path.join(root, filename))
+                    except OSError:
+                        pass
+
+    def get(self, href):
+        """Returns the cache entry of the URL.
+
+        Arguments:
+            href (str): The URL without the fragment.
+        Returns:
+            HTTPCacheEntry: The cache entry, or None if not found.
+        """
+        meta_path, body_path = self._get_paths(href)
+        try:
+            with open(meta_path, encoding='utf-8') as fp:
+                meta = json.load(fp)
+        except (OSError, ValueError):
+            return None
+        if (not isinstance(meta, dict)
+                or meta.get('url') != href
+                or not os.path.isfile(body_path)):
+            return None
+        return HTTPCacheEntry(meta, body_path)
+
+    def put(self, href, request_headers, response_headers, data):
+        """Stores the response in the cache, if it is cacheable.
+
+        Arguments:
+            href (str): The URL without the fragment.
+            request_headers (dict): The request headers.
+            response_headers (list[tuple[str, str]]): The response headers.
+            data (bytes): The content.
+        Returns:
+            HTTPCacheEntry: The cache entry, or None if not stored.
+        """
+        request_directives = _parse_cache_control(
+            _get_header(request_headers.items(), 'Cache-Control'))
+        directives = _parse_cache_control(
+            _get_header(response_headers, 'Cache-Control'))
+        if ('no-store' in request_directives
+                or 'no-store' in directives
+                or (_get_header(response_headers, 'Vary') or '').strip()
+                == '*'):
+            return None
+        meta = HTTPCacheEntry.create_meta(href, response_headers)
+        if meta['lifetime'] <= 0 and meta['etag'] is None \
+                and meta['last_modified'] is None:
+            return None  # neither fresh nor revalidatable
+        meta_path, body_path = self._get_paths(href)
+        try:
+            os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+            self._write(body_path, data)
+            self._write(meta_path, json.dumps(meta).encode('utf-8'))
+        except OSError as exp:
+            logger.info('failed to write cache: \'{}\': {}'.format(
+                href, repr(exp)))
+            return None
+        return HTTPCacheEntry(meta, body_path)
+
+    def revalidate(self, entry, response_headers):
+        """Updates the cache entry with the headers of the 304 (Not Modified)
+        response.
+
+        Arguments:
+            entry (HTTPCacheEntry): The cache entry.
+            response_headers (list[tuple[str, str]]): The response headers.
+        Returns:
+            HTTPCacheEntry: The updated cache entry.
+        """
+        headers = dict((key.lower(), (key, value))
+                       for key, value in entry.headers)
+        for key, value in response_headers:
+            headers[key.lower()] = key, value
+        meta = HTTPCacheEntry.create_meta(entry.url, list(headers.values()))
+        if (meta['lifetime'] <= 0
+                and entry.get_validators()
+                == HTTPCacheEntry(meta, None).get_validators()):
+            return entry  # must be revalidated every time anyway
+        meta_path, _ = self._get_paths(entry.url)
+        try:
+            self._write(meta_path, json.dumps(meta).encode('utf-8'))
+        except OSError as exp:
+            logger.info('failed to write cache: \'{}\': {}'.format(
+                entry.url, repr(exp)))
+        return HTTPCacheEntry(meta, entry.body_path)
+
+
+class HTTPCacheEntry(object):
+    """Represents an entry of the HTTPCache."""
+
+    def __init__(self, meta, body_path):
+        """Constructs an HTTPCacheEntry object.
+
+        Arguments:
+            meta (dict): The metadata of the entry.
+            body_path (str): The path of the content.
+        """
+        self._meta = meta
+        self._body_path = body_path
+
+    @property
+    def body_path(self):
+        """str: The path of the content."""
+        return self._body_path
+
+    @property
+    def headers(self):
+        """list[tuple[str, str]]: The response headers."""
+        return [tuple(header) for header in self._meta['headers']]
+
+    @property
+    def url(self):
+        """str: The URL of the entry."""
+        return self._meta['url']
+
+    @staticmethod
+    def create_meta(href, response_headers):
+        """Creates the metadata of the entry from the response headers.
+
+        Arguments:
+            href (str): The URL without the fragment.
+            response_headers (list[tuple[str, str]]): The response headers.
+        Returns:
+            dict: The metadata.
+        """
+        now = time.time()
+        directives = _parse_cache_control(
+            _get_header(response_headers, 'Cache-Control'))
+        lifetime = 0
+        if 'no-cache' not in directives:
+            if 'max-age' in directives:
+                try:
+                    lifetime = int(directives['max-age'])
+                except ValueError:
+                    lifetime = 0
+            else:
+                expires = _parse_http_date(
+                    _get_header(response_headers, 'Expires'))
+                date = _parse_http_date(
+                    _get_header(response_headers, 'Date'))
+                if expires is not None:
+                    lifetime = expires - (date if date is not None else now)
+        try:
+            age = int(_get_header(response_headers, 'Age') or 0)
+        except ValueError:
+            age = 0
+        return {
+            'url': href,
+            'headers': [list(header) for header in response_headers],
+            'stored': now - max(age, 0),
+            'lifetime': lifetime,
+            'etag': _get_header(response_headers, 'ETag'),
+            'last_modified': _get_header(response_headers, 'Last-Modified'),
+        }
+
+    def get_validators(self):
+        """Returns the conditional request headers of the entry.
+
+        Returns:
+            dict: The conditional request headers.
+        """
+        validators = dict()
+        if self._meta['etag'] is not None:
+            validators['If-None-Match'] = self._meta['etag']
+        if self._meta['last_modified'] is not None:
+            validators['If-Modified-Since'] = self._meta['last_modified']
+        return validators
+
+    def isfresh(self):
+        """Returns True if the entry can be used without revalidation."""
+        return time.time() - self._meta['stored'] < self._meta['lifetime']
+
+    def matches(self, request_headers):
+        """Returns True if the conditional request headers match the entry.
+        """
+        etag = _get_header(request_headers.items(), 'If-None-Match')
+        if etag is not None:
+            return etag == self._meta['etag']
+        last_modified = _get_header(request_headers.items(),
+                                    'If-Modified-Since')
+        return (last_modified is not None
+                and last_modified == self._meta['last_modified'])
+
+    def read(self):
+        """Reads the content of the entry.
+
+        Returns:
+            bytes: The content.
+        """
+        return _read_file(self._body_path)
@@ -13,9 +13,7 @@
 # limitations under the License.
 
 
-from cffi import FFI
-
-from ._ffi_api import dlopen
+from ._ffi_api import LazyFFI, LazyLibrary, lazy_class_attribute
 
 _API = r"""
 /*
@@ -113,11 +111,10 @@ int FcWeightFromOpenType(int ot_weight);
 int FcWeightToOpenType(int fc_weight);
 """
 
-ffi = FFI()
-ffi.cdef(_API)
-del _API
+ffi = LazyFFI(_API, compiled='_fontconfig_cffi')
 
-lib = dlopen(ffi, ['fontconfig', 'libfontconfig-1'])
+lib = LazyLibrary(ffi, ['fontconfig', 'libfontconfig-1'],
+                  compiled='_fontconfig_cffi')
 
 
 class FontConfig(object):
@@ -189,7 +186,9 @@ class FontConfig(object):
         215: 1000,  # extra black/ultra black
     }
 
-    version = lib.FcGetVersion()
+    @lazy_class_attribute
+    def version():
+        return lib.FcGetVersion()
 
     @staticmethod
     def get_config_files():
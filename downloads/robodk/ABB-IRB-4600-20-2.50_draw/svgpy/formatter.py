@@ -13,32 +13,269 @@
 # limitations under the License.
 
 
+from io import StringIO
+from itertools import cycle
+
+import numpy as np
+
 precision = 6
 """int: The precision is a decimal number indicating how many digits should
 be displayed after the decimal point for a floating point value.
 The precision must be greater than zero.
 """
 
+# Shorter sequences are formatted one by one, since the fixed cost of the
+# array operations exceeds the cost of formatting them.
+_ARRAY_FORMAT_THRESHOLD = 128
+
+_CHUNK_SIZE = 1 << 16
+
+_MAX_SAFE_INTEGER = 2 ** 53
+
+
+def _pack_words(rows):
+    return np.array(rows, dtype=np.uint8).view(np.uint32).ravel()
+
+
+# The digits of the numbers from 0 to 999 are packed into the 4-byte words
+# after a leading byte, so that the numbers are formatted three digits at a
+# time. The leading byte is a sign, a decimal point or a padding.
+_DIGIT_GROUPS, _SIGNED_DIGIT_GROUPS, _DOTTED_DIGIT_GROUPS = (
+    _pack_words([[c] + list('{:03d}'.format(x).encode()) for x in range(1000)])
+    for c in (0, ord('-'), ord('.')))
+_DIGIT_COUNTS = np.array([len(str(x)) if x else 0 for x in range(1000)])
+_SIGNIFICANT_DIGITS = np.array(
+    [len('{:03d}'.format(x).rstrip('0')) for x in range(1000)])
+
+# The masks of the words that select the last n digits of the integer part
+# (after the sign if n + 4 is given), the first n digits of the fractional
+# part (after the decimal point if any), and the separator.
+_INTEGER_MASKS = _pack_words([[sign] + [0] * (3 - n) + [1] * n
+                              for sign in (0, 1) for n in range(4)])
+_DOTTED_MASKS = _pack_words([[int(n > 0)] + [1] * n + [0] * (3 - n)
+                             for n in range(4)])
+_FRACTION_MASKS = _pack_words([[0] + [1] * n + [0] * (3 - n)
+                               for n in range(4)])
+_SEPARATOR_MASK = _pack_words([[1, 0, 0, 0]])[0]
+
+
+def _format_number(x):
+    number = '{:.{}f}'.format(x, precision).rstrip('0').rstrip('.')
+    return number if number != '-0' else '0'
+
+
+def _format_number_array(values, separators):
+    """Formats the numbers at once, by converting them to the fixed-point
+    integers and laying out their digits in a character table.
+    Each number is followed by its separator.
+
+    Arguments:
+        values (numpy.ndarray): A non-empty 1-dimensional array of the
+            numbers.
+        separators (int, numpy.ndarray): The separator code for each
+            number.
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: The character codes of the
+            formatted numbers and the number of characters of each number,
+            including its separator. Returns None if any number is not
+            finite or is too large to be represented exactly.
+    """
+    scale = 10 ** precision
+    magnitudes = np.abs(values)
+    if not np.all(magnitudes < _MAX_SAFE_INTEGER / scale):
+        return None
+    scaled = magnitudes * scale
+    fixed = np.rint(scaled)
+    # The product may have been rounded across a halfway point, so round
+    # those numbers from their exact binary values.
+    ties = np.nonzero(np.abs(scaled - fixed)
+                      >= 0.5 - np.spacing(scaled.max()))[0]
+    fixed = fixed.astype(np.int64)
+    for index in ties.tolist():
+        number = '{:.{}f}'.format(magnitudes[index], precision)
+        fixed[index] = int(number.replace('.', ''))
+    integers = fixed // scale
+    fractions = fixed - integers * scale
+    signs = (values < 0) & (fixed != 0)
+
+    # The table is laid out row by row, one row for each number, in the
+    # 4-byte words of the groups of three digits of the integer part, the
+    # ones of the fractional part and the separator. The number of digits
+    # of each part is the largest one among the non-zero groups.
+    int_groups = (len(str(int(integers.max()))) + 2) // 3
+    frac_groups = (precision + 2) // 3
+    int_width = 3 * int_groups
+    frac_width = 3 * frac_groups
+    fractions *= 10 ** (frac_width - precision)
+    size = len(values)
+    table = np.empty((size, int_groups + frac_groups + 1), dtype=np.uint32)
+    mask = np.empty(table.shape, dtype=np.uint32)
+    int_digits = np.ones(size, dtype=np.int64)
+    for word in range(int_groups - 1, -1, -1):
+        quotients = integers // 1000
+        groups = integers - quotients * 1000
+        integers = quotients
+        table[:, word] = (_DIGIT_GROUPS if word > 0
+                          else _SIGNED_DIGIT_GROUPS)[groups]
+        shift = int_width - 3 * word - 3
+        np.maximum(int_digits, (_DIGIT_COUNTS + shift * (_DIGIT_COUNTS > 0))[
+            groups], out=int_digits)
+    frac_digits = np.zeros(size, dtype=np.int64)
+    for word in range(frac_groups - 1, -1, -1):
+        quotients = fractions // 1000
+        groups = fractions - quotients * 1000
+        fractions = quotients
+        table[:, int_groups + word] = (_DIGIT_GROUPS if word > 0
+                                       else _DOTTED_DIGIT_GROUPS)[groups]
+        shift = 3 * word
+        np.maximum(frac_digits, (_SIGNIFICANT_DIGITS + shift * (
+            _SIGNIFICANT_DIGITS > 0))[groups], out=frac_digits)
+
+    digits = np.arange(int_width + 1)
+    for word in range(int_groups):
+        counts = np.clip(digits - (int_width - 3 * word - 3), 0, 3)
+        if word > 0:
+            mask[:, word] = _INTEGER_MASKS[counts][int_digits]
+        else:
+            mask[:, word] = _INTEGER_MASKS[np.concatenate(
+                (counts, counts + 4))][int_digits + signs * (int_width + 1)]
+    digits = np.arange(frac_width + 1)
+    for word in range(frac_groups):
+        mask[:, int_groups + word] = (_FRACTION_MASKS if word > 0
+                                      else _DOTTED_MASKS)[
+            np.clip(digits - 3 * word, 0, 3)][frac_digits]
+    table[:, -1] = _SEPARATOR_MASK * separators
+    mask[:, -1] = _SEPARATOR_MASK
+    lengths = signs + int_digits + (frac_digits != 0) + frac_digits + 1
+    return np.compress(mask.view(bool).ravel(),
+                       table.view(np.uint8).ravel()), lengths
+
+
+def _format_numbers(values, separators):
+    """Formats the numbers into a string.
+
+    Arguments:
+        values (numpy.ndarray): A 1-dimensional array of the numbers.
+        separators (str): The separators that are used in turn between the
+            numbers.
+    Returns:
+        str: The formatted numbers.
+    """
+    codes = np.frombuffer(separators.encode('ascii'), dtype=np.uint8)
+    chunk_size = _CHUNK_SIZE - _CHUNK_SIZE % len(codes)
+    out = StringIO()
+    for start in range(0, len(values), chunk_size):
+        chunk = values[start:start + chunk_size]
+        formatted = _format_number_array(
+            chunk, np.tile(codes, len(chunk) // len(codes) + 1)[:len(chunk)])
+        if formatted is not None:
+            out.write(formatted[0].tobytes().decode('ascii'))
+            continue
+        for x, separator in zip(chunk.tolist(), cycle(separators)):
+            out.write(_format_number(x))
+            out.write(separator)
+    return out.getvalue()[:-1]
+
 
 def format_number_sequence(s):
-    number_sequence = [
-        '{:.{precision}f}'.format(
-            x, precision=precision).rstrip('0').rstrip('.')
-        for x in iter(s)]
-    number_sequence = [x if x != '-0' else '0' for x in iter(number_sequence)]
-    return number_sequence
+    """Formats the numbers with `precision` digits after the decimal point,
+    removing the trailing zeros.
+
+    Arguments:
+        s (list[float], numpy.ndarray): A sequence of the numbers.
+    Returns:
+        list[str]: A list of the formatted numbers.
+    Examples:
+        >>> format_number_sequence([10.5, -0.0, 1 / 3])
+        ['10.5', '0', '0.333333']
+    """
+    if not isinstance(s, np.ndarray):
+        s = list(s)
+    if len(s) < _ARRAY_FORMAT_THRESHOLD:
+        return [_format_number(x) for x in s]
+    values = np.asarray(s, dtype=float).ravel()
+    return _format_numbers(values, ' ').split(' ')
 
 
 def format_coordinate_pair_sequence(s):
-    number_sequence = list()
-    for x, y in iter(s):
-        number_sequence.extend([x, y])
-    number_sequence = format_number_sequence(number_sequence)
-    coordinate_pair_sequence = list()
-    for index in range(0, len(number_sequence), 2):
-        coordinate_pair_sequence.append(','.join([number_sequence[index],
-                                                  number_sequence[index + 1]]))
-    return ' '.join(coordinate_pair_sequence)
+    """Formats the points as a list of the coordinate pairs.
+
+    Arguments:
+        s (list[tuple[float, float]], numpy.ndarray): A sequence of the
+            points (x, y).
+    Returns:
+        str: The coordinate pairs that are separated by whitespace.
+    Examples:
+        >>> format_coordinate_pair_sequence([(0, 0.5), (10, 20)])
+        '0,0.5 10,20'
+    """
+    if not isinstance(s, np.ndarray):
+        s = list(s)
+    if len(s) * 2 < _ARRAY_FORMAT_THRESHOLD:
+        return ' '.join(_format_number(x) + ',' + _format_number(y)
+                        for x, y in s)
+    values = np.asarray(s, dtype=float).ravel()
+    return _format_numbers(values, ', ')
+
+
+def format_command_sequence(commands, counts, values):
+    """Formats the commands followed by their parameters, such as the path
+    data.
+
+    Arguments:
+        commands (list[str], str): A sequence of the command letters.
+        counts (list[int], numpy.ndarray): The number of parameters of each
+            command.
+        values (list[float], numpy.ndarray): The parameters of all commands.
+    Returns:
+        str: The commands that are separated by whitespace.
+    Examples:
+        >>> format_command_sequence('MLZ', [2, 2, 0], [0, 0, 10.5, -0.0])
+        'M0 0 L10.5 0 Z'
+    """
+    if not isinstance(values, np.ndarray):
+        values = list(values)
+    if len(values) < _ARRAY_FORMAT_THRESHOLD:
+        numbers = [_format_number(x) for x in values]
+        items = list()
+        index = 0
+        for command, count in zip(commands, counts):
+            if count == 0:
+                items.append(command)
+                continue
+            items.append(command + numbers[index])
+            items.extend(numbers[index + 1:index + count])
+            index += count
+        return ' '.join(items)
+
+    values = np.asarray(values, dtype=float).ravel()
+    chars = list()
+    lengths = list()
+    for start in range(0, len(values), _CHUNK_SIZE):
+        chunk = values[start:start + _CHUNK_SIZE]
+        formatted = _format_number_array(chunk, ord(' '))
+        if formatted is None:
+            numbers = [_format_number(x) + ' ' for x in chunk.tolist()]
+            formatted = (np.frombuffer(''.join(numbers).encode('ascii'),
+                                       dtype=np.uint8),
+                         np.array([len(number) for number in numbers]))
+        chars.append(formatted[0])
+        lengths.append(formatted[1])
+    chars = np.concatenate(chars)
+    offsets = np.concatenate(([0], np.cumsum(np.concatenate(lengths))))
+
+    # Each command is inserted before its first parameter, and a command
+    # without parameters is followed by a space.
+    counts = np.asarray(counts, dtype=np.int64)
+    empty = counts == 0
+    sizes = empty + 1
+    positions = np.repeat(offsets[np.cumsum(counts) - counts], sizes)
+    letters = np.repeat(
+        np.frombuffer(''.join(commands).encode('ascii'), dtype=np.uint8),
+        sizes)
+    letters[(np.cumsum(sizes) - 1)[empty]] = ord(' ')
+    return np.insert(chars, positions, letters).tobytes().decode(
+        'ascii')[:-1]
 
 
 def to_coordinate_pair_sequence(s):
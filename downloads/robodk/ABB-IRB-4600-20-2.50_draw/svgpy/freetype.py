@@ -18,10 +18,10 @@ import math
 
 import numpy as np
 
-from ._ffi_api import dlopen, ffi
+from ._ffi_api import LazyLibrary, ffi, lazy_class_attribute
 from .geometry.rect import DOMRect
 
-lib = dlopen(ffi, ['freetype'])
+lib = LazyLibrary(ffi, ['freetype'], compiled='_ffi_api_cffi')
 
 
 def matrix2d(a, b, c, d):
@@ -372,7 +372,11 @@ class FTFace(object):
 
     @staticmethod
     def new_memory_face(file_base, file_size=0, face_index=0):
-        memory_base = ffi.new('FT_Byte[]', file_base)
+        if isinstance(file_base, bytes):
+            memory_base = ffi.new('FT_Byte[]', file_base)
+        else:
+            # e.g. mmap.mmap object, without copying
+            memory_base = ffi.from_buffer('FT_Byte[]', file_base)
         if file_size <= 0:
             file_size = len(file_base)
         face = ffi.new('FT_Face *')
@@ -733,7 +737,9 @@ class FreeType(object):
     TT_MS_ID_JOHAB = 6
     TT_MS_ID_UCS_4 = 10
 
-    library = FTLibrary()
+    @lazy_class_attribute
+    def library():
+        return FTLibrary()
 
 
 class FTOutline(object):
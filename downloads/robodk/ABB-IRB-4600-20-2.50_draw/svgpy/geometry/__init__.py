@@ -14,4 +14,4 @@
 
 
 from .matrix import DOMMatrix, DOMMatrixReadOnly
-from .rect import DOMRect, DOMRectReadOnly
+from .rect import DOMRect, DOMRectArray, DOMRectReadOnly
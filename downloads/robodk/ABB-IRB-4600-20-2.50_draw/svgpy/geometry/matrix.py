@@ -82,7 +82,13 @@ def matrix3d(m11, m12, m13, m14,
 
 
 class DOMMatrixReadOnly(object):
-    """Represents the [geometry] DOMMatrixReadOnly."""
+    """Represents the [geometry] DOMMatrixReadOnly.
+
+    A 2d matrix is held as the six components a, b, c, d, e and f, and
+    is promoted to a 4x4 matrix only when a 3d operation is applied.
+    """
+
+    __slots__ = ('_a', '_b', '_c', '_d', '_e', '_f', '_matrix', '_is2d')
 
     def __init__(self, values=None, **init):
         """Constructs a DOMMatrixReadOnly object.
@@ -125,6 +131,12 @@ class DOMMatrixReadOnly(object):
             >>> m.tolist()
             [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 100.0, -200.0, 0.0, 1.0]
         """
+        self._a = 1.0
+        self._b = 0.0
+        self._c = 0.0
+        self._d = 1.0
+        self._e = 0.0
+        self._f = 0.0
         self._matrix = None
         self._is2d = None
         if values is not None:
@@ -135,7 +147,11 @@ class DOMMatrixReadOnly(object):
     def __eq__(self, other):
         if not isinstance(other, DOMMatrixReadOnly):
             return NotImplemented
-        return (self._matrix == other.matrix).all()
+        if self._matrix is None and other._matrix is None:
+            return ((self._a, self._b, self._c, self._d, self._e, self._f)
+                    == (other._a, other._b, other._c, other._d, other._e,
+                        other._f))
+        return (self.matrix == other.matrix).all()
 
     def __imul__(self, other):
         return None
@@ -150,36 +166,48 @@ class DOMMatrixReadOnly(object):
     def __repr__(self):
         return '<{}.{} object at {} {}>'.format(
             type(self).__module__, type(self).__name__, hex(id(self)),
-            self._matrix.tolist())
+            self.matrix.tolist())
 
     @property
     def a(self):
         """float: The a component of the matrix."""
+        if self._matrix is None:
+            return self._a
         return self._matrix[0, 0]
 
     @property
     def b(self):
         """float: The b component of the matrix."""
+        if self._matrix is None:
+            return self._b
         return self._matrix[1, 0]
 
     @property
     def c(self):
         """float: The c component of the matrix."""
+        if self._matrix is None:
+            return self._c
         return self._matrix[0, 1]
 
     @property
     def d(self):
         """float: The d component of the matrix."""
+        if self._matrix is None:
+            return self._d
         return self._matrix[1, 1]
 
     @property
     def e(self):
         """float: The e component of the matrix."""
+        if self._matrix is None:
+            return self._e
         return self._matrix[0, 3]
 
     @property
     def f(self):
         """float: The f component of the matrix."""
+        if self._matrix is None:
+            return self._f
         return self._matrix[1, 3]
 
     @property
@@ -209,91 +237,130 @@ class DOMMatrixReadOnly(object):
     @property
     def m11(self):
         """float: The m11 component of the matrix."""
+        if self._matrix is None:
+            return self._a
         return self._matrix[0, 0]
 
     @property
     def m12(self):
         """float: The m12 component of the matrix."""
+        if self._matrix is None:
+            return self._b
         return self._matrix[1, 0]
 
     @property
     def m13(self):
         """float: The m13 component of the matrix."""
+        if self._matrix is None:
+            return 0.0
         return self._matrix[2, 0]
 
     @property
     def m14(self):
         """float: The m14 component of the matrix."""
+        if self._matrix is None:
+            return 0.0
         return self._matrix[3, 0]
 
     @property
     def m21(self):
         """float: The m21 component of the matrix."""
+        if self._matrix is None:
+            return self._c
         return self._matrix[0, 1]
 
     @property
     def m22(self):
         """float: The m22 component of the matrix."""
+        if self._matrix is None:
+            return self._d
         return self._matrix[1, 1]
 
     @property
     def m23(self):
         """float: The m23 component of the matrix."""
+        if self._matrix is None:
+            return 0.0
         return self._matrix[2, 1]
 
     @property
     def m24(self):
         """float: The m24 component of the matrix."""
+        if self._matrix is None:
+            return 0.0
         return self._matrix[3, 1]
 
     @property
     def m31(self):
         """float: The m31 component of the matrix."""
+        if self._matrix is None:
+            return 0.0
         return self._matrix[0, 2]
 
     @property
     def m32(self):
         """float: The m32 component of the matrix."""
+        if self._matrix is None:
+            return 0.0
         return self._matrix[1, 2]
 
     @property
     def m33(self):
         """float: The m33 component of the matrix."""
+        if self._matrix is None:
+            return 1.0
         return self._matrix[2, 2]
 
     @property
     def m34(self):
         """float: The m34 component of the matrix."""
+        if self._matrix is None:
+            return 0.0
         return self._matrix[3, 2]
 
     @property
     def m41(self):
         """float: The m41 component of the matrix."""
+        if self._matrix is None:
+            return self._e
         return self._matrix[0, 3]
 
     @property
     def m42(self):
         """float: The m42 component of the matrix."""
+        if self._matrix is None:
+            return self._f
         return self._matrix[1, 3]
 
     @property
     def m43(self):
         """float: The m43 component of the matrix."""
+        if self._matrix is None:
+            return 0.0
         return self._matrix[2, 3]
 
     @property
     def m44(self):
+        if self._matrix is None:
+            return 1.0
         return self._matrix[3, 3]
 
     @property
     def matrix(self):
-        """numpy.array: The current matrix."""
-        return self._matrix
+        """numpy.array: The current matrix. The array is read-only; use the
+        component attributes or the DOMMatrix methods to modify the matrix.
+        """
+        if self._matrix is None:
+            matrix = matrix2d(self._a, self._b, self._c, self._d, self._e,
+                              self._f)
+        else:
+            matrix = self._matrix.view()
+        matrix.setflags(write=False)
+        return matrix
 
     def _init_from_array(self, values):
         if len(values) == 6:
-            self._matrix = matrix2d(*values)
-            self._is2d = True
+            self._set_matrix2d(*values)
         elif len(values) == 16:
             self._matrix = matrix3d(*values)
             self._is2d = False
@@ -303,8 +370,7 @@ class DOMMatrixReadOnly(object):
 
     def _init_from_matrix(self, **init):
         if len(init) == 0:
-            self._matrix = matrix2d(1, 0, 0, 1, 0, 0)
-            self._is2d = True
+            self._set_matrix2d(1, 0, 0, 1, 0, 0)
             return
         a = init.pop('a', None)
         m11 = init.pop('m11', None)
@@ -387,8 +453,7 @@ class DOMMatrixReadOnly(object):
                     or (m44 is not None and m44 != 1)):
                 raise ValueError('Invalid keyword argument(s) for a 2d matrix')
         if is2d is None or is2d:
-            self._matrix = matrix2d(m11, m12, m21, m22, m41, m42)
-            self._is2d = True
+            self._set_matrix2d(m11, m12, m21, m22, m41, m42)
         else:
             if m13 is None:
                 m13 = 0
@@ -416,6 +481,22 @@ class DOMMatrixReadOnly(object):
                                     m41, m42, m43, m44)
             self._is2d = False
 
+    def _promote(self):
+        # converts a 2d matrix into a 4x4 matrix
+        if self._matrix is None:
+            self._matrix = matrix2d(self._a, self._b, self._c, self._d,
+                                    self._e, self._f)
+
+    def _set_matrix2d(self, a, b, c, d, e, f):
+        self._a = float(a)
+        self._b = float(b)
+        self._c = float(c)
+        self._d = float(d)
+        self._e = float(e)
+        self._f = float(f)
+        self._matrix = None
+        self._is2d = True
+
     def flip_x(self):
         """Post-multiplies the transformation [-1 0 0 1 0 0] on the current
         matrix and returns the resulting matrix.
@@ -693,12 +774,55 @@ class DOMMatrixReadOnly(object):
         Returns:
              tuple[float, ...]: The resulting coordinates.
         """
+        if self._matrix is None:
+            x = float(x)
+            y = float(y)
+            if z == 0 and w == 1:
+                return (self._a * x + self._c * y + self._e,
+                        self._b * x + self._d * y + self._f)
+            w = float(w)
+            return (self._a * x + self._c * y + self._e * w,
+                    self._b * x + self._d * y + self._f * w,
+                    float(z),
+                    w)
         pt = np.array([[float(x)], [float(y)], [float(z)], [float(w)]])
         pt = np.dot(self._matrix, pt)
         if self._is2d and z == 0 and w == 1:
             return pt.item(0), pt.item(1)
         return pt.item(0), pt.item(1), pt.item(2), pt.item(3)
 
+    def transform_points(self, points):
+        """Post-multiplies the transformation on each point of an array and
+        returns the resulting points.
+
+        Arguments:
+            points (numpy.ndarray): An array of points (x, y) with shape
+                (N, 2), or homogeneous points (x, y, z[, w]) with shape
+                (N, 3) or (N, 4).
+        Returns:
+            numpy.ndarray: An array of the resulting points, with the same
+                shape as points.
+        Examples:
+            >>> m = DOMMatrix([2, 0, 0, 2, 10, 20])
+            >>> m.transform_points([[0, 0], [1, 1]]).tolist()
+            [[10.0, 20.0], [12.0, 22.0]]
+        """
+        points = np.asarray(points, dtype=float)
+        if points.ndim != 2 or points.shape[1] not in (2, 3, 4):
+            raise ValueError('Expected an array of shape (N, 2), (N, 3) or'
+                             ' (N, 4), got {}'.format(points.shape))
+        columns = points.shape[1]
+        if self._matrix is None and columns == 2:
+            return (np.dot(points, np.array([[self._a, self._b],
+                                             [self._c, self._d]]))
+                    + np.array([self._e, self._f]))
+        homogeneous = np.zeros((points.shape[0], 4))
+        homogeneous[:, :columns] = points
+        if columns < 4:
+            homogeneous[:, 3] = 1
+        homogeneous = np.dot(homogeneous, self.matrix.T)
+        return homogeneous[:, :columns]
+
     def translate(self, tx=0, ty=0, tz=0):
         """Post-multiplies a translation transformation on the current matrix
         and returns the resulting matrix.
@@ -720,6 +844,8 @@ class DOMMatrix(DOMMatrixReadOnly):
     # TODO: implement DOMMatrix.setMatrixValue().
     """Represents the [geometry] DOMMatrix."""
 
+    __slots__ = ()
+
     def __init__(self, values=None, **init):
         """Constructs a DOMMatrix object.
 
@@ -762,116 +888,196 @@ class DOMMatrix(DOMMatrixReadOnly):
     def __repr__(self):
         return '<{}.{} object at {} {}>'.format(
             type(self).__module__, type(self).__name__, hex(id(self)),
-            self._matrix.tolist())
+            self.matrix.tolist())
 
     @DOMMatrixReadOnly.a.setter
     def a(self, value):
-        self._matrix[0, 0] = float(value)
+        if self._matrix is None:
+            self._a = float(value)
+        else:
+            self._matrix[0, 0] = float(value)
 
     @DOMMatrixReadOnly.b.setter
     def b(self, value):
-        self._matrix[1, 0] = float(value)
+        if self._matrix is None:
+            self._b = float(value)
+        else:
+            self._matrix[1, 0] = float(value)
 
     @DOMMatrixReadOnly.c.setter
     def c(self, value):
-        self._matrix[0, 1] = float(value)
+        if self._matrix is None:
+            self._c = float(value)
+        else:
+            self._matrix[0, 1] = float(value)
 
     @DOMMatrixReadOnly.d.setter
     def d(self, value):
-        self._matrix[1, 1] = float(value)
+        if self._matrix is None:
+            self._d = float(value)
+        else:
+            self._matrix[1, 1] = float(value)
 
     @DOMMatrixReadOnly.e.setter
     def e(self, value):
-        self._matrix[0, 3] = float(value)
+        if self._matrix is None:
+            self._e = float(value)
+        else:
+            self._matrix[0, 3] = float(value)
 
     @DOMMatrixReadOnly.f.setter
     def f(self, value):
-        self._matrix[1, 3] = float(value)
+        if self._matrix is None:
+            self._f = float(value)
+        else:
+            self._matrix[1, 3] = float(value)
 
     @DOMMatrixReadOnly.m11.setter
     def m11(self, value):
-        self._matrix[0, 0] = float(value)
+        if self._matrix is None:
+            self._a = float(value)
+        else:
+            self._matrix[0, 0] = float(value)
 
     @DOMMatrixReadOnly.m12.setter
     def m12(self, value):
-        self._matrix[1, 0] = float(value)
+        if self._matrix is None:
+            self._b = float(value)
+        else:
+            self._matrix[1, 0] = float(value)
 
     @DOMMatrixReadOnly.m13.setter
     def m13(self, value):
+        if self._matrix is None and not (value):
+            return
+        self._promote()
         self._matrix[2, 0] = float(value)
         if value:
             self._is2d = False
 
     @DOMMatrixReadOnly.m14.setter
     def m14(self, value):
+        if self._matrix is None and not (value):
+            return
+        self._promote()
         self._matrix[3, 0] = float(value)
         if value:
             self._is2d = False
 
     @DOMMatrixReadOnly.m21.setter
     def m21(self, value):
-        self._matrix[0, 1] = float(value)
+        if self._matrix is None:
+            self._c = float(value)
+        else:
+            self._matrix[0, 1] = float(value)
 
     @DOMMatrixReadOnly.m22.setter
     def m22(self, value):
-        self._matrix[1, 1] = float(value)
+        if self._matrix is None:
+            self._d = float(value)
+        else:
+            self._matrix[1, 1] = float(value)
 
     @DOMMatrixReadOnly.m23.setter
     def m23(self, value):
+        if self._matrix is None and not (value):
+            return
+        self._promote()
         self._matrix[2, 1] = float(value)
         if value:
             self._is2d = False
 
     @DOMMatrixReadOnly.m24.setter
     def m24(self, value):
+        if self._matrix is None and not (value):
+            return
+        self._promote()
         self._matrix[3, 1] = float(value)
         if value:
             self._is2d = False
 
     @DOMMatrixReadOnly.m31.setter
     def m31(self, value):
+        if self._matrix is None and not (value):
+            return
+        self._promote()
         self._matrix[0, 2] = float(value)
         if value:
             self._is2d = False
 
     @DOMMatrixReadOnly.m32.setter
     def m32(self, value):
+        if self._matrix is None and not (value):
+            return
+        self._promote()
         self._matrix[1, 2] = float(value)
         if value:
             self._is2d = False
 
     @DOMMatrixReadOnly.m33.setter
     def m33(self, value):
+        if self._matrix is None and not (value != 1):
+            return
+        self._promote()
         self._matrix[2, 2] = float(value)
         if value != 1:
             self._is2d = False
 
     @DOMMatrixReadOnly.m34.setter
     def m34(self, value):
+        if self._matrix is None and not (value):
+            return
+        self._promote()
         self._matrix[3, 2] = float(value)
         if value:
             self._is2d = False
 
     @DOMMatrixReadOnly.m41.setter
     def m41(self, value):
-        self._matrix[0, 3] = float(value)
+        if self._matrix is None:
+            self._e = float(value)
+        else:
+            self._matrix[0, 3] = float(value)
 
     @DOMMatrixReadOnly.m42.setter
     def m42(self, value):
-        self._matrix[1, 3] = float(value)
+        if self._matrix is None:
+            self._f = float(value)
+        else:
+            self._matrix[1, 3] = float(value)
 
     @DOMMatrixReadOnly.m43.setter
     def m43(self, value):
+        if self._matrix is None and not (value):
+            return
+        self._promote()
         self._matrix[2, 3] = float(value)
         if value:
             self._is2d = False
 
     @DOMMatrixReadOnly.m44.setter
     def m44(self, value):
+        if self._matrix is None and not (value != 1):
+            return
+        self._promote()
         self._matrix[3, 3] = float(value)
         if value != 1:
             self._is2d = False
 
+    def _multiply2d_self(self, a, b, c, d, e, f):
+        # post-multiplies a 2d matrix on the current matrix
+        if self._matrix is not None:
+            self._matrix = np.dot(self._matrix, matrix2d(a, b, c, d, e, f))
+            return self
+        sa, sb, sc, sd = self._a, self._b, self._c, self._d
+        self._a = sa * a + sc * b
+        self._b = sb * a + sd * b
+        self._c = sa * c + sc * d
+        self._d = sb * c + sd * d
+        self._e += sa * e + sc * f
+        self._f += sb * e + sd * f
+        return self
+
     def clear(self, is2d=None):
         """Sets the matrix [1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1].
 
@@ -881,6 +1087,9 @@ class DOMMatrix(DOMMatrixReadOnly):
             DOMMatrix: Returns itself.
         """
         _is2d = self._is2d if is2d is None else is2d
+        if _is2d:
+            self._set_matrix2d(1, 0, 0, 1, 0, 0)
+            return self
         self._init_from_array([1, 0, 0, 0,
                                0, 1, 0, 0,
                                0, 0, 1, 0,
@@ -920,6 +1129,19 @@ class DOMMatrix(DOMMatrixReadOnly):
         Returns:
             DOMMatrix: Returns itself.
         """
+        if self._matrix is None:
+            a, b, c, d, e, f = (self._a, self._b, self._c, self._d, self._e,
+                                self._f)
+            det = a * d - b * c
+            if det != 0:
+                self._set_matrix2d(d / det,
+                                   -b / det,
+                                   -c / det,
+                                   a / det,
+                                   (c * f - d * e) / det,
+                                   (b * e - a * f) / det)
+                return self
+            self._promote()
         self._matrix = np.linalg.inv(self._matrix)
         return self
 
@@ -931,6 +1153,10 @@ class DOMMatrix(DOMMatrixReadOnly):
         Returns:
             DOMMatrix: Returns itself.
         """
+        if other._matrix is None:
+            return self._multiply2d_self(other._a, other._b, other._c,
+                                         other._d, other._e, other._f)
+        self._promote()
         self._matrix = np.dot(self._matrix, other._matrix)
         if not other._is2d:
             self._is2d = False
@@ -948,6 +1174,10 @@ class DOMMatrix(DOMMatrixReadOnly):
         t = math.radians(angle)
         sin = math.sin(t)
         cos = math.cos(t)
+        if x == 0 and y == 0 and z == 1 and self._matrix is None:
+            # [0, 0, 1, rot_z]
+            return self._multiply2d_self(cos, sin, -sin, cos, 0, 0)
+        self._promote()
         if x == 0 and y == 0 and z == 1:
             # [0, 0, 1, rot_z]
             r = matrix3d(cos, sin, 0, 0,
@@ -1040,6 +1270,12 @@ class DOMMatrix(DOMMatrixReadOnly):
             return self
         if origin_x != 0 or origin_y != 0 or origin_z != 0:
             self.translate_self(origin_x, origin_y, origin_z)
+        if scale_z == 1 and self._matrix is None:
+            self._multiply2d_self(scale_x, 0, 0, scale_y, 0, 0)
+            if origin_x != 0 or origin_y != 0 or origin_z != 0:
+                self.translate_self(-origin_x, -origin_y, -origin_z)
+            return self
+        self._promote()
         m = matrix3d(scale_x, 0, 0, 0,
                      0, scale_y, 0, 0,
                      0, 0, scale_z, 0,
@@ -1063,9 +1299,8 @@ class DOMMatrix(DOMMatrixReadOnly):
         Returns:
             DOMMatrix: Returns itself.
         """
-        m = matrix2d(1, 0, math.tan(math.radians(angle)), 1, 0, 0)
-        self._matrix = np.dot(self._matrix, m)
-        return self
+        return self._multiply2d_self(1, 0, math.tan(math.radians(angle)), 1,
+                                     0, 0)
 
     def skew_y_self(self, angle):
         """Post-multiplies a skewY transformation on the current matrix.
@@ -1075,9 +1310,8 @@ class DOMMatrix(DOMMatrixReadOnly):
         Returns:
             DOMMatrix: Returns itself.
         """
-        m = matrix2d(1, math.tan(math.radians(angle)), 0, 1, 0, 0)
-        self._matrix = np.dot(self._matrix, m)
-        return self
+        return self._multiply2d_self(1, math.tan(math.radians(angle)), 0, 1,
+                                     0, 0)
 
     def translate_self(self, tx=0, ty=0, tz=0):
         """Post-multiplies a translation transformation on the current
@@ -1092,6 +1326,9 @@ class DOMMatrix(DOMMatrixReadOnly):
         """
         if tx == 0 and ty == 0 and tz == 0:
             return self
+        elif tz == 0:
+            return self._multiply2d_self(1, 0, 0, 1, tx, ty)
+        self._promote()
         m = matrix3d(1, 0, 0, 0,
                      0, 1, 0, 0,
                      0, 0, 1, 0,
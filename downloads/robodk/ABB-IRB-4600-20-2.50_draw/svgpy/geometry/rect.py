@@ -13,9 +13,16 @@
 # limitations under the License.
 
 
+import math
+
+import numpy as np
+
+
 class DOMRectReadOnly(object):
     """Represents the [geometry] DOMRectReadOnly."""
 
+    __slots__ = ('_x', '_y', '_width', '_height')
+
     def __init__(self, x=None, y=None, width=0, height=0):
         """Constructs a DOMRectReadOnly object.
 
@@ -325,6 +332,8 @@ class DOMRectReadOnly(object):
 class DOMRect(DOMRectReadOnly):
     """Represents the [geometry] DOMRect."""
 
+    __slots__ = ()
+
     def __init__(self, x=None, y=None, width=0, height=0):
         """Constructs a DOMRect object.
 
@@ -609,3 +618,203 @@ class DOMRect(DOMRectReadOnly):
             self._x = x1
             self._y = y1
         return self
+
+
+class DOMRectArray(object):
+    """Represents an array of rectangles, that is backed by a NumPy array of
+    (x, y, width, height) with shape (N, 4).
+    An empty rectangle (e.g. DOMRect()) is filled with NaN.
+    """
+
+    __slots__ = ('_rects',)
+
+    def __init__(self, rects=None):
+        """Constructs a DOMRectArray object.
+
+        Arguments:
+            rects (numpy.ndarray, optional): The rectangles (x, y, width,
+                height) with shape (N, 4).
+        """
+        self._rects = np.asarray(
+            rects if rects is not None else [], dtype=float).reshape(-1, 4)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return _to_rect(*self._rects[index].tolist())
+        return DOMRectArray(self._rects[index])
+
+    def __iter__(self):
+        for values in self._rects.tolist():
+            yield _to_rect(*values)
+
+    def __len__(self):
+        return len(self._rects)
+
+    def __repr__(self):
+        return '<{}.{} object at {} ({} rectangles)>'.format(
+            type(self).__module__, type(self).__name__, hex(id(self)),
+            len(self._rects))
+
+    @property
+    def rects(self):
+        """numpy.ndarray: The rectangles (x, y, width, height) with shape
+        (N, 4).
+        """
+        return self._rects
+
+    def contains(self, x, y, width=0, height=0):
+        """Returns whether the given point (x, y) or rectangle is inside or on
+        the edge of each rectangle.
+
+        Arguments:
+            x (float): The absolute x-coordinate of the point.
+            y (float): The absolute y-coordinate of the point.
+            width (float, optional): The width of the rectangle.
+            height (float, optional): The height of the rectangle.
+        Returns:
+            numpy.ndarray: A boolean array with shape (N,).
+        """
+        x1, y1, x2, y2 = self.get_coords().T
+        sized = (np.asarray(width) > 0) & (np.asarray(height) > 0)
+        right = x + np.where(sized, width, 0)
+        bottom = y + np.where(sized, height, 0)
+        return (self.isvalid()
+                & (x1 <= x) & (x <= x2) & (y1 <= y) & (y <= y2)
+                & (x1 <= right) & (right <= x2)
+                & (y1 <= bottom) & (bottom <= y2))
+
+    @staticmethod
+    def from_rects(rects):
+        """Creates a new DOMRectArray object from a list of rectangles, and
+        returns it.
+
+        Arguments:
+            rects (list[DOMRectReadOnly]): A list of the rectangles.
+        Returns:
+            DOMRectArray: A new DOMRectArray object.
+        """
+        values = np.full((len(rects), 4), np.nan)
+        for index, rect in enumerate(rects):
+            if rect.x is not None and rect.y is not None:
+                values[index] = rect.x, rect.y, rect.width, rect.height
+        return DOMRectArray(values)
+
+    def get_coords(self):
+        """Returns the position of the top-left corner and bottom-right
+        corner of each rectangle.
+
+        Returns:
+            numpy.ndarray: The coordinates (x1, y1, x2, y2) with shape (N, 4).
+        """
+        rects = self._rects
+        return np.concatenate((rects[:, :2], rects[:, :2] + rects[:, 2:]),
+                              axis=1)
+
+    def intersect(self, other):
+        """Returns the intersection of each rectangle and the given
+        rectangle(s).
+        Rectangles that do not overlap result in an empty rectangle.
+
+        Arguments:
+            other (DOMRectReadOnly | DOMRectArray): A rectangle, or an array
+                of rectangles with the same length.
+        Returns:
+            DOMRectArray: The resulting rectangles.
+        """
+        coords = self.get_coords()
+        other = _get_coords(other)
+        x1y1 = np.maximum(coords[:, :2], other[:, :2])
+        x2y2 = np.minimum(coords[:, 2:], other[:, 2:])
+        sizes = x2y2 - x1y1
+        rects = np.concatenate((x1y1, sizes), axis=1)
+        rects[~np.all(sizes > 0, axis=1)] = np.nan
+        return DOMRectArray(rects)
+
+    def isempty(self):
+        """Returns whether each rectangle is empty.
+
+        Returns:
+            numpy.ndarray: A boolean array with shape (N,).
+        """
+        return ~self.isvalid()
+
+    def isvalid(self):
+        """Returns whether each rectangle is valid.
+        A valid rectangle has a width>0 and height>0.
+
+        Returns:
+            numpy.ndarray: A boolean array with shape (N,).
+        """
+        rects = self._rects
+        return (~np.isnan(rects[:, 0]) & ~np.isnan(rects[:, 1])
+                & (rects[:, 2] > 0) & (rects[:, 3] > 0))
+
+    def tolist(self):
+        """Returns a list of the rectangles.
+
+        Returns:
+            list[DOMRect]: A list of the rectangles.
+        """
+        return list(self)
+
+    def transform(self, matrix):
+        """Returns the bounding rectangles of each rectangle that is
+        post-multiplied the matrix transformation.
+
+        Arguments:
+            matrix (DOMMatrix): A matrix to be multiplied.
+        Returns:
+            DOMRectArray: The resulting rectangles.
+        """
+        if len(self._rects) == 0:
+            return DOMRectArray()
+        x1, y1, x2, y2 = self.get_coords().T
+        # clockwise
+        corners = np.stack((x1, y1, x2, y1, x2, y2, x1, y2), axis=1)
+        corners = matrix.transform_points(
+            corners.reshape(-1, 2)).reshape(-1, 4, 2)
+        x1y1 = corners.min(axis=1)
+        x2y2 = corners.max(axis=1)
+        return DOMRectArray(np.concatenate((x1y1, x2y2 - x1y1), axis=1))
+
+    def unite(self, other=None):
+        """Returns the bounding rectangle of all rectangles, or the bounding
+        rectangle of each rectangle and the given rectangle(s).
+        Empty rectangles are ignored.
+
+        Arguments:
+            other (DOMRectReadOnly | DOMRectArray, optional): A rectangle, or
+                an array of rectangles with the same length.
+        Returns:
+            DOMRect | DOMRectArray: The bounding rectangle of all rectangles
+                if other is omitted, otherwise the resulting rectangles.
+        """
+        coords = self.get_coords()
+        if other is None:
+            coords = coords[~np.isnan(coords).any(axis=1)]
+            if len(coords) == 0:
+                return DOMRect()
+            x1, y1 = coords[:, :2].min(axis=0).tolist()
+            x2, y2 = coords[:, 2:].max(axis=0).tolist()
+            return DOMRect(x1, y1, x2 - x1, y2 - y1)
+        other = _get_coords(other)
+        x1y1 = np.fmin(coords[:, :2], other[:, :2])
+        x2y2 = np.fmax(coords[:, 2:], other[:, 2:])
+        return DOMRectArray(np.concatenate((x1y1, x2y2 - x1y1), axis=1))
+
+
+def _get_coords(rects):
+    if isinstance(rects, DOMRectArray):
+        return rects.get_coords()
+    elif not isinstance(rects, DOMRectReadOnly):
+        raise TypeError('Expected DOMRectReadOnly or DOMRectArray,'
+                        ' got {}'.format(type(rects)))
+    elif rects.x is None or rects.y is None:
+        return np.full((1, 4), np.nan)
+    return np.array([rects.get_coords()], dtype=float)
+
+
+def _to_rect(x, y, width, height):
+    if math.isnan(x) or math.isnan(y):
+        return DOMRect()
+    return DOMRect(x, y, width, height)
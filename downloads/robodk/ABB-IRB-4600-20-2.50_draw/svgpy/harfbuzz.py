@@ -14,11 +14,16 @@
 
 
 import array
+import atexit
+import threading
+import weakref
+from collections import OrderedDict
 
-from ._ffi_api import dlopen, ffi
+from ._ffi_api import LazyLibrary, ffi, lazy_class_attribute
 from .freetype import FTFace
 
-lib = dlopen(ffi, ['harfbuzz', 'libharfbuzz-0'])
+lib = LazyLibrary(ffi, ['harfbuzz', 'libharfbuzz-0'],
+                  compiled='_ffi_api_cffi')
 
 
 def hb_shape(font, buffer, features=None):
@@ -45,7 +50,9 @@ def hb_version():
 
 
 class HarfBuzz(object):
-    version = hb_version()
+    @lazy_class_attribute
+    def version():
+        return hb_version()
 
 
 class HBDirection(object):
@@ -320,6 +327,12 @@ class HBFont(object):
 
 
 class HBFTFont(HBFont):
+    MAX_FONTS = 32
+    """int: The maximum number of the shared HBFTFont objects."""
+
+    _fonts = OrderedDict()
+
+    _lock = threading.Lock()
 
     @staticmethod
     def create(face):
@@ -333,6 +346,36 @@ class HBFTFont(HBFont):
         hb_font = lib.hb_ft_font_create(face.ft_face, ffi.NULL)
         return HBFTFont(hb_font)
 
+    @staticmethod
+    def get_shared(face):
+        """Returns the shared HBFTFont object of a FTFace object.
+        The FTFace object should be a shared face of the face pool (see
+        FontManager.get_sized_face()), and must not be resized.
+
+        Arguments:
+            face (FTFace): A FTFace object.
+        Returns:
+            HBFTFont: The shared HBFTFont object.
+        """
+        key = id(face)
+        with HBFTFont._lock:
+            entry = HBFTFont._fonts.get(key)
+            if entry is not None:
+                HBFTFont._fonts.move_to_end(key)
+                return entry[1]
+            hb_font = HBFTFont.create(face)
+            # keep a reference of the face while the font is alive
+            HBFTFont._fonts[key] = face, hb_font
+            if len(HBFTFont._fonts) > HBFTFont.MAX_FONTS:
+                HBFTFont._fonts.popitem(last=False)
+            return hb_font
+
+    @staticmethod
+    def clear_shared():
+        """Releases the shared HBFTFont objects."""
+        with HBFTFont._lock:
+            HBFTFont._fonts.clear()
+
     def get_face(self):
         face = lib.hb_ft_font_get_face(self._font)
         return FTFace(face, reference=True)
@@ -345,6 +388,9 @@ class HBFTFont(HBFont):
         lib.hb_ft_font_set_load_flags(self._font, load_flags)
 
 
+atexit.register(HBFTFont.clear_shared)
+
+
 class HBLanguage(object):
     """Represents the 'hb_language_t' data type."""
 
@@ -581,6 +627,157 @@ class HBGlyphPosition(object):
                 self.x_offset, self.y_offset))
 
 
+class HBShapingResult(object):
+    """Represents the glyphs of a shaped text run.
+    The glyph ids, clusters, advances and offsets are stored in
+    array('i').
+    """
+
+    __slots__ = ('codepoints', 'clusters', 'x_advances', 'y_advances',
+                 'x_offsets', 'y_offsets')
+
+    def __init__(self, codepoints, clusters, x_advances, y_advances,
+                 x_offsets, y_offsets):
+        self.codepoints = codepoints
+        self.clusters = clusters
+        self.x_advances = x_advances
+        self.y_advances = y_advances
+        self.x_offsets = x_offsets
+        self.y_offsets = y_offsets
+
+    def __len__(self):
+        return len(self.codepoints)
+
+    def __repr__(self):
+        return "('codepoints': {}, 'clusters': {})".format(
+            self.codepoints.tolist(), self.clusters.tolist())
+
+    @staticmethod
+    def from_buffer(buffer):
+        """Creates a new HBShapingResult object from the shaped buffer.
+
+        Arguments:
+            buffer (HBBuffer): A shaped HBBuffer object.
+        Returns:
+            HBShapingResult: A new HBShapingResult object.
+        """
+        length = ffi.new('unsigned int *')
+        infos = lib.hb_buffer_get_glyph_infos(buffer.hb_buffer, length)
+        positions = lib.hb_buffer_get_glyph_positions(buffer.hb_buffer,
+                                                      length)
+        indices = range(length[0])
+        return HBShapingResult(
+            array.array('i', [infos[i].codepoint for i in indices]),
+            array.array('i', [infos[i].cluster for i in indices]),
+            array.array('i', [positions[i].x_advance for i in indices]),
+            array.array('i', [positions[i].y_advance for i in indices]),
+            array.array('i', [positions[i].x_offset for i in indices]),
+            array.array('i', [positions[i].y_offset for i in indices]))
+
+    def reversed(self):
+        """Returns a copy of the glyphs in reverse order.
+
+        Returns:
+            HBShapingResult: A new HBShapingResult object.
+        """
+        return HBShapingResult(self.codepoints[::-1],
+                               self.clusters[::-1],
+                               self.x_advances[::-1],
+                               self.y_advances[::-1],
+                               self.x_offsets[::-1],
+                               self.y_offsets[::-1])
+
+
+class HBShapingCache(object):
+    """Caches the shaping results of the text runs.
+    The cached results are shared and must not be modified.
+    """
+
+    MAX_ENTRIES = 1024
+    """int: The maximum number of the cached shaping results."""
+
+    hits = 0
+    """int: The number of the cache hits."""
+
+    misses = 0
+    """int: The number of the cache misses."""
+
+    _entries = OrderedDict()
+
+    _lock = threading.Lock()
+
+    @staticmethod
+    def clear():
+        """Clears the cached shaping results and the counters."""
+        with HBShapingCache._lock:
+            HBShapingCache._entries.clear()
+            HBShapingCache.hits = 0
+            HBShapingCache.misses = 0
+
+    @staticmethod
+    def get_stats():
+        """Returns the statistics of the cache.
+
+        Returns:
+            dict[str, int]: The number of the cache hits, the cache misses
+                and the cached results.
+        """
+        return {'hits': HBShapingCache.hits,
+                'misses': HBShapingCache.misses,
+                'size': len(HBShapingCache._entries)}
+
+    @staticmethod
+    def shape(font, buffer, text, features=None, direction=None,
+              script=None, language=None):
+        """Shapes the text run, or returns the cached result of the same
+        text run.
+
+        Arguments:
+            font (HBFont): A HBFont object.
+            buffer (HBBuffer): A HBBuffer object to be used on a cache miss.
+                The contents of the buffer are cleared.
+            text (str): The text run.
+            features (list[HBFeature], optional): The font features.
+            direction (HBDirection, optional): The text direction.
+            script (HBScript, optional): The script.
+            language (HBLanguage, optional): The language.
+        Returns:
+            HBShapingResult: The shaped glyphs.
+        """
+        key = (id(font),
+               text,
+               tuple(x.tostring() for x in features) if features else (),
+               direction.direction if direction is not None else None,
+               script.script if script is not None else None,
+               language.tostring() if language is not None else None)
+        with HBShapingCache._lock:
+            entry = HBShapingCache._entries.get(key)
+            if entry is not None and entry[0]() is font:
+                HBShapingCache._entries.move_to_end(key)
+                HBShapingCache.hits += 1
+                return entry[1]
+            HBShapingCache.misses += 1
+
+        buffer.clear_contents()
+        if direction is not None:
+            buffer.set_direction(direction)
+        if language is not None:
+            buffer.set_language(language)
+        if script is not None:
+            buffer.set_script(script)
+        buffer.add_utf8(text)
+        buffer.guess_segment_properties()
+        buffer.shape(font, features)
+        result = HBShapingResult.from_buffer(buffer)
+
+        with HBShapingCache._lock:
+            # keep a weak reference to detect the reuse of id(font)
+            HBShapingCache._entries[key] = weakref.ref(font), result
+            if len(HBShapingCache._entries) > HBShapingCache.MAX_ENTRIES:
+                HBShapingCache._entries.popitem(last=False)
+        return result
+
+
 class HBScript(object):
     """Represents the 'hb_script_t' data type.
     See also http://unicode.org/iso15924/.
@@ -13,6 +13,8 @@
 # limitations under the License.
 
 
+import json
+import os
 import os.path
 import re
 import subprocess
@@ -21,14 +23,13 @@ from ctypes.util import find_library
 
 from cffi import FFI
 
-from ._ffi_api import dlopen
+from ._ffi_api import LazyFFI, LazyLibrary, dlopen, load_compiled
 
 _lib_names = ['icuuc']
 _icu_min_required_version = 4
-ffi = FFI()
-lib = dlopen(ffi, _lib_names)
+_CACHE_FILENAME = 'icu.json'
 
-_api = r"""
+_API = r"""
 /*
  * ICU 60.2
  */
@@ -340,9 +341,7 @@ u_versionToString${modifier}(
 """
 
 
-def _guess_version():
-    # detect the version number from a library name
-    re_ver_num = re.compile(r'\d+(\.\d+)*')
+def _find_library():
     for name in _lib_names:
         # Fedora 27: 'libicuuc.so.57'
         # WSL (Ubuntu): 'libicuuc.so.55'
@@ -350,20 +349,27 @@ def _guess_version():
         # Windows: 'C:\\Windows\\System32\\icuuc.dll'
         path = find_library(name)
         if path is not None:
-            filename = os.path.basename(path)
-            for it in re_ver_num.finditer(filename):
-                value = it.group(0)
-                if float(value) > 0:
-                    return value
+            return path
+    return None
+
+
+def _guess_version(_ffi, _lib, path):
+    # detect the version number from a library name
+    re_ver_num = re.compile(r'\d+(\.\d+)*')
+    if path is not None:
+        filename = os.path.basename(path)
+        for it in re_ver_num.finditer(filename):
+            value = it.group(0)
+            if float(value) > 0:
+                return value
 
     # try to find the non modified symbol
-    global ffi
-    ffi.cdef("""
+    _ffi.cdef("""
     typedef uint8_t UVersionInfo[4];
     void u_getVersion(UVersionInfo versionArray);
     """)
     try:
-        if getattr(lib, 'u_getVersion'):
+        if getattr(_lib, 'u_getVersion'):
             return ''
     except AttributeError:
         pass
@@ -388,96 +394,221 @@ def _guess_version():
     return ver
 
 
-version = _guess_version()
-_modifier = ('_' + version.split('.')[0]
-             if version is not None and len(version) > 0 else '')
-ffi.cdef(_api.replace('${modifier}', _modifier), override=True)
-del _api
-
-# uversion.h
-u_get_version = getattr(lib, 'u_getVersion' + _modifier)
-u_version_to_string = getattr(lib, 'u_versionToString' + _modifier)
-
-# utypes.h
-_u_error_name = getattr(lib, 'u_errorName' + _modifier)
-
-# ubidi.h
-ubidi_close = getattr(lib, 'ubidi_close' + _modifier)
-ubidi_count_paragraphs = getattr(lib, 'ubidi_countParagraphs' + _modifier)
-ubidi_count_runs = getattr(lib, 'ubidi_countRuns' + _modifier)
-ubidi_get_direction = getattr(lib, 'ubidi_getDirection' + _modifier)
-ubidi_get_length = getattr(lib, 'ubidi_getLength' + _modifier)
-ubidi_get_logical_index = getattr(lib, 'ubidi_getLogicalIndex' + _modifier)
-ubidi_get_logical_map = getattr(lib, 'ubidi_getLogicalMap' + _modifier)
-ubidi_get_logical_run = getattr(lib, 'ubidi_getLogicalRun' + _modifier)
-ubidi_get_para_level = getattr(lib, 'ubidi_getParaLevel' + _modifier)
-ubidi_get_processed_length = getattr(
-    lib, 'ubidi_getProcessedLength' + _modifier)
-ubidi_get_reordering_mode = getattr(lib, 'ubidi_getReorderingMode' + _modifier)
-ubidi_get_reordering_options = getattr(
-    lib, 'ubidi_getReorderingOptions' + _modifier)
-ubidi_get_result_length = getattr(lib, 'ubidi_getResultLength' + _modifier)
-ubidi_get_text = getattr(lib, 'ubidi_getText' + _modifier)
-ubidi_get_visual_index = getattr(lib, 'ubidi_getVisualIndex' + _modifier)
-ubidi_get_visual_map = getattr(lib, 'ubidi_getVisualMap' + _modifier)
-ubidi_get_visual_run = getattr(lib, 'ubidi_getVisualRun' + _modifier)
-ubidi_invert_map = getattr(lib, 'ubidi_invertMap' + _modifier)
-ubidi_is_inverse = getattr(lib, 'ubidi_isInverse' + _modifier)
-ubidi_open = getattr(lib, 'ubidi_open' + _modifier)
-ubidi_open_sized = getattr(lib, 'ubidi_openSized' + _modifier)
-ubidi_reorder_logical = getattr(lib, 'ubidi_reorderLogical' + _modifier)
-ubidi_reorder_visual = getattr(lib, 'ubidi_reorderVisual' + _modifier)
-ubidi_set_inverse = getattr(lib, 'ubidi_setInverse' + _modifier)
-ubidi_set_line = getattr(lib, 'ubidi_setLine' + _modifier)
-ubidi_set_para = getattr(lib, 'ubidi_setPara' + _modifier)
-ubidi_set_reordering_mode = getattr(lib, 'ubidi_setReorderingMode' + _modifier)
-ubidi_set_reordering_options = getattr(
-    lib, 'ubidi_setReorderingOptions' + _modifier)
-ubidi_write_reordered = getattr(lib, 'ubidi_writeReordered' + _modifier)
-ubidi_write_reverse = getattr(lib, 'ubidi_writeReverse' + _modifier)
-
-# ubrk.h
-ubrk_close = getattr(lib, 'ubrk_close' + _modifier)
-ubrk_count_available = getattr(lib, 'ubrk_countAvailable' + _modifier)
-ubrk_current = getattr(lib, 'ubrk_current' + _modifier)
-ubrk_first = getattr(lib, 'ubrk_first' + _modifier)
-ubrk_following = getattr(lib, 'ubrk_following' + _modifier)
-ubrk_get_available = getattr(lib, 'ubrk_getAvailable' + _modifier)
-ubrk_get_locale_by_type = getattr(lib, 'ubrk_getLocaleByType' + _modifier)
-ubrk_is_boundary = getattr(lib, 'ubrk_isBoundary' + _modifier)
-ubrk_last = getattr(lib, 'ubrk_last' + _modifier)
-ubrk_next = getattr(lib, 'ubrk_next' + _modifier)
-ubrk_open = getattr(lib, 'ubrk_open' + _modifier)
-ubrk_preceding = getattr(lib, 'ubrk_preceding' + _modifier)
-ubrk_previous = getattr(lib, 'ubrk_previous' + _modifier)
-ubrk_set_text = getattr(lib, 'ubrk_setText' + _modifier)
-
-# uloc.h
-uloc_get_character_orientation = getattr(
-    lib, 'uloc_getCharacterOrientation' + _modifier)
-uloc_get_default = getattr(lib, 'uloc_getDefault' + _modifier)
-uloc_get_language = getattr(lib, 'uloc_getLanguage' + _modifier)
-uloc_get_line_orientation = getattr(
-    lib, 'uloc_getLineOrientation' + _modifier)
-uloc_get_script = getattr(lib, 'uloc_getScript' + _modifier)
-
-# ustring.h
-u_str_to_utf8 = getattr(lib, 'u_strToUTF8' + _modifier)
-u_str_from_utf8 = getattr(lib, 'u_strFromUTF8' + _modifier)
-u_strlen = getattr(lib, 'u_strlen' + _modifier)
+def _get_cache_path():
+    cache_home = os.environ.get('XDG_CACHE_HOME')
+    if cache_home is None and os.name == 'nt':
+        cache_home = os.environ.get('LOCALAPPDATA')
+    if cache_home is None:
+        cache_home = os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'svgpy', _CACHE_FILENAME)
 
 
-def get_version():
-    vi = ffi.new('UVersionInfo')
+def _read_cache():
+    try:
+        with open(_get_cache_path(), encoding='utf-8') as fp:
+            cache = json.load(fp)
+    except (OSError, ValueError):
+        return None
+    if (not isinstance(cache, dict)
+            or not isinstance(cache.get('path'), str)
+            or not isinstance(cache.get('modifier'), str)):
+        return None
+    return cache
+
+
+def _write_cache(cache):
+    path = _get_cache_path()
+    temp = '{}.{}.tmp'.format(path, os.getpid())
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temp, 'w', encoding='utf-8') as fp:
+            json.dump(cache, fp)
+        os.replace(temp, path)
+    except OSError:
+        pass
+
+
+class _ICULibrary(LazyLibrary):
+    """Opens the ICU library and binds its versioned symbols on first use.
+
+    The detected library path and symbol suffix are cached on disk, so that
+    the library name and version lookups run only once per installation.
+    """
+
+    def __init__(self, names):
+        super().__init__(FFI(), names, compiled='_icu_cffi')
+        self._modifier = None
+
+    def _get_symbol_name(self, name):
+        symbol = _SYMBOLS.get(name)
+        if symbol is None:
+            return name
+        return symbol + self._modifier
+
+    def _open(self):
+        path = None
+        module = load_compiled(self._compiled)
+        if module is not None:
+            # the ICU headers rename the symbols at compile time
+            self._ffi = module.ffi
+            self._modifier = ''
+            _lib = module.lib
+        else:
+            _lib = self._open_cached()
+        if _lib is None:
+            path = _find_library()
+            _lib = dlopen(self._ffi,
+                          _lib_names if path is None else [path])
+            version = _guess_version(self._ffi, _lib, path)
+            self._modifier = ('_' + version.split('.')[0]
+                              if version is not None and len(version) > 0
+                              else '')
+            self._ffi.cdef(_API.replace('${modifier}', self._modifier),
+                           override=True)
+
+        version = _get_version(
+            self._ffi,
+            getattr(_lib, 'u_getVersion' + self._modifier),
+            getattr(_lib, 'u_versionToString' + self._modifier))
+        if float(version) < _icu_min_required_version:
+            raise RuntimeError(
+                'Cannot find the ICU ' + str(_icu_min_required_version)
+                + '+ (found ' + version + ')')
+        if path is not None:
+            _write_cache({'path': path,
+                          'version': version,
+                          'modifier': self._modifier})
+        return _lib
+
+    def _open_cached(self):
+        cache = _read_cache()
+        if cache is None:
+            return None
+        try:
+            _lib = self._ffi.dlopen(cache['path'])
+            self._ffi.cdef(_API.replace('${modifier}', cache['modifier']),
+                           override=True)
+            getattr(_lib, 'u_getVersion' + cache['modifier'])
+        except (OSError, AttributeError):
+            return None
+        self._modifier = cache['modifier']
+        return _lib
+
+    @property
+    def ffi(self):
+        """FFI: The FFI object declaring the versioned symbols."""
+        self.load()
+        return self._ffi
+
+
+class _ICUFFI(LazyFFI):
+    """Parses the ICU declarations when the ICU library is opened."""
+
+    def __init__(self, _lib):
+        super().__init__(None)
+        self._lib = _lib
+
+    def load(self):
+        return self._lib.ffi
+
+
+def _get_version(_ffi, u_get_version, u_version_to_string):
+    vi = _ffi.new('UVersionInfo')
     u_get_version(vi)
     # U_MAX_VERSION_STRING_LENGTH = 20
-    version_string = ffi.new('char[20]')
+    version_string = _ffi.new('char[20]')
     u_version_to_string(vi, version_string)
-    return ffi.string(version_string).decode()
+    return _ffi.string(version_string).decode()
+
+
+_SYMBOLS = {
+    # uversion.h
+    'u_get_version': 'u_getVersion',
+    'u_version_to_string': 'u_versionToString',
+
+    # utypes.h
+    'u_error_name': 'u_errorName',
+
+    # ubidi.h
+    'ubidi_close': 'ubidi_close',
+    'ubidi_count_paragraphs': 'ubidi_countParagraphs',
+    'ubidi_count_runs': 'ubidi_countRuns',
+    'ubidi_get_direction': 'ubidi_getDirection',
+    'ubidi_get_length': 'ubidi_getLength',
+    'ubidi_get_logical_index': 'ubidi_getLogicalIndex',
+    'ubidi_get_logical_map': 'ubidi_getLogicalMap',
+    'ubidi_get_logical_run': 'ubidi_getLogicalRun',
+    'ubidi_get_para_level': 'ubidi_getParaLevel',
+    'ubidi_get_processed_length': 'ubidi_getProcessedLength',
+    'ubidi_get_reordering_mode': 'ubidi_getReorderingMode',
+    'ubidi_get_reordering_options': 'ubidi_getReorderingOptions',
+    'ubidi_get_result_length': 'ubidi_getResultLength',
+    'ubidi_get_text': 'ubidi_getText',
+    'ubidi_get_visual_index': 'ubidi_getVisualIndex',
+    'ubidi_get_visual_map': 'ubidi_getVisualMap',
+    'ubidi_get_visual_run': 'ubidi_getVisualRun',
+    'ubidi_invert_map': 'ubidi_invertMap',
+    'ubidi_is_inverse': 'ubidi_isInverse',
+    'ubidi_open': 'ubidi_open',
+    'ubidi_open_sized': 'ubidi_openSized',
+    'ubidi_reorder_logical': 'ubidi_reorderLogical',
+    'ubidi_reorder_visual': 'ubidi_reorderVisual',
+    'ubidi_set_inverse': 'ubidi_setInverse',
+    'ubidi_set_line': 'ubidi_setLine',
+    'ubidi_set_para': 'ubidi_setPara',
+    'ubidi_set_reordering_mode': 'ubidi_setReorderingMode',
+    'ubidi_set_reordering_options': 'ubidi_setReorderingOptions',
+    'ubidi_write_reordered': 'ubidi_writeReordered',
+    'ubidi_write_reverse': 'ubidi_writeReverse',
+
+    # ubrk.h
+    'ubrk_close': 'ubrk_close',
+    'ubrk_count_available': 'ubrk_countAvailable',
+    'ubrk_current': 'ubrk_current',
+    'ubrk_first': 'ubrk_first',
+    'ubrk_following': 'ubrk_following',
+    'ubrk_get_available': 'ubrk_getAvailable',
+    'ubrk_get_locale_by_type': 'ubrk_getLocaleByType',
+    'ubrk_is_boundary': 'ubrk_isBoundary',
+    'ubrk_last': 'ubrk_last',
+    'ubrk_next': 'ubrk_next',
+    'ubrk_open': 'ubrk_open',
+    'ubrk_preceding': 'ubrk_preceding',
+    'ubrk_previous': 'ubrk_previous',
+    'ubrk_set_text': 'ubrk_setText',
+
+    # uloc.h
+    'uloc_get_character_orientation': 'uloc_getCharacterOrientation',
+    'uloc_get_default': 'uloc_getDefault',
+    'uloc_get_language': 'uloc_getLanguage',
+    'uloc_get_line_orientation': 'uloc_getLineOrientation',
+    'uloc_get_script': 'uloc_getScript',
+
+    # ustring.h
+    'u_str_to_utf8': 'u_strToUTF8',
+    'u_str_from_utf8': 'u_strFromUTF8',
+    'u_strlen': 'u_strlen',
+}
+
+lib = _ICULibrary(_lib_names)
+ffi = _ICUFFI(lib)
+
+
+def __getattr__(name):
+    if name == 'version':
+        return get_version()
+    elif name in _SYMBOLS:
+        return getattr(lib, name)
+    raise AttributeError(
+        'module {!r} has no attribute {!r}'.format(__name__, name))
+
+
+def get_version():
+    return _get_version(ffi, lib.u_get_version, lib.u_version_to_string)
 
 
 def u_error_name(status):
-    error_name = _u_error_name(status)
+    error_name = lib.u_error_name(status)
     return ffi.string(error_name).decode()
 
 
@@ -523,8 +654,8 @@ class UBiDi(object):
 
     def __init__(self):
         self._status = ffi.new('UErrorCode *')
-        self._bidi = ffi.gc(ubidi_open(),
-                            ubidi_close)
+        self._bidi = ffi.gc(lib.ubidi_open(),
+                            lib.ubidi_close)
         self._source = None
 
     @property
@@ -532,61 +663,63 @@ class UBiDi(object):
         return self._status[0]
 
     def count_paragraphs(self):
-        return ubidi_count_paragraphs(self._bidi)
+        return lib.ubidi_count_paragraphs(self._bidi)
 
     def count_runs(self):
         self._status[0] = 0
-        return ubidi_count_runs(self._bidi, self._status)
+        return lib.ubidi_count_runs(self._bidi, self._status)
 
     def get_direction(self):
-        return ubidi_get_direction(self._bidi)
+        return lib.ubidi_get_direction(self._bidi)
 
     def get_length(self):
-        return ubidi_get_length(self._bidi)
+        return lib.ubidi_get_length(self._bidi)
 
     def get_logical_index(self, visual_index):
         self._status[0] = 0
-        return ubidi_get_logical_index(self._bidi, visual_index, self._status)
+        return lib.ubidi_get_logical_index(self._bidi, visual_index,
+                                           self._status)
 
     def get_logical_run(self, logical_position):
         logical_limit = ffi.new('int32_t *')
         level = ffi.new('UBiDiLevel *')
-        ubidi_get_logical_run(self._bidi,
-                              logical_position,
-                              logical_limit,
-                              level)
+        lib.ubidi_get_logical_run(self._bidi,
+                                  logical_position,
+                                  logical_limit,
+                                  level)
         return logical_limit[0], level[0]
 
     def get_para_level(self):
-        return ubidi_get_para_level(self._bidi)
+        return lib.ubidi_get_para_level(self._bidi)
 
     def get_processed_length(self):
-        return ubidi_get_processed_length(self._bidi)
+        return lib.ubidi_get_processed_length(self._bidi)
 
     def get_reordering_mode(self):
-        return ubidi_get_reordering_mode(self._bidi)
+        return lib.ubidi_get_reordering_mode(self._bidi)
 
     def get_reordering_options(self):
-        return ubidi_get_reordering_options(self._bidi)
+        return lib.ubidi_get_reordering_options(self._bidi)
 
     def get_result_length(self):
-        return ubidi_get_result_length(self._bidi)
+        return lib.ubidi_get_result_length(self._bidi)
 
     def get_text(self):
-        buf = ubidi_get_text(self._bidi)
+        buf = lib.ubidi_get_text(self._bidi)
         return ffi.string(buf)
 
     def get_visual_index(self, logical_index):
         self._status[0] = 0
-        return ubidi_get_visual_index(self._bidi, logical_index, self._status)
+        return lib.ubidi_get_visual_index(self._bidi, logical_index,
+                                          self._status)
 
     def get_visual_run(self, run_index):
         logical_start = ffi.new('int32_t *')
         length = ffi.new('int32_t *')
-        direction = ubidi_get_visual_run(self._bidi,
-                                         run_index,
-                                         logical_start,
-                                         length)
+        direction = lib.ubidi_get_visual_run(self._bidi,
+                                             run_index,
+                                             logical_start,
+                                             length)
         return logical_start[0], length[0], direction
 
     def set_para(self, text, para_level):
@@ -595,18 +728,18 @@ class UBiDi(object):
         buf_length = len(buf) - 1
         self._source = buf
         embedding_levels = ffi.NULL
-        ubidi_set_para(self._bidi,
-                       buf,
-                       buf_length,
-                       para_level,
-                       embedding_levels,
-                       self._status)
+        lib.ubidi_set_para(self._bidi,
+                           buf,
+                           buf_length,
+                           para_level,
+                           embedding_levels,
+                           self._status)
 
     def set_reordering_mode(self, reordering_mode):
-        ubidi_set_reordering_mode(self._bidi, reordering_mode)
+        lib.ubidi_set_reordering_mode(self._bidi, reordering_mode)
 
     def set_reordering_options(self, reordering_options):
-        ubidi_set_reordering_options(self._bidi, reordering_options)
+        lib.ubidi_set_reordering_options(self._bidi, reordering_options)
 
     def visual_iter(self):
         count = self.count_runs()
@@ -626,11 +759,11 @@ class UBiDi(object):
             if options & UBiDi.UBIDI_INSERT_LRM_FOR_NUMERIC:
                 dest_size += 2 * self.count_runs()
         dest = ffi.new('UChar[{}]'.format(dest_size))
-        length = ubidi_write_reordered(self._bidi,
-                                       dest,
-                                       dest_size,
-                                       options,
-                                       self._status)
+        length = lib.ubidi_write_reordered(self._bidi,
+                                           dest,
+                                           dest_size,
+                                           options,
+                                           self._status)
         if length == 0:
             output = None
         else:
@@ -659,8 +792,8 @@ class UBreakIterator(Iterator, Reversible):
             buf_length = len(buf) - 1
             self._source = buf
         self._bi = ffi.gc(
-            ubrk_open(break_type, where, buf, buf_length, self._status),
-            ubrk_close)
+            lib.ubrk_open(break_type, where, buf, buf_length, self._status),
+            lib.ubrk_close)
 
     def __iter__(self):
         self.first()
@@ -690,40 +823,41 @@ class UBreakIterator(Iterator, Reversible):
 
     @staticmethod
     def count_available():
-        return ubrk_count_available()
+        return lib.ubrk_count_available()
 
     def current(self):
-        offset = ubrk_current(self._bi)
+        offset = lib.ubrk_current(self._bi)
         return offset
 
     def first(self):
-        offset = ubrk_first(self._bi)
+        offset = lib.ubrk_first(self._bi)
         return offset
 
     @staticmethod
     def get_available(index):
-        locale = ubrk_get_available(index)
+        locale = lib.ubrk_get_available(index)
         if locale == ffi.NULL:
             return None
         return ffi.string(locale).decode()
 
     def get_locale_by_type(self, locale_type):
         self._status[0] = 0
-        locale = ubrk_get_locale_by_type(self._bi, locale_type, self._status)
+        locale = lib.ubrk_get_locale_by_type(self._bi, locale_type,
+                                             self._status)
         if locale == ffi.NULL:
             return None
         return ffi.string(locale).decode()
 
     def last(self):
-        offset = ubrk_last(self._bi)
+        offset = lib.ubrk_last(self._bi)
         return offset
 
     def next(self):
-        offset = ubrk_next(self._bi)
+        offset = lib.ubrk_next(self._bi)
         return offset
 
     def previous(self):
-        offset = ubrk_previous(self._bi)
+        offset = lib.ubrk_previous(self._bi)
         return offset
 
     def set_text(self, text):
@@ -731,7 +865,7 @@ class UBreakIterator(Iterator, Reversible):
         buf_length = len(buf) - 1
         self._source = buf
         self._status[0] = 0
-        ubrk_set_text(self._bi, buf, buf_length, self._status)
+        lib.ubrk_set_text(self._bi, buf, buf_length, self._status)
 
 
 class UErrorCode(object):
@@ -769,12 +903,12 @@ class ULocale(object):
     def get_character_orientation(self):
         locale = ffi.new('char[]', self.locale.encode())
         self._status[0] = 0
-        layout = uloc_get_character_orientation(locale, self._status)
+        layout = lib.uloc_get_character_orientation(locale, self._status)
         return layout
 
     @staticmethod
     def get_default():
-        default = uloc_get_default()
+        default = lib.uloc_get_default()
         locale = ffi.string(default).decode()
         return ULocale(locale)
 
@@ -782,7 +916,7 @@ class ULocale(object):
         locale = ffi.new('char[]', self.locale.encode())
         language = ffi.new('char[{}]'.format(ULocale.ULOC_LANG_CAPACITY))
         self._status[0] = 0
-        uloc_get_language(locale, language, len(language), self._status)
+        lib.uloc_get_language(locale, language, len(language), self._status)
         if u_failure(self._status[0]):
             return None
         return ffi.string(language).decode()
@@ -790,20 +924,14 @@ class ULocale(object):
     def get_line_orientation(self):
         locale = ffi.new('char[]', self.locale.encode())
         self._status[0] = 0
-        layout = uloc_get_line_orientation(locale, self._status)
+        layout = lib.uloc_get_line_orientation(locale, self._status)
         return layout
 
     def get_script(self):
         locale = ffi.new('char[]', self.locale.encode())
         script = ffi.new('char[{}]'.format(ULocale.ULOC_SCRIPT_CAPACITY))
         self._status[0] = 0
-        uloc_get_script(locale, script, len(script), self._status)
+        lib.uloc_get_script(locale, script, len(script), self._status)
         if u_failure(self._status[0]):
             return None
         return ffi.string(script).decode()
-
-
-version = get_version()
-if float(version) < _icu_min_required_version:
-    raise RuntimeError('Cannot find the ICU ' + str(_icu_min_required_version)
-                       + '+ (found ' + version + ')')
@@ -1,18 +1,12 @@
-import re
 from .path import *
+from .path import tokenize_path
 
 COMMANDS = set('MmZzLlHhVvCcSsQqTtAa')
 UPPERCASE = set('MZLHVCSQTA')
 
-COMMAND_RE = re.compile("([MmZzLlHhVvCcSsQqTtAa])")
-FLOAT_RE = re.compile("[-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?")
-
 def _tokenize_path(pathdef):
-    for x in COMMAND_RE.split(pathdef):
-        if x in COMMANDS:
-            yield x
-        for token in FLOAT_RE.findall(x):
-            yield token
+    # Shares the single-pass tokenizer with svgpy.path.PathParser.
+    return tokenize_path(pathdef)
 
 def parse_path(pathdef, current_pos=0j):
     # In the SVG specs, initial movetos are absolute, even if
@@ -1,6 +1,9 @@
 from __future__ import division
-from math import sqrt, cos, sin, acos, degrees, radians
-from collections import MutableSequence
+from math import sqrt, cos, sin, acos, degrees, radians, atan2, ceil, pi, tan
+from collections.abc import MutableSequence
+from logging import getLogger
+import re
+from functools import lru_cache
 
 # This file contains classes for the different types of SVG path segments as
 # well as a Path object that contains a sequence of path segments.
@@ -294,3 +297,1191 @@ class Path(MutableSequence):
     def length(self):
         self._calc_lengths()
         return self._length
+
+
+logger = getLogger(__name__)
+
+_PATH_COMMANDS = {
+    'M': 2, 'm': 2, 'Z': 0, 'z': 0, 'L': 2, 'l': 2, 'H': 1, 'h': 1,
+    'V': 1, 'v': 1, 'C': 6, 'c': 6, 'S': 4, 's': 4, 'Q': 4, 'q': 4,
+    'T': 2, 't': 2, 'A': 7, 'a': 7,
+}
+
+_PATH_COMMAND_LETTERS = frozenset(_PATH_COMMANDS)
+
+_RE_PATH_TOKEN = re.compile(
+    r"[MmZzLlHhVvCcSsQqTtAa]"
+    r"|[+-]?(?:\d+\.?\d*|\.\d+)(?:[Ee][+-]?\d+)?")
+
+_LENGTH_SUBDIVISIONS = 8
+_NEWTON_ITERATIONS = 3
+
+
+@lru_cache(maxsize=None)
+def _get_length_quadrature():
+    # Gauss-Legendre nodes and weights for the arc length of the cubic Bezier
+    # curves; each curve is split into the sub-intervals of equal parameter
+    # range.
+    import numpy as np
+    gauss_nodes, gauss_weights = np.polynomial.legendre.leggauss(8)
+    length_nodes = ((gauss_nodes + 1) / 2 + np.arange(_LENGTH_SUBDIVISIONS)[
+        :, np.newaxis]) / _LENGTH_SUBDIVISIONS
+    length_weights = gauss_weights / 2 / _LENGTH_SUBDIVISIONS
+    return gauss_nodes, gauss_weights, length_nodes, length_weights
+
+
+def _get_cubic_points(p0, p1, p2, p3, t):
+    mt = 1 - t
+    return (mt ** 3 * p0 + 3 * mt ** 2 * t * p1
+            + 3 * mt * t ** 2 * p2 + t ** 3 * p3)
+
+
+def _get_cubic_speeds(p0, p1, p2, p3, t):
+    # |B'(t)|, B'(t) / 3 = a * t^2 + b * t + c
+    import numpy as np
+    a = -p0 + 3 * p1 - 3 * p2 + p3
+    b = 2 * (p0 - 2 * p1 + p2)
+    c = p1 - p0
+    derivative = 3 * ((a * t + b) * t + c)
+    return np.hypot(derivative[..., 0], derivative[..., 1])
+
+
+# The character classes of the path data for PathParser._tokenize_array()
+_NUMERIC = 1
+_SEPARATOR = 2
+_DIGIT = 4 | _NUMERIC
+_DOT = 8 | _NUMERIC
+_SIGN = 16 | _NUMERIC
+_COMMAND = 32
+
+# The path data that is shorter than this is parsed without NumPy.
+_ARRAY_PARSE_THRESHOLD = 1024
+
+
+@lru_cache(maxsize=None)
+def _get_path_tables():
+    # The translation tables to the character classes and to the numbers
+    # separated by spaces, and the number of parameters, the number of
+    # points and the normalized command code for each command letter.
+    # The arcs, the smooth quadratic curves and the exponents are left to
+    # PathParser._iter_segments().
+    import numpy as np
+    classes = np.full(256, _SEPARATOR, dtype=np.uint8)
+    classes[np.frombuffer(b'0123456789', dtype=np.uint8)] = _DIGIT
+    classes[ord('.')] = _DOT
+    classes[np.frombuffer(b'+-', dtype=np.uint8)] = _SIGN
+    parameters = np.zeros(256, dtype=np.int64)
+    points = np.zeros(256, dtype=np.int64)
+    codes = np.zeros(256, dtype=np.uint8)
+    for letter, count in _PATH_COMMANDS.items():
+        code = ord(letter)
+        classes[code] = _COMMAND
+        parameters[code] = count
+    for letters, count, command in (('M', 1, PathDataArray.MOVETO),
+                                    ('LHV', 1, PathDataArray.LINETO),
+                                    ('CSQ', 3, PathDataArray.CURVETO),
+                                    ('Z', 0, PathDataArray.CLOSEPATH)):
+        for letter in letters:
+            points[ord(letter)] = count
+            codes[ord(letter)] = command
+    classes[np.frombuffer(b'AaTtEe', dtype=np.uint8)] = 0
+    numbers = np.where(classes & _NUMERIC, np.arange(256), ord(' '))
+    return (classes.tobytes(), numbers.astype(np.uint8).tobytes(),
+            parameters, points, codes)
+
+
+def _accumulate_runs(values, starts):
+    # Returns the cumulative sums of the runs of the values that begin at
+    # the given indices, added up from left to right as a loop does. The
+    # runs are accumulated as the rows of the matrices, grouped by the
+    # power of two of their lengths.
+    import numpy as np
+    lengths = np.diff(starts, append=len(values))
+    groups = np.frexp(lengths - 1)[1]
+    sums = values.copy()
+    for group in np.unique(groups[groups > 0]).tolist():
+        selected = groups == group
+        columns = np.arange(1 << group)
+        valid = columns < lengths[selected, np.newaxis]
+        indices = (starts[selected, np.newaxis] + columns)[valid]
+        matrix = np.zeros(valid.shape)
+        matrix[valid] = values[indices]
+        sums[indices] = np.add.accumulate(matrix, axis=1)[valid]
+    return sums
+
+
+def tokenize_path(d):
+    """Splits the path data into a list of the command letters and the
+    numbers.
+
+    Arguments:
+        d (str): The path data ('d' attribute).
+    Returns:
+        list[str]: A list of tokens.
+    Examples:
+        >>> tokenize_path('M10-20l.5.5z')
+        ['M', '10', '-20', 'l', '.5', '.5', 'z']
+    """
+    return _RE_PATH_TOKEN.findall(d)
+
+
+class PathDataArray(object):
+    """Represents the normalized path data ('M', 'L', 'C' and 'Z' absolute
+    commands) as a packed command-code array and a packed (N, 2) coordinate
+    array, so that a whole path can be transformed or measured with a few
+    NumPy operations.
+    """
+
+    MOVETO = 0
+    LINETO = 1
+    CURVETO = 2
+    CLOSEPATH = 3
+
+    COMMANDS = 'MLCZ'
+
+    NUMBER_OF_POINTS = 1, 1, 3, 0
+    """tuple[int, ...]: The number of points for each command code."""
+
+    __slots__ = ('_commands', '_coords', '_length_table')
+
+    def __init__(self, commands=None, coords=None):
+        """Constructs a PathDataArray object.
+
+        Arguments:
+            commands (numpy.ndarray, optional): The command codes.
+            coords (numpy.ndarray, optional): The coordinates of the points
+                with shape (N, 2).
+        """
+        import numpy as np
+        self._commands = np.asarray(
+            commands if commands is not None else [], dtype=np.uint8)
+        self._coords = np.asarray(
+            coords if coords is not None else [], dtype=float).reshape(-1, 2)
+        self._length_table = None
+
+    def __len__(self):
+        return len(self._commands)
+
+    def __repr__(self):
+        return '<{}.{} object at {} ({} segments, {} points)>'.format(
+            type(self).__module__, type(self).__name__, hex(id(self)),
+            len(self._commands), len(self._coords))
+
+    @property
+    def commands(self):
+        """numpy.ndarray: The command codes of the path segments."""
+        return self._commands
+
+    @property
+    def coords(self):
+        """numpy.ndarray: The coordinates of the points with shape (N, 2).
+        """
+        return self._coords
+
+    @staticmethod
+    def concatenate(paths):
+        """Joins the paths into a single path, and returns it with the index
+        of the path that owns each path segment.
+        Since each path starts with a 'M' command, the path segments of each
+        path refer to its own points only.
+
+        Arguments:
+            paths (list[PathDataArray]): A list of the paths.
+        Returns:
+            tuple[PathDataArray, numpy.ndarray]: The joined path and the
+                owner indices of the path segments.
+        """
+        import numpy as np
+        if len(paths) == 0:
+            return PathDataArray(), np.empty(0, dtype=np.intp)
+        commands = np.concatenate([path.commands for path in paths])
+        coords = np.concatenate([path.coords for path in paths])
+        owners = np.repeat(np.arange(len(paths)),
+                           [len(path) for path in paths])
+        return PathDataArray(commands, coords), owners
+
+    @staticmethod
+    def from_path_data(path_data):
+        """Creates a new PathDataArray object from a list of the normalized
+        path segments, and returns it.
+
+        Arguments:
+            path_data (list[SVGPathSegment]): A list of path segments that
+                consists of the absolute 'M', 'L', 'C' and 'Z' commands.
+        Returns:
+            PathDataArray: A new PathDataArray object.
+        """
+        commands = list()
+        coords = list()
+        for segment in path_data:
+            code = PathDataArray.COMMANDS.find(segment.type)
+            if code == -1:
+                raise ValueError(
+                    'Expected normalized path segment, got {}'.format(
+                        repr(segment.type)))
+            commands.append(code)
+            coords.extend(segment.values)
+        return PathDataArray(commands, coords)
+
+    def get_bbox(self):
+        """Returns the bounding box of the path.
+        The extrema of the cubic Bezier curves are solved at once.
+
+        Returns:
+            DOMRect: The bounding box of the path.
+        """
+        from .geometry.rect import DOMRect
+        x, y, x2, y2 = self.get_extrema()
+        if x is None:
+            return DOMRect()
+        return DOMRect(x, y, x2 - x, y2 - y)
+
+    @staticmethod
+    def get_bboxes(paths):
+        """Returns the bounding boxes of the paths.
+        The paths are joined into a single path, so that the extrema of all
+        cubic Bezier curves are solved at once.
+
+        Arguments:
+            paths (list[PathDataArray]): A list of the paths.
+        Returns:
+            numpy.ndarray: The bounding boxes (x, y, width, height) with
+                shape (N, 4). The bounding box of an empty path is filled
+                with NaN.
+        """
+        import numpy as np
+        bboxes = np.full((len(paths), 4), np.nan)
+        path, owners = PathDataArray.concatenate(paths)
+        if len(path.coords) == 0:
+            return bboxes
+        points, segments = path._get_extremum_points()
+        owners = owners[segments]
+        minimums = np.full((len(paths), 2), np.nan)
+        maximums = np.full((len(paths), 2), np.nan)
+        np.fmin.at(minimums, owners, points)
+        np.fmax.at(maximums, owners, points)
+        bboxes[:, :2] = minimums
+        bboxes[:, 2:] = maximums - minimums
+        return bboxes
+
+    def get_end_indices(self):
+        """Returns the index of the end point of each path segment in the
+        coordinate array. The end point of the 'Z' command is the start point
+        of the current subpath.
+
+        Returns:
+            numpy.ndarray: The indices of the end points.
+        """
+        import numpy as np
+        commands = self._commands
+        counts = np.array(PathDataArray.NUMBER_OF_POINTS)[commands]
+        offsets = np.cumsum(counts) - counts
+        indices = np.arange(len(commands))
+        moveto = np.maximum.accumulate(
+            np.where(commands == PathDataArray.MOVETO, indices, 0))
+        return np.where(commands == PathDataArray.CLOSEPATH,
+                        offsets[moveto],
+                        offsets + counts - 1)
+
+    def get_extrema(self):
+        """Returns the minimum and maximum coordinates of the path.
+
+        Returns:
+            tuple[float, float, float, float]: The minimum x, the minimum y,
+                the maximum x and the maximum y. Returns (None, None, None,
+                None) if the path is empty.
+        """
+        import numpy as np
+        if len(self._coords) == 0:
+            return None, None, None, None
+        points, _ = self._get_extremum_points()
+        x, y = np.nanmin(points, axis=0)
+        x2, y2 = np.nanmax(points, axis=0)
+        return float(x), float(y), float(x2), float(y2)
+
+    def _get_extremum_points(self):
+        """Returns the points that may be the extrema of the path: the end
+        points of the path segments and the extrema of the cubic Bezier
+        curves.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: The points with shape
+                (N, 2), which contain NaN for the missing extrema, and the
+                index of the path segment of each point.
+        """
+        import numpy as np
+        commands = self._commands
+        end_indices = self.get_end_indices()
+        segments = [np.flatnonzero(commands != PathDataArray.CLOSEPATH)]
+        points = [self._coords[end_indices[segments[0]]]]
+
+        curves = np.flatnonzero(commands == PathDataArray.CURVETO)
+        curves = curves[curves > 0]
+        if len(curves) > 0:
+            p0, p1, p2, p3 = self._get_curve_points(curves, end_indices)
+            # B'(t) / 3 = a * t^2 + b * t + c
+            a = -p0 + 3 * p1 - 3 * p2 + p3
+            b = 2 * (p0 - 2 * p1 + p2)
+            c = p1 - p0
+            with np.errstate(divide='ignore', invalid='ignore'):
+                quadratic = np.abs(a) > 1e-12
+                sqrt_d = np.sqrt(b * b - 4 * a * c)
+                t1 = np.where(quadratic, (-b + sqrt_d) / (2 * a), -c / b)
+                t2 = np.where(quadratic, (-b - sqrt_d) / (2 * a), np.nan)
+            for t in (t1, t2):
+                t = np.where((t > 0) & (t < 1), t, np.nan)
+                # evaluates each axis at its own extremum
+                points.append(_get_cubic_points(p0, p1, p2, p3, t))
+                segments.append(curves)
+        return np.concatenate(points), np.concatenate(segments)
+
+    def transform(self, matrix):
+        """Returns a copy of the path that is post-multiplied the matrix
+        transformation on the current path.
+
+        Arguments:
+            matrix (DOMMatrix): A matrix to be multiplied.
+        Returns:
+            PathDataArray: The resulting path.
+        """
+        if len(self._coords) == 0:
+            return PathDataArray(self._commands, self._coords)
+        return PathDataArray(self._commands,
+                             matrix.transform_points(self._coords))
+
+    def _get_curve_points(self, curves, end_indices):
+        coords = self._coords
+        return (coords[end_indices[curves - 1]],
+                coords[end_indices[curves] - 2],
+                coords[end_indices[curves] - 1],
+                coords[end_indices[curves]])
+
+    def _get_length_table(self):
+        """Returns the arc-length table of the path, that is built once and
+        kept with the current path.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray,
+                numpy.ndarray]: The length of each path segment, the
+                cumulative lengths, the indices of the cubic Bezier curves
+                and the cumulative lengths of each curve at the boundaries of
+                the sub-intervals.
+        """
+        import numpy as np
+        _, _, length_nodes, length_weights = _get_length_quadrature()
+        if self._length_table is not None:
+            return self._length_table
+        commands = self._commands
+        coords = self._coords
+        lengths = np.zeros(len(commands))
+        curves = np.zeros(0, dtype=int)
+        partials = np.zeros((0, _LENGTH_SUBDIVISIONS + 1))
+        if len(commands) >= 2:
+            end_indices = self.get_end_indices()
+            start = coords[end_indices[:-1]]
+            end = coords[end_indices[1:]]
+            lengths[1:] = np.hypot(*(end - start).T)
+            lengths[commands == PathDataArray.MOVETO] = 0
+
+            curves = np.flatnonzero(commands == PathDataArray.CURVETO)
+            curves = curves[curves > 0]
+            if len(curves) > 0:
+                p0, p1, p2, p3 = [
+                    p[:, np.newaxis, np.newaxis]
+                    for p in self._get_curve_points(curves, end_indices)]
+                speeds = _get_cubic_speeds(
+                    p0, p1, p2, p3, length_nodes[..., np.newaxis])
+                partials = np.zeros((len(curves), _LENGTH_SUBDIVISIONS + 1))
+                partials[:, 1:] = np.cumsum(
+                    np.dot(speeds, length_weights), axis=1)
+                lengths[curves] = partials[:, -1]
+        self._length_table = (lengths, np.cumsum(lengths), curves, partials)
+        return self._length_table
+
+    def get_lengths(self):
+        """Returns the length of each path segment.
+        The lengths of the cubic Bezier curves are integrated at once with
+        the Gauss-Legendre quadrature.
+
+        Returns:
+            numpy.ndarray: The lengths of the path segments.
+        """
+        return self._get_length_table()[0]
+
+    def get_point_at_length(self, distance):
+        """Returns the point at the given distance along the path.
+
+        Arguments:
+            distance (float): The distance along the path.
+        Returns:
+            tuple[float, float]: The point at the distance. Returns None if
+                the path is empty.
+        """
+        if len(self._coords) == 0:
+            return None
+        x, y = self.get_points_at_lengths([distance])[0]
+        return float(x), float(y)
+
+    def get_points_at_lengths(self, distances):
+        """Returns the points at the given distances along the path.
+        Each distance is located by a binary search of the arc-length table,
+        and the curve parameter is refined with the Newton's method.
+
+        Arguments:
+            distances (array_like): The distances along the path. The
+                distances are clamped to the range [0, total length].
+        Returns:
+            numpy.ndarray: The points with shape (N, 2).
+        """
+        import numpy as np
+        gauss_nodes, gauss_weights, _, _ = _get_length_quadrature()
+        distances = np.asarray(distances, dtype=float).ravel()
+        coords = self._coords
+        if len(coords) == 0:
+            return np.zeros((len(distances), 2))
+        lengths, cumulative, curves, partials = self._get_length_table()
+        distances = np.clip(distances, 0, cumulative[-1])
+        indices = np.minimum(
+            np.searchsorted(cumulative, distances, side='left'),
+            len(lengths) - 1)
+        local = distances - (cumulative[indices] - lengths[indices])
+
+        end_indices = self.get_end_indices()
+        end = coords[end_indices[indices]]
+        start = coords[end_indices[np.maximum(indices - 1, 0)]]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.where(lengths[indices] > 0,
+                             local / lengths[indices], 1)
+        points = start + (end - start) * ratio[:, np.newaxis]
+
+        is_curve = np.isin(indices, curves)
+        if np.any(is_curve):
+            local = local[is_curve]
+            curve_indices = indices[is_curve]
+            p0, p1, p2, p3 = [
+                p[:, np.newaxis]
+                for p in self._get_curve_points(curve_indices, end_indices)]
+            partials = partials[np.searchsorted(curves, curve_indices)]
+            rows = np.arange(len(curve_indices))
+            k = np.clip(
+                (partials <= local[:, np.newaxis]).sum(axis=1) - 1,
+                0, _LENGTH_SUBDIVISIONS - 1)
+            s0 = partials[rows, k]
+            s1 = partials[rows, k + 1]
+            t0 = k / _LENGTH_SUBDIVISIONS
+            t1 = (k + 1) / _LENGTH_SUBDIVISIONS
+            with np.errstate(divide='ignore', invalid='ignore'):
+                t = np.where(s1 > s0,
+                             t0 + (t1 - t0) * (local - s0) / (s1 - s0), t0)
+            for _ in range(_NEWTON_ITERATIONS):
+                nodes = (t0[:, np.newaxis] + (t - t0)[:, np.newaxis]
+                         * (gauss_nodes + 1) / 2)
+                speeds = _get_cubic_speeds(p0, p1, p2, p3,
+                                           nodes[..., np.newaxis])
+                s = s0 + np.dot(speeds, gauss_weights) * (t - t0) / 2
+                speed = _get_cubic_speeds(
+                    p0, p1, p2, p3, t[:, np.newaxis, np.newaxis])[:, 0]
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    t = np.where(speed > 0, t - (s - local) / speed, t)
+                t = np.clip(t, t0, t1)
+            points[is_curve] = _get_cubic_points(
+                p0[:, 0], p1[:, 0], p2[:, 0], p3[:, 0], t[:, np.newaxis])
+        return points
+
+    def get_total_length(self):
+        """Returns the total length of the path.
+
+        Returns:
+            float: The total length of the path.
+        """
+        cumulative = self._get_length_table()[1]
+        if len(cumulative) == 0:
+            return 0
+        return float(cumulative[-1])
+
+    def tostring(self):
+        """Returns the path data as a string, without creating the
+        intermediate path segments.
+
+        Returns:
+            str: The path data ('d' attribute).
+        """
+        import numpy as np
+        from .formatter import format_command_sequence
+        commands = np.frombuffer(PathDataArray.COMMANDS.encode('ascii'),
+                                 dtype=np.uint8)[self._commands]
+        counts = np.array(_NUMBER_OF_VALUES)[self._commands]
+        return format_command_sequence(
+            commands.tobytes().decode('ascii'), counts, self._coords.ravel())
+
+    def tolist(self):
+        """Returns a list of path segments that corresponds to the path data.
+
+        Returns:
+            list[SVGPathSegment]: A list of path segments.
+        """
+        path_data = list()
+        values = self._coords.ravel().tolist()
+        index = 0
+        for code in self._commands.tolist():
+            count = _NUMBER_OF_VALUES[code]
+            path_data.append(
+                SVGPathSegment(PathDataArray.COMMANDS[code],
+                               *values[index:index + count]))
+            index += count
+        return path_data
+
+
+_NUMBER_OF_VALUES = (2, 2, 6, 0)
+
+
+class SVGPathSegment(object):
+    """Represents the [SVG2] SVGPathSegment."""
+
+    __slots__ = ('_type', '_values')
+
+    def __init__(self, type_=None, *values):
+        """Constructs a SVGPathSegment object.
+
+        Arguments:
+            type_ (str, optional): The command letter of the path segment.
+            *values: The parameters of the path segment.
+        Examples:
+            >>> segment = SVGPathSegment('M', 10, 20)
+            >>> segment.type, segment.values
+            ('M', [10, 20])
+        """
+        self._type = type_
+        self._values = list(values)
+
+    def __eq__(self, other):
+        if not isinstance(other, SVGPathSegment):
+            return NotImplemented
+        return self._type == other.type and self._values == other.values
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return '{}({})'.format(
+            type(self).__name__,
+            ', '.join([repr(self._type)] + [repr(x) for x in self._values]))
+
+    @property
+    def type(self):
+        """str: The command letter of the path segment."""
+        return self._type
+
+    @type.setter
+    def type(self, value):
+        self._type = value
+
+    @property
+    def values(self):
+        """list[float]: The parameters of the path segment."""
+        return self._values
+
+    @values.setter
+    def values(self, values):
+        self._values = list(values)
+
+    def isabsolute(self):
+        """Returns True if the path segment is an absolute command.
+
+        Returns:
+            bool: True if the command letter is upper case.
+        """
+        return self._type is not None and self._type.isupper()
+
+    def isrelative(self):
+        """Returns True if the path segment is a relative command.
+
+        Returns:
+            bool: True if the command letter is lower case.
+        """
+        return self._type is not None and self._type.islower()
+
+    def tostring(self):
+        """Returns the path segment as a string.
+
+        Returns:
+            str: The path data of the path segment.
+        Examples:
+            >>> SVGPathSegment('L', 10.5, -0.0).tostring()
+            'L10.5 0'
+        """
+        from .formatter import format_number_sequence
+        return self._type + ' '.join(format_number_sequence(self._values))
+
+
+class PathParser(object):
+    """Parses and converts the path data."""
+
+    RE_NUMBER_SEQUENCE = re.compile(
+        r"(?P<number>[+-]?"
+        r"((\d+(\.\d*)?([Ee][+-]?\d+)?)|(\d*\.\d+([Ee][+-]?\d+)?)))"
+        r"(\s*,\s*|\s+)?")
+
+    @staticmethod
+    def _iter_segments(d):
+        """Yields the command letter and the parameters of each path segment
+        in the path data, until the end of the path data or the first error.
+        """
+        tokens = tokenize_path(d)
+        length = len(tokens)
+        if length == 0 or tokens[0] not in 'Mm':
+            return
+        index = 0
+        command = None
+        while index < length:
+            token = tokens[index]
+            count = _PATH_COMMANDS.get(token)
+            if count is not None:
+                command = token
+                index += 1
+                if count == 0:
+                    yield command, []
+                    command = None
+                    continue
+            elif command is None:
+                logger.debug('unexpected number: {}'.format(repr(token)))
+                return
+            else:
+                count = _PATH_COMMANDS[command]
+
+            if command not in 'Aa':
+                values = tokens[index:index + count]
+                if (len(values) < count
+                        or not _PATH_COMMAND_LETTERS.isdisjoint(values)):
+                    logger.debug('missing parameter: {}'.format(repr(d)))
+                    return
+                values = list(map(float, values))
+                index += count
+            else:
+                values = list()
+                while len(values) < count:
+                    if index >= length:
+                        logger.debug('missing parameter: {}'.format(repr(d)))
+                        return
+                    token = tokens[index]
+                    if token in _PATH_COMMANDS:
+                        logger.debug('missing parameter: {}'.format(repr(d)))
+                        return
+                    if len(values) in (3, 4):
+                        # flags may be written without separators, e.g. '011'
+                        if token[0] not in '01':
+                            logger.debug(
+                                'invalid flag: {}'.format(repr(token)))
+                            return
+                        values.append(int(token[0]))
+                        if len(token) > 1:
+                            tokens[index] = token[1:]
+                            continue
+                    else:
+                        values.append(float(token))
+                    index += 1
+            yield command, values
+            if command == 'M':
+                command = 'L'
+            elif command == 'm':
+                command = 'l'
+
+    @staticmethod
+    def _arc_to_curves(x1, y1, rx, ry, angle, large_arc, sweep, x2, y2):
+        # See https://www.w3.org/TR/SVG/implnote.html#ArcImplementationNotes
+        rx = abs(rx)
+        ry = abs(ry)
+        phi = radians(angle % 360)
+        cos_phi = cos(phi)
+        sin_phi = sin(phi)
+        dx = (x1 - x2) / 2
+        dy = (y1 - y2) / 2
+        x1p = cos_phi * dx + sin_phi * dy
+        y1p = -sin_phi * dx + cos_phi * dy
+        scale = (x1p * x1p) / (rx * rx) + (y1p * y1p) / (ry * ry)
+        if scale > 1:
+            scale = sqrt(scale)
+            rx *= scale
+            ry *= scale
+        rx2 = rx * rx
+        ry2 = ry * ry
+        numerator = rx2 * ry2 - rx2 * y1p * y1p - ry2 * x1p * x1p
+        denominator = rx2 * y1p * y1p + ry2 * x1p * x1p
+        k = sqrt(max(numerator, 0) / denominator)
+        if large_arc == sweep:
+            k = -k
+        cxp = k * rx * y1p / ry
+        cyp = -k * ry * x1p / rx
+        cx = cos_phi * cxp - sin_phi * cyp + (x1 + x2) / 2
+        cy = sin_phi * cxp + cos_phi * cyp + (y1 + y2) / 2
+        theta1 = atan2((y1p - cyp) / ry, (x1p - cxp) / rx)
+        theta2 = atan2((-y1p - cyp) / ry, (-x1p - cxp) / rx)
+        delta = theta2 - theta1
+        if sweep and delta < 0:
+            delta += 2 * pi
+        elif not sweep and delta > 0:
+            delta -= 2 * pi
+
+        # splits the arc into the segments of at most 90 degrees
+        count = max(int(ceil(abs(delta) / (pi / 2) - 1e-9)), 1)
+        delta /= count
+        t = 4 / 3 * tan(delta / 4)
+        values = list()
+        theta = theta1
+        px, py = x1, y1
+        for n in range(count):
+            cos1, sin1 = cos(theta), sin(theta)
+            theta += delta
+            cos2, sin2 = cos(theta), sin(theta)
+            # the derivatives of the ellipse at theta and theta + delta
+            ex1 = -rx * sin1 * cos_phi - ry * cos1 * sin_phi
+            ey1 = -rx * sin1 * sin_phi + ry * cos1 * cos_phi
+            ex2 = -rx * sin2 * cos_phi - ry * cos2 * sin_phi
+            ey2 = -rx * sin2 * sin_phi + ry * cos2 * cos_phi
+            if n == count - 1:
+                qx, qy = x2, y2
+            else:
+                qx = cx + rx * cos2 * cos_phi - ry * sin2 * sin_phi
+                qy = cy + rx * cos2 * sin_phi + ry * sin2 * cos_phi
+            values.append((px + t * ex1, py + t * ey1,
+                           qx - t * ex2, qy - t * ey2,
+                           qx, qy))
+            px, py = qx, qy
+        return values
+
+    @staticmethod
+    def _normalize(segments):
+        """Converts (command, parameters) pairs into the absolute 'M', 'L',
+        'C' and 'Z' commands, and returns them as a PathDataArray object.
+        """
+        commands = list()
+        coords = list()
+        cx = cy = sx = sy = 0
+        # the reflected control points of the smooth curves
+        cubic_x = cubic_y = quad_x = quad_y = None
+        for command, values in segments:
+            absolute = command.isupper()
+            command = command.upper()
+            ox, oy = (0, 0) if absolute else (cx, cy)
+            next_cubic_x = next_quad_x = None
+            if command == 'M':
+                cx, cy = values[0] + ox, values[1] + oy
+                sx, sy = cx, cy
+                commands.append(PathDataArray.MOVETO)
+                coords.extend((cx, cy))
+            elif command == 'Z':
+                commands.append(PathDataArray.CLOSEPATH)
+                cx, cy = sx, sy
+            elif command in 'LHV':
+                if command == 'L':
+                    cx, cy = values[0] + ox, values[1] + oy
+                elif command == 'H':
+                    cx = values[0] + ox
+                else:
+                    cy = values[0] + oy
+                commands.append(PathDataArray.LINETO)
+                coords.extend((cx, cy))
+            elif command in 'CS':
+                if command == 'C':
+                    x1, y1 = values[0] + ox, values[1] + oy
+                    values = values[2:]
+                elif cubic_x is not None:
+                    x1, y1 = 2 * cx - cubic_x, 2 * cy - cubic_y
+                else:
+                    x1, y1 = cx, cy
+                x2, y2 = values[0] + ox, values[1] + oy
+                cx, cy = values[2] + ox, values[3] + oy
+                next_cubic_x, next_cubic_y = x2, y2
+                commands.append(PathDataArray.CURVETO)
+                coords.extend((x1, y1, x2, y2, cx, cy))
+            elif command in 'QT':
+                if command == 'Q':
+                    qx, qy = values[0] + ox, values[1] + oy
+                    values = values[2:]
+                elif quad_x is not None:
+                    qx, qy = 2 * cx - quad_x, 2 * cy - quad_y
+                else:
+                    qx, qy = cx, cy
+                x, y = values[0] + ox, values[1] + oy
+                next_quad_x, next_quad_y = qx, qy
+                commands.append(PathDataArray.CURVETO)
+                coords.extend((cx + 2 / 3 * (qx - cx),
+                               cy + 2 / 3 * (qy - cy),
+                               x + 2 / 3 * (qx - x),
+                               y + 2 / 3 * (qy - y),
+                               x, y))
+                cx, cy = x, y
+            elif command == 'A':
+                rx, ry, angle, large_arc, sweep, x, y = values
+                x += ox
+                y += oy
+                if x == cx and y == cy:
+                    pass  # omitted
+                elif rx == 0 or ry == 0:
+                    commands.append(PathDataArray.LINETO)
+                    coords.extend((x, y))
+                else:
+                    for curve in PathParser._arc_to_curves(
+                            cx, cy, rx, ry, angle, large_arc, sweep, x, y):
+                        commands.append(PathDataArray.CURVETO)
+                        coords.extend(curve)
+                cx, cy = x, y
+            else:
+                raise ValueError(
+                    'Unknown path command: {}'.format(repr(command)))
+            cubic_x = next_cubic_x
+            if next_cubic_x is not None:
+                cubic_y = next_cubic_y
+            quad_x = next_quad_x
+            if next_quad_x is not None:
+                quad_y = next_quad_y
+        return PathDataArray(commands, coords)
+
+    @staticmethod
+    def _tokenize_array(d):
+        """Splits the path data into the command letters, the number of
+        parameters of each command letter and the parameters, at once with
+        NumPy. Returns None if the path data has the arcs, the smooth
+        quadratic curves, the exponents or an error, so that it is parsed by
+        _iter_segments() instead.
+        """
+        import numpy as np
+        classes, numbers, _, _, _ = _get_path_tables()
+        try:
+            data = (d + '  ').encode('ascii')
+        except UnicodeEncodeError:
+            return None
+        classes = np.frombuffer(data.translate(classes), dtype=np.uint8)
+        if not classes.all():
+            return None
+
+        # A number starts after a non-numeric character, at a sign or at
+        # the second dot of a number, e.g. '.5.5'.
+        numeric = (classes & _NUMERIC).view(bool)
+        starts = numeric.copy()
+        np.greater(numeric[1:], numeric[:-1], out=starts[1:])
+        starts |= classes == _SIGN
+        others = np.flatnonzero(classes != _DIGIT)
+        dots = classes[others] == _DOT
+        starts[others[1:][dots[1:] & dots[:-1]]] = True
+        positions = np.flatnonzero(starts)
+        if len(positions) == 0:
+            return None
+        # a sign or a dot at the start must be followed by a digit
+        leading = classes[positions]
+        following = classes[positions + 1]
+        if np.any((leading != _DIGIT) & (following != _DIGIT)
+                  & ((leading != _SIGN) | (following != _DOT)
+                     | (classes[positions + 2] != _DIGIT))):
+            return None
+
+        letters = np.flatnonzero(classes == _COMMAND)
+        if (len(letters) == 0 or positions[0] < letters[0]
+                or data[letters[0]] not in b'Mm'):
+            return None
+        counts = np.diff(np.searchsorted(positions, letters),
+                         append=len(positions))
+        text = np.frombuffer(data.translate(numbers), dtype=np.uint8)
+        text = np.insert(text, positions[numeric[positions - 1]], ord(' '))
+        values = np.fromstring(text.tobytes(), sep=' ')
+        if len(values) != len(positions):
+            return None
+        return np.frombuffer(data, dtype=np.uint8)[letters], counts, values
+
+    @staticmethod
+    def _normalize_array(letters, counts, values):
+        """Converts the command letters and their parameters into the
+        absolute 'M', 'L', 'C' and 'Z' commands with NumPy, and returns
+        them as a PathDataArray object. The coordinates are the same as
+        _normalize() computes. Returns None if the number of parameters is
+        invalid.
+        """
+        import numpy as np
+        _, _, parameters, points, codes = _get_path_tables()
+        sizes = parameters[letters]
+        closepath = sizes == 0
+        if (np.any(counts[closepath] != 0)
+                or np.any(counts[~closepath] == 0)
+                or np.any(counts % np.maximum(sizes, 1) != 0)):
+            return None
+        # expands the implicit commands, the ones after 'M' and 'm' are
+        # 'L' and 'l'
+        repeats = np.maximum(counts // np.maximum(sizes, 1), 1)
+        types = np.repeat(letters, repeats)
+        implicit = np.ones(len(types), dtype=bool)
+        implicit[np.cumsum(repeats) - repeats] = False
+        types[implicit & ((types | 0x20) == ord('m'))] -= ord('M') - ord('L')
+        upper = types & 0xdf
+        sizes = parameters[types]
+        last = np.cumsum(sizes) - 1
+
+        # the current points after each segment
+        horizontal = upper == ord('H')
+        vertical = upper == ord('V')
+        closepath = upper == ord('Z')
+        relative = (types != upper) & ~closepath
+        xs = values.take(np.where(horizontal, last, last - 1), mode='clip')
+        ys = values.take(last, mode='clip')
+        # Each coordinate is set by an absolute command or by 'Z' (to the
+        # subpath start), which begins a run of the relative moves (or -0.0
+        # if kept). The subpath starts are found first, since a run after
+        # 'Z' begins at one of them.
+        indices = np.arange(len(types))
+        movetos = np.flatnonzero(upper == ord('M'))
+        previous_movetos = np.concatenate(([-1], movetos[:-1]))
+        subpaths = np.maximum.accumulate(
+            np.where(upper == ord('M'), indices, 0))[closepath]
+        ends = list()
+        for coords, kept in ((xs, vertical), (ys, horizontal)):
+            roots = ~relative & ~closepath & ~kept
+            roots[0] = True
+            heads = roots | closepath
+            runs = np.where(roots, coords + 0, np.where(kept, -0.0, coords))
+            # a subpath start continues from the previous one, unless its
+            # run begins at an absolute command after it
+            firsts = np.maximum.accumulate(np.where(heads, indices, 0))[
+                movetos]
+            restarts = (firsts > previous_movetos) & roots[firsts]
+            lows = np.where(restarts, firsts,
+                            np.maximum(previous_movetos, firsts) + 1)
+            lengths = movetos - lows + 1
+            offsets = np.cumsum(lengths) - lengths
+            sums = _accumulate_runs(
+                runs[np.repeat(lows - offsets, lengths)
+                     + np.arange(np.sum(lengths))],
+                offsets[restarts])
+            starts = np.empty(len(types))
+            starts[movetos] = sums[offsets + lengths - 1]
+            runs[closepath] = starts[subpaths]
+            ends.append(_accumulate_runs(runs, np.flatnonzero(heads)))
+        end_x, end_y = ends
+
+        # the control points of the curves
+        curves = np.flatnonzero(points[upper] == 3)
+        previous_x = np.concatenate(([0], end_x[:-1]))[curves]
+        previous_y = np.concatenate(([0], end_y[:-1]))[curves]
+        curve_types = upper[curves]
+        origin_x = np.where(relative[curves], previous_x, 0)
+        origin_y = np.where(relative[curves], previous_y, 0)
+        first = last[curves] - sizes[curves] + 1
+        x1 = values[first] + origin_x
+        y1 = values[first + 1] + origin_y
+        x2 = x1.copy()
+        y2 = y1.copy()
+        cubic = np.flatnonzero(curve_types == ord('C'))
+        x2[cubic] = values[first[cubic] + 2] + origin_x[cubic]
+        y2[cubic] = values[first[cubic] + 3] + origin_y[cubic]
+        # reflects the second control point of the previous cubic curve
+        smooth = np.flatnonzero(curve_types == ord('S'))
+        reflected = ((smooth > 0) & (curves[smooth - 1] == curves[smooth] - 1)
+                     & (curve_types[smooth - 1] != ord('Q')))
+        x1[smooth] = np.where(reflected, 2 * previous_x[smooth]
+                              - x2[smooth - 1], previous_x[smooth])
+        y1[smooth] = np.where(reflected, 2 * previous_y[smooth]
+                              - y2[smooth - 1], previous_y[smooth])
+        # converts the quadratic curves into the cubic curves
+        quadratic = np.flatnonzero(curve_types == ord('Q'))
+        qx = x1[quadratic]
+        qy = y1[quadratic]
+        x = end_x[curves[quadratic]]
+        y = end_y[curves[quadratic]]
+        x1[quadratic] = previous_x[quadratic] + 2 / 3 * (
+            qx - previous_x[quadratic])
+        y1[quadratic] = previous_y[quadratic] + 2 / 3 * (
+            qy - previous_y[quadratic])
+        x2[quadratic] = x + 2 / 3 * (qx - x)
+        y2[quadratic] = y + 2 / 3 * (qy - y)
+
+        counts = points[upper]
+        starts = np.cumsum(counts) - counts
+        coords = np.empty((starts[-1] + counts[-1], 2))
+        coords[starts[counts != 0] + counts[counts != 0] - 1] = np.stack(
+            (end_x, end_y), axis=-1)[counts != 0]
+        coords[starts[curves]] = np.stack((x1, y1), axis=-1)
+        coords[starts[curves] + 1] = np.stack((x2, y2), axis=-1)
+        return PathDataArray(codes[upper], coords)
+
+    @staticmethod
+    def from_glyph(face, matrix=None, outline=None):
+        """Returns the normalized path data of the outline of the glyph that
+        is loaded into the glyph slot of the face.
+
+        Arguments:
+            face (FTFace): A face object.
+            matrix (DOMMatrix, optional): A matrix to be multiplied in the
+                font coordinate system (y-axis up).
+            outline (PathDataArray, optional): The outline of the glyph that
+                is returned by PathParser.get_glyph_outline(). If specified,
+                the glyph slot of the face is not used.
+        Returns:
+            list[SVGPathSegment]: A list of path segments.
+        """
+        if outline is None:
+            outline = PathParser.get_glyph_outline(face)
+        if len(outline) == 0:
+            return []
+        path_data = outline.transform(matrix) if matrix is not None \
+            else PathDataArray(outline.commands, outline.coords.copy())
+        path_data.coords[:, 1] *= -1
+        return path_data.tolist()
+
+    @staticmethod
+    def get_glyph_outline(face):
+        """Decomposes the outline of the glyph that is loaded into the glyph
+        slot of the face, and returns it in the font coordinate system
+        (y-axis up) in pixels.
+
+        Arguments:
+            face (FTFace): A face object.
+        Returns:
+            PathDataArray: The normalized path data of the outline.
+        """
+        import numpy as np
+        commands = list()
+        coords = list()
+        current = [0, 0]
+
+        def _move_to(x, y, _):
+            if len(commands) > 0:
+                commands.append(PathDataArray.CLOSEPATH)
+            commands.append(PathDataArray.MOVETO)
+            coords.extend((x, y))
+            current[:] = x, y
+
+        def _line_to(x, y, _):
+            commands.append(PathDataArray.LINETO)
+            coords.extend((x, y))
+            current[:] = x, y
+
+        def _conic_to(qx, qy, x, y, _):
+            x0, y0 = current
+            commands.append(PathDataArray.CURVETO)
+            coords.extend((x0 + 2 / 3 * (qx - x0), y0 + 2 / 3 * (qy - y0),
+                           x + 2 / 3 * (qx - x), y + 2 / 3 * (qy - y),
+                           x, y))
+            current[:] = x, y
+
+        def _cubic_to(x1, y1, x2, y2, x, y, _):
+            commands.append(PathDataArray.CURVETO)
+            coords.extend((x1, y1, x2, y2, x, y))
+            current[:] = x, y
+
+        face.glyph.outline.decompose(_move_to, _line_to, _conic_to,
+                                     _cubic_to)
+        if len(commands) > 0:
+            commands.append(PathDataArray.CLOSEPATH)
+        return PathDataArray(commands, np.array(coords) / 64)
+
+    @staticmethod
+    def get_bbox(path_data, options=None):
+        """Returns the bounding box of the path data.
+
+        Arguments:
+            path_data (list[SVGPathSegment]): A list of path segments.
+            options (SVGBoundingBoxOptions, optional): Reserved.
+        Returns:
+            DOMRect: The bounding box of the path data.
+        """
+        return PathParser.to_array(path_data).get_bbox()
+
+    @staticmethod
+    def get_total_length(path_data):
+        """Returns the total length of the path data.
+
+        Arguments:
+            path_data (list[SVGPathSegment]): A list of path segments.
+        Returns:
+            float: The total length of the path data.
+        """
+        return PathParser.to_array(path_data).get_total_length()
+
+    @staticmethod
+    def normalize(path_data):
+        """Converts a list of path segments into the base set of absolute
+        commands ('M', 'L', 'C' and 'Z').
+
+        Arguments:
+            path_data (list[SVGPathSegment]): A list of path segments.
+        Returns:
+            list[SVGPathSegment]: A list of the normalized path segments.
+        """
+        return PathParser.to_array(path_data).tolist()
+
+    @staticmethod
+    def parse(d):
+        """Parses the path data and returns a list of path segments.
+        An implicit command is returned as a separate path segment.
+
+        Arguments:
+            d (str): The path data ('d' attribute).
+        Returns:
+            list[SVGPathSegment]: A list of path segments.
+        Examples:
+            >>> PathParser.parse('M10,20 30,40z')
+            [SVGPathSegment('M', 10.0, 20.0), SVGPathSegment('L', 30.0, \
+40.0), SVGPathSegment('z')]
+        """
+        return [SVGPathSegment(command, *values)
+                for command, values in PathParser._iter_segments(d)]
+
+    @staticmethod
+    def to_array(path_data):
+        """Converts the path data into the normalized PathDataArray form.
+        If the path data is a string, it is normalized without creating the
+        intermediate path segments.
+
+        Arguments:
+            path_data (str, list[SVGPathSegment], PathDataArray): The path
+                data.
+        Returns:
+            PathDataArray: The normalized path data.
+        """
+        if isinstance(path_data, PathDataArray):
+            return path_data
+        elif isinstance(path_data, str):
+            if len(path_data) >= _ARRAY_PARSE_THRESHOLD:
+                tokens = PathParser._tokenize_array(path_data)
+                if tokens is not None:
+                    path_data_array = PathParser._normalize_array(*tokens)
+                    if path_data_array is not None:
+                        return path_data_array
+            segments = PathParser._iter_segments(path_data)
+        else:
+            segments = ((segment.type, segment.values)
+                        for segment in path_data)
+        return PathParser._normalize(segments)
+
+    @staticmethod
+    def tostring(path_data):
+        """Returns the path data as a string.
+
+        Arguments:
+            path_data (list[SVGPathSegment], PathDataArray): The path data.
+        Returns:
+            str: The path data ('d' attribute).
+        """
+        if isinstance(path_data, PathDataArray):
+            return path_data.tostring()
+        from .formatter import format_command_sequence
+        types = list()
+        counts = list()
+        values = list()
+        for segment in path_data:
+            segment_values = segment.values
+            types.append(segment.type)
+            counts.append(len(segment_values))
+            values.extend(segment_values)
+        return format_command_sequence(types, counts, values)
+
+    @staticmethod
+    def transform(path_data, matrix):
+        """Returns the normalized path data that is post-multiplied the
+        matrix transformation on the path data.
+
+        Arguments:
+            path_data (list[SVGPathSegment]): A list of path segments.
+            matrix (DOMMatrix): A matrix to be multiplied.
+        Returns:
+            list[SVGPathSegment]: A list of the normalized path segments.
+        """
+        return PathParser.to_array(path_data).transform(matrix).tolist()
@@ -15,6 +15,7 @@
 
 from logging import getLogger
 
+import tinycss2
 from lxml import cssselect, etree
 
 from .css import CSSParser, CSSRule, CSSStyleSheet
@@ -254,7 +255,8 @@ def get_css_style_sheets_from_xml_stylesheet(root):
         href = element.get('href')
         if (href is None
                 or href[0] == '#'
-                or element.get('alternate', '') == 'yes'):
+                or element.get('alternate', '') == 'yes'
+                or element.get('type', 'text/css') != 'text/css'):
             logger.debug('not a style sheet: {}'.format(element))
             continue  # TODO: support alternative style sheet.
         media = element.get('media', '')
@@ -276,10 +278,87 @@ def get_css_style_sheets_from_xml_stylesheet(root):
     return style_sheets
 
 
+def get_style_sheet_urls(root, base_url=None):
+    """Returns the URLs of the external style sheets that are referenced by
+    the document, without fetching them: the 'xml-stylesheet' processing
+    instructions, the <link> elements and the '@import' at-rules of the
+    <style> elements.
+    The media queries are not evaluated.
+
+    Arguments:
+        root (Element): The root element of the document.
+        base_url (str, optional): The URL of the document.
+    Returns:
+        list[tuple[str, str]]: A list of the URLs and the advisory character
+            encodings (or None).
+    """
+    urls = list()
+    for element in root.itersiblings(preceding=True):
+        if (not isinstance(element, etree.PIBase)
+                or element.target != 'xml-stylesheet'):
+            continue
+        href = element.get('href')
+        if (href is None
+                or href[0] == '#'
+                or element.get('alternate', '') == 'yes'
+                or element.get('type', 'text/css') != 'text/css'):
+            continue
+        urls.append((normalize_url(href, base_url).href,
+                     element.get('charset')))
+    urls.reverse()
+
+    for element in root.iter(tag=('{*}link', '{*}style')):
+        if element.local_name == 'link':
+            rel_list = element.rel_list
+            if ('alternate' in rel_list
+                    or ('stylesheet' not in rel_list
+                        and not ('preload' in rel_list
+                                 and element.as_ == 'style'))):
+                continue
+            href = element.href
+            if href is None or href[0] == '#':
+                continue
+            urls.append((normalize_url(href, base_url).href, None))
+        elif element.type == 'text/css' and element.text is not None:
+            rules = tinycss2.parse_stylesheet(element.text,
+                                              skip_comments=True,
+                                              skip_whitespace=True)
+            urls.extend((url, None)
+                        for url in CSSParser.get_import_urls(rules,
+                                                             base_url))
+    return urls
+
+
 def get_css_style(element, css_rules):
-    style = dict()
-    style_important = dict()
-    namespaces = element.nsmap.copy()
+    """Returns the declarations of the CSS style rules that match the
+    element. The selectors are matched in the whole document, as
+    get_css_styles() does.
+
+    Arguments:
+        element (Element): The element to be matched.
+        css_rules (list[CSSRule]): A list of the flattened CSS rules.
+    Returns:
+        tuple[dict, dict]: The declarations and the important declarations
+            of the matched style rules.
+    """
+    root = element.getroottree().getroot()
+    styles = get_css_styles(root, css_rules)
+    return styles.get(element, (dict(), dict()))
+
+
+def get_css_styles(root, css_rules):
+    """Matches the CSS style rules against all elements in the subtree at
+    once, instead of compiling each selector for every element.
+
+    Arguments:
+        root (Element): The root element of the subtree.
+        css_rules (list[CSSRule]): A list of the flattened CSS rules.
+    Returns:
+        dict[Element, tuple[dict, dict]]: The declarations and the important
+            declarations of the matched style rules for each element.
+    """
+    styles = dict()
+    namespaces = root.nsmap.copy()
     uri = namespaces.pop(None, None)
     if uri is not None:
         namespaces['svg'] = uri
@@ -288,30 +367,31 @@ def get_css_style(element, css_rules):
             try:
                 selector = cssselect.CSSSelector(css_rule.selector_text,
                                                  namespaces=namespaces)
-                matched = selector(element)
-                if len(matched) > 0 and element in matched:
-                    for key, (value, priority) in css_rule.style.items():
-                        style[key] = value
-                        if priority == 'important':
-                            style_important[key] = value
+                matched = selector(root)
             except cssselect.ExpressionError as exp:
                 logger.info('ExpressionError: {}: \'{}\''.format(
                     exp,
                     css_rule.selector_text))
+                continue
             except cssselect.SelectorSyntaxError as exp:
                 logger.info('SelectorSyntaxError: {}: \'{}\''.format(
                     exp,
                     css_rule.selector_text))
-        elif css_rule.type == CSSRule.FONT_FACE_RULE:
-            # TODO: support CSS @font-face at-rule.
-            pass
-        elif css_rule.type == CSSRule.FONT_FEATURE_VALUES_RULE:
-            # TODO: support CSS @font-feature-values at-rule.
-            pass
+                continue
+            if len(matched) == 0:
+                continue
+            items = list(css_rule.style.items())
+            for element in matched:
+                style, style_important = styles.setdefault(
+                    element, (dict(), dict()))
+                for key, (value, priority) in items:
+                    style[key] = value
+                    if priority == 'important':
+                        style_important[key] = value
         elif css_rule.type == CSSRule.NAMESPACE_RULE:
             if len(css_rule.namespace_uri) > 0:
                 prefix = css_rule.prefix
                 if len(prefix) == 0:
                     prefix = 'svg'
                 namespaces[prefix] = css_rule.namespace_uri
-    return style, style_important
+    return styles
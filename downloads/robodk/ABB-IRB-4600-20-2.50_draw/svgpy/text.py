@@ -14,20 +14,61 @@
 
 
 import copy
+import weakref
+from collections import OrderedDict
 
-from .base import SVGElement, SVGGraphicsElement, SVGPathDataSettings
+from .base import SVGElement, SVGGraphicsElement, SVGPathDataSettings, \
+    _get_transform_matrix
 from .core import CSSUtils, Font, SVGLength
 from .dom import Element, Node
 from .freetype import FreeType
 from .geometry.matrix import DOMMatrix
-from .geometry.rect import DOMRect
+from .geometry.rect import DOMRect, DOMRectArray
 from .harfbuzz import HBBuffer, HBDirection, HBFeature, HBFTFont, HBLanguage, \
-    HBScript
+    HBScript, HBShapingCache
 from .icu import UBiDi, UBreakIterator, ULocale
 from .opentype import features_from_style, iso639_codes_from_language_tag
 from .path import PathParser
 
 
+_GLYPH_OUTLINE_CACHE_SIZE = 4096
+
+_glyph_outlines = OrderedDict()
+
+
+def _get_glyph_outline(face, glyph_index, load_flags, embolden, oblique):
+    """Returns the decomposed outline of the glyph.
+    The outlines are cached per (face, glyph index, load flags, embolden,
+    oblique); the pooled faces are never resized, so that the face implies
+    the font file and the size.
+
+    Arguments:
+        face (FTFace): A shared face of the face pool.
+        glyph_index (int): The glyph index.
+        load_flags (int): The flags for FTFace.load_glyph().
+        embolden (bool): If True, the glyph is emboldened.
+        oblique (bool): If True, the glyph is slanted.
+    Returns:
+        PathDataArray: The outline in the font coordinate system.
+    """
+    key = id(face), glyph_index, load_flags, embolden, oblique
+    entry = _glyph_outlines.get(key)
+    if entry is not None and entry[0]() is face:
+        _glyph_outlines.move_to_end(key)
+        return entry[1]
+    face.load_glyph(glyph_index, load_flags)
+    glyph = face.glyph
+    if embolden:
+        glyph.embolden()
+    if oblique:
+        glyph.oblique()
+    outline = PathParser.get_glyph_outline(face)
+    _glyph_outlines[key] = weakref.ref(face), outline
+    if len(_glyph_outlines) > _GLYPH_OUTLINE_CACHE_SIZE:
+        _glyph_outlines.popitem(last=False)
+    return outline
+
+
 class SVGTextContentElement(SVGGraphicsElement):
     """Represents the [SVG2] SVGTextContentElement."""
 
@@ -236,7 +277,7 @@ class SVGTextContentElement(SVGGraphicsElement):
         assert style is not None
         font = Font(element)
         face = font.face
-        hb_font = HBFTFont.create(face)
+        hb_font = HBFTFont.get_shared(face)
 
         # alignment_baseline = style['alignment-baseline']
         # baseline_shift = style['baseline-shift']
@@ -345,21 +386,16 @@ class SVGTextContentElement(SVGGraphicsElement):
             else:
                 iterable = bi
             for line in iterable:
-                buf.clear_contents()
-                buf.set_language(hb_language)
-                buf.set_script(hb_script)
-                buf.add_utf8(line)
-                buf.guess_segment_properties()
-                buf.shape(hb_font, hb_features)
-                infos = buf.get_glyph_infos()
-                positions = buf.get_glyph_positions()
-                if infos[0].cluster > infos[-1].cluster:
-                    infos = list(reversed(infos))
-                    positions = list(reversed(positions))
+                shaped = HBShapingCache.shape(hb_font, buf, line,
+                                              hb_features,
+                                              language=hb_language,
+                                              script=hb_script)
+                if shaped.clusters[0] > shaped.clusters[-1]:
+                    shaped = shaped.reversed()
 
                 # re-positioning
-                if len(infos) != len(line):
-                    clusters = [x.cluster for x in infos]
+                if len(shaped) != len(line):
+                    clusters = shaped.clusters.tolist()
                     cluster_min = min(clusters)
                     cluster_max = max(clusters)
                     cluster_inc = max(
@@ -398,7 +434,12 @@ class SVGTextContentElement(SVGGraphicsElement):
                 # render line
                 line_path_data = list()
                 line_bbox = DOMRect()
-                for info, position in zip(infos, positions):
+                for (codepoint, x_advance, y_advance, x_offset,
+                     y_offset) in zip(shaped.codepoints,
+                                      shaped.x_advances,
+                                      shaped.y_advances,
+                                      shaped.x_offsets,
+                                      shaped.y_offsets):
                     if len(x_list) > 0:
                         x = x_list.pop(0)
                     else:
@@ -421,12 +462,12 @@ class SVGTextContentElement(SVGGraphicsElement):
                     elif rotate_length > 1:
                         rotate = rotate_list.pop(0)
 
-                    x_offset = position.x_offset / 64
-                    y_offset = position.y_offset / 64
+                    x_offset = x_offset / 64
+                    y_offset = y_offset / 64
                     x += dx + x_offset
                     y += dy - y_offset
                     if horizontal:
-                        advance = position.x_advance / 64
+                        advance = x_advance / 64
                         if para_level == UBiDi.UBIDI_RTL:
                             x -= advance
                         glyph_bbox = DOMRect(x,
@@ -437,12 +478,12 @@ class SVGTextContentElement(SVGGraphicsElement):
                         y_advance = 0
                     else:
                         # TODO: fix bbox for vertical text.
-                        advance = -position.y_advance / 64
+                        advance = -y_advance / 64
                         if sideways:
                             glyph_bbox = DOMRect(x,
                                                  y,
                                                  glyph_width,
-                                                 position.x_advance / 64)
+                                                 x_advance / 64)
                         else:
                             glyph_bbox = DOMRect(x,
                                                  y - advance + advance + y_offset,
@@ -466,13 +507,12 @@ class SVGTextContentElement(SVGGraphicsElement):
                     load_flags = FreeType.FT_LOAD_NO_BITMAP
                     if not horizontal:
                         load_flags |= FreeType.FT_LOAD_VERTICAL_LAYOUT
-                    face.load_glyph(info.codepoint, load_flags)
-                    glyph = face.glyph
-                    if force_embolden:
-                        glyph.embolden()
-                    if force_oblique:
-                        glyph.oblique()
-                    path_data = PathParser.from_glyph(face, matrix)
+                    outline = _get_glyph_outline(face,
+                                                 codepoint,
+                                                 load_flags,
+                                                 force_embolden,
+                                                 force_oblique)
+                    path_data = PathParser.from_glyph(face, matrix, outline)
                     if len(path_data) > 0:
                         line_path_data += path_data
 
@@ -503,12 +543,12 @@ class SVGTextContentElement(SVGGraphicsElement):
 
         return path_data_list, advance_list, text_bbox, (current_x, current_y)
 
-    def get_bbox(self, options=None, _depth=0):
+    def get_bbox(self, options=None, _matrix=None):
         """Returns the bounding box of the current element.
 
         Arguments:
             options (SVGBoundingBoxOptions, optional): Reserved.
-            _depth (int, optional): For internal use only.
+            _matrix (DOMMatrix, optional): For internal use only.
         Returns:
             DOMRect: The bounding box of the current element.
         """
@@ -517,6 +557,19 @@ class SVGTextContentElement(SVGGraphicsElement):
         if len(chars_info) == 0:
             return bbox
 
+        if _matrix is not None:
+            # called from the container element: transforms each character
+            # box by the current transform and the accumulated transform
+            matrix = _matrix
+            transform_matrix = _get_transform_matrix(self.get('transform'))
+            if transform_matrix is not None:
+                matrix = matrix * transform_matrix
+            if not matrix.isidentity:
+                rects = DOMRectArray.from_rects(
+                    [info[SVGTextContentElement._CHARS_BBOX]
+                     for info in chars_info])
+                return rects.transform(matrix).unite()
+
         for info in iter(chars_info):
             bbox |= info[SVGTextContentElement._CHARS_BBOX]
 
@@ -272,6 +272,19 @@ class URL(object):
             url = parsed_base.href
             self._parse_url(url)
 
+    def __copy__(self):
+        url = URL.__new__(URL)
+        url._protocol = self._protocol
+        url._username = self._username
+        url._password = self._password
+        url._hostname = self._hostname
+        url._host = self._host
+        url._port = self._port
+        url._pathname = self._pathname
+        url._search_params = URLSearchParams(self._search_params)
+        url._hash = self._hash
+        return url
+
     def __repr__(self):
         return repr({'href': self.tostring(),
                      'origin': self.origin,
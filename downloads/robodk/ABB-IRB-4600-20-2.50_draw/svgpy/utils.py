@@ -18,15 +18,30 @@ import os
 import re
 from collections import OrderedDict
 from collections.abc import MutableMapping
+from copy import copy
+from functools import lru_cache
 from pathlib import PurePath
 from urllib.parse import unquote
-from urllib.request import urlopen
+
+import tinycss2
 
 from .exception import InvalidCharacterError, NamespaceError
+from .fetcher import get_fetcher
 from .url import Location, URL
 
 _ASCII_WHITESPACE = '\t\n\f\r\x20'
 
+_NORMALIZE_URL_CACHE_SIZE = 1024
+
+_STYLE_CACHE_SIZE = 4096
+
+# 'name: value' followed by ';' or the end of the string, where the value may
+# contain quoted strings and non-nested parenthesized blocks
+_RE_STYLE_DECLARATION = re.compile(
+    r'[\s;]*([^:;\s]+)\s*:'
+    r'((?:"[^"]*"|\'[^\']*\'|\([^()"\']*\)|[^;"\'()])*)'
+    r'(?:;|$)')
+
 _RE_QUALIFIED_NAME = re.compile(
     r'{(?P<namespace>[^}]*)}(?P<local_name>.*)')
 
@@ -176,7 +191,21 @@ def is_ascii_whitespace(value):
     return False
 
 
-def load(src, encoding=None, **kwargs):
+def load(src, encoding=None, headers=None, **kwargs):
+    """Loads the resource.
+    The URLs other than 'data:' are fetched by the current fetcher (see
+    svgpy.fetcher.set_fetcher()).
+
+    Arguments:
+        src (str, URL): The location of the resource.
+        encoding (str, optional): The character encoding to decode the
+            content. If omitted, the content is returned as bytes.
+        headers (dict, optional): The request headers.
+        **kwargs: See svgpy.fetcher.Fetcher.fetch().
+    Returns:
+        tuple[bytes | str, CaseInsensitiveMapping]: The content and the
+            response headers.
+    """
     if isinstance(src, URL):
         url = src
     elif isinstance(src, str):
@@ -184,6 +213,7 @@ def load(src, encoding=None, **kwargs):
     else:
         raise TypeError('Expected str or URL, got {}'.format(src))
     scheme = url.protocol
+    request_headers = headers
     headers = CaseInsensitiveMapping()
     if scheme == 'data:':
         # data:[<MIME-type>][;charset=<encoding>][;base64],<data>
@@ -202,17 +232,27 @@ def load(src, encoding=None, **kwargs):
         headers['Content-Type'] = ';'.join(parameters)
         return data, headers
 
-    with urlopen(url.href, **kwargs) as response:
-        if hasattr(response, 'getheaders'):
-            headers.update(response.getheaders())
-        data = response.read()
-        if encoding is not None:
-            data = data.decode(encoding)
-        return data, headers
+    data, response_headers = get_fetcher().fetch(
+        url,
+        headers=None if request_headers is None else dict(request_headers),
+        **kwargs)
+    headers.update(response_headers)
+    if encoding is not None:
+        data = data.decode(encoding)
+    return data, headers
+
+
+@lru_cache(maxsize=_NORMALIZE_URL_CACHE_SIZE)
+def _parse_url(src, base=None):
+    # the cached URL objects are never returned as they are
+    return URL(src, base=base)
 
 
 def normalize_url(src, base=None):
     """Normalizes an URL.
+    The parsed URLs are cached by the pair of src and base, and a
+    fragment-only URL (e.g. '#id') replaces the fragment of the base URL
+    without parsing it.
 
     Arguments:
         src (str, Location): An entire URL or a relative-URL to be normalized.
@@ -228,7 +268,11 @@ def normalize_url(src, base=None):
         raise TypeError('Expected str or Location, got ' + repr(type(src)))
     if base is None or base.startswith('about:'):
         base = PurePath(os.getcwd()).as_uri()
-    return URL(_src, base=base)
+    if _src.startswith('#'):
+        url = copy(_parse_url(base))
+        url.hash = _src
+        return url
+    return copy(_parse_url(_src, base))
 
 
 def remove_quotes(src):
@@ -238,21 +282,55 @@ def remove_quotes(src):
     return src
 
 
+@lru_cache(maxsize=_STYLE_CACHE_SIZE)
+def _parse_style(text):
+    text = text.strip()
+    if len(text) == 0:
+        return ()
+    if '/*' in text or '\\' in text:
+        return _parse_style_complex(text)
+    elif not any(ch in text for ch in '"\'()'):
+        # the common 'name: value; ...' form
+        items = [x.split(':') for x in text.split(';')]
+        return tuple((x[0].strip(), x[1].strip())
+                     for x in items if len(x) == 2)
+    items = list()
+    pos = 0
+    while pos < len(text):
+        matched = _RE_STYLE_DECLARATION.match(text, pos)
+        if matched is None:
+            return _parse_style_complex(text)
+        items.append((matched.group(1), matched.group(2).strip()))
+        pos = matched.end()
+    return tuple(items)
+
+
+def _parse_style_complex(text):
+    items = list()
+    nodes = tinycss2.parse_declaration_list(text,
+                                            skip_comments=True,
+                                            skip_whitespace=True)
+    for node in nodes:
+        if node.type == 'declaration':
+            value = tinycss2.serialize(node.value).strip()
+            if node.important:
+                value += ' !important'
+            items.append((node.name, value))
+    return tuple(items)
+
+
 def style_to_dict(text):
     """Converts the style attribute's value to a dictionary.
+    The declarations of the same value are parsed once and cached.
 
     Arguments:
         text (str): The style attributes's value to be converted.
     Returns:
         OrderedDict: A dictionary.
     """
-    if text is None or len(text.strip()) == 0:
+    if text is None:
         return OrderedDict()
-    items = [x.split(':') for x in iter(text.strip().split(';'))]
-    items = [x for x in items if len(x) == 2]
-    return OrderedDict(
-        (key.strip(), value.strip()) for key, value in iter(items)
-    )
+    return OrderedDict(_parse_style(text))
 
 
 class CaseInsensitiveMapping(MutableMapping):
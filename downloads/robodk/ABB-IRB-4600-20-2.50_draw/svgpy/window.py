@@ -13,26 +13,40 @@
 # limitations under the License.
 
 
+import os
+import re
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from collections.abc import Collection
+from concurrent.futures import ThreadPoolExecutor
 from fractions import Fraction
+from functools import lru_cache
 from io import StringIO
 from logging import getLogger
+from pathlib import Path
 
+import numpy as np
 from lxml import etree
 
-from .core import SVGLength
-from .css import mediaquery as mq
+from .base import SVGGraphicsElement
+from .core import CSSUtils, Font, SVGLength
+from .css import CSSParser, mediaquery as mq
 from .css.screen import Screen
 from .dom import Element, Node, NonElementParentNode, ParentNode, \
-    node_insert_before
+    node_insert_before, node_write_to
 from .exception import HierarchyRequestError
-from .style import get_css_style_sheets
+from .path import PathDataArray
+from .style import get_css_rules, get_css_style_sheets, get_css_styles, \
+    get_style_sheet_urls
 from .url import Location
 from .utils import get_content_type, get_element_by_id, \
     get_elements_by_class_name, get_elements_by_tag_name, \
     get_elements_by_tag_name_ns, load, normalize_url
 
+# the lengths that are resolved against the font
+_RE_FONT_RELATIVE_LENGTH = re.compile(r'[0-9.](rem|em|ex|cap|ch|ic)\b',
+                                      re.IGNORECASE)
+
 
 class BrowsingContext(object):
     """A browsing context object that is associated with the document."""
@@ -89,6 +103,7 @@ class Document(Node, NonElementParentNode, ParentNode, Collection):
         self._content_type = (content_type if content_type is not None
                               else 'application/xml')
         self._document_element = None
+        self._index = None
         if document_element is not None:
             self.append(document_element)
         self._implementation = implementation
@@ -234,6 +249,56 @@ class Document(Node, NonElementParentNode, ParentNode, Collection):
         """str: The entire URL of the current document."""
         return self._location.href
 
+    def _get_index(self):
+        """Returns the element index of the document, building it in a
+        single traversal if it has been discarded.
+
+        Returns:
+            tuple[dict, dict, dict, list]: The id to the first element, the
+                class name to the elements, the qualified name to the
+                elements, and all elements, in document order.
+        """
+        index = self._index
+        if index is not None:
+            return index
+        ids = dict()
+        class_names = dict()
+        tag_names = dict()
+        elements = list()
+        root = self._document_element
+        if root is not None:
+            for element in root.iter(etree.Element):
+                elements.append(element)
+                tag_names.setdefault(element.tag_name, []).append(element)
+                element_id = element.get('id')
+                if element_id is not None and element_id not in ids:
+                    ids[element_id] = element
+                class_name = element.get('class')
+                if class_name is None:
+                    continue
+                for name in set(class_name.split()):
+                    class_names.setdefault(name, []).append(element)
+        index = self._index = ids, class_names, tag_names, elements
+        return index
+
+    def _contains(self, element):
+        """Returns True if the element is in the tree of the document
+        element.
+        """
+        root = self._document_element
+        if element is root:
+            return True
+        for ancestor in element.iterancestors():
+            if ancestor is root:
+                return True
+        return False
+
+    def _invalidate_index(self):
+        """Discards the element index of the document.
+        It is rebuilt on the next lookup by id, class name or tag name.
+        """
+        self._index = None
+
     def append(self, *nodes):
         """Inserts sub-nodes after the last child node.
 
@@ -255,6 +320,7 @@ class Document(Node, NonElementParentNode, ParentNode, Collection):
                         "The Element node must be insert first")
                 node.attach_document(self)
                 root = self._document_element = node
+                self._index = None
             elif node == root:
                 continue  # do nothing
             else:
@@ -287,6 +353,62 @@ class Document(Node, NonElementParentNode, ParentNode, Collection):
         _ = document
         return False
 
+    def compute_all_styles(self, max_workers=None):
+        """Computes the styles of all elements in the document in a single
+        top-down traversal.
+        The style rules are matched once per document, and the cascaded
+        properties of each element are passed down to its children.
+
+        Arguments:
+            max_workers (int, optional): The maximum number of threads that
+                compute the subtrees of the document element concurrently.
+                If None or less than 2, all elements are computed in the
+                calling thread.
+        Returns:
+            dict[Element, dict]: The computed styles of all elements, in
+                document order.
+        """
+        root = self._document_element
+        if root is None:
+            return {}
+        css_rules = get_css_rules(root)
+        css_styles = get_css_styles(root, css_rules)
+        no_style = dict(), dict()
+
+        def _compute_style(_element, _parent_cascaded):
+            _css_style, _css_style_important = css_styles.get(_element,
+                                                              no_style)
+            _cascaded = _element._cascade_style(_css_style,
+                                                _css_style_important,
+                                                _parent_cascaded)
+            return _cascaded, _element.get_computed_style(_cascaded=_cascaded)
+
+        def _compute_subtree_styles(_element, _parent_cascaded):
+            _computed_styles = dict()
+            _stack = [(_element, _parent_cascaded)]
+            while len(_stack) > 0:
+                _element, _parent_cascaded = _stack.pop()
+                _cascaded, _computed_styles[_element] = _compute_style(
+                    _element, _parent_cascaded)
+                _children = list(_element.iterchildren(tag=etree.Element))
+                _children.reverse()
+                _stack.extend((_child, _cascaded) for _child in _children)
+            return _computed_styles
+
+        if max_workers is None or max_workers < 2:
+            return _compute_subtree_styles(root, None)
+
+        cascaded, computed_style = _compute_style(root, None)
+        computed_styles = {root: computed_style}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_compute_subtree_styles,
+                                       child,
+                                       cascaded)
+                       for child in root.iterchildren(tag=etree.Element)]
+            for future in futures:
+                computed_styles.update(future.result())
+        return computed_styles
+
     def create_attribute(self, local_name):
         """Creates a new attribute instance, and returns it.
         See also SVGParser.create_attribute().
@@ -425,8 +547,49 @@ class Document(Node, NonElementParentNode, ParentNode, Collection):
         for node in nodes:
             self.append(node)
 
+    def get_bboxes(self, elements):
+        """Returns the bounding boxes of the elements.
+        The path data of the shapes are joined into a single path, so that
+        their extrema are solved at once. The bounding boxes of the
+        container elements and the elements that have their own
+        get_bbox() are computed one by one.
+
+        Arguments:
+            elements (list[SVGGraphicsElement]): A list of the elements.
+        Returns:
+            numpy.ndarray: The bounding boxes (x, y, width, height) with
+                shape (N, 4), in the same order as the elements. The
+                bounding box of an element that has no geometry is filled
+                with NaN.
+        """
+        bboxes = np.full((len(elements), 4), np.nan)
+        indices = list()
+        paths = list()
+        for index, element in enumerate(elements):
+            if not isinstance(element, SVGGraphicsElement):
+                raise TypeError('Expected SVGGraphicsElement, got {}'.format(
+                    type(element)))
+            elif (type(element).get_bbox is not SVGGraphicsElement.get_bbox
+                  or element.iscontainer()
+                  or element.local_name in ('defs', 'symbol')):
+                bbox = element.get_bbox()
+                if bbox.x is not None:
+                    bboxes[index] = bbox.x, bbox.y, bbox.width, bbox.height
+                continue
+            path_data = element.get_transformed_path_data(as_array=True)
+            if len(path_data) > 0:
+                indices.append(index)
+                paths.append(path_data)
+        if len(paths) > 0:
+            bboxes[indices] = PathDataArray.get_bboxes(paths)
+        return bboxes
+
     def get_element_by_id(self, element_id, nsmap=None):
         """Finds the first matching sub-element, by id.
+        The element index of the document is used. A stale match or a miss
+        is looked up again in the tree, so that the elements changed by the
+        lxml API directly are found; but a match does not take account of
+        the elements added by the lxml API.
 
         Arguments:
             element_id (str): The id of the element.
@@ -438,10 +601,24 @@ class Document(Node, NonElementParentNode, ParentNode, Collection):
         root = self._document_element
         if root is None:
             return None
-        return get_element_by_id(root, element_id, nsmap=nsmap)
+        ids = self._get_index()[0]
+        element = ids.get(element_id)
+        if element is not None and (element.get('id') != element_id
+                                    or not self._contains(element)):
+            # changed outside of the DOM methods
+            self._invalidate_index()
+            ids = self._get_index()[0]
+            element = ids.get(element_id)
+        if element is None:
+            element = get_element_by_id(root, element_id, nsmap=nsmap)
+            if element is not None:
+                # added outside of the DOM methods
+                self._invalidate_index()
+        return element
 
     def get_elements_by_class_name(self, class_names, nsmap=None):
         """Finds all matching sub-elements, by class names.
+        See also Document.get_element_by_id() for the element index.
 
         Arguments:
             class_names (str): A list of class names that are separated by
@@ -450,16 +627,34 @@ class Document(Node, NonElementParentNode, ParentNode, Collection):
         Returns:
             list[Element]: A list of elements.
         """
+        names = class_names.split()
         root = self._document_element
-        if root is None:
+        if root is None or len(names) == 0:
             return []
-        return get_elements_by_class_name(root,
-                                          class_names,
-                                          nsmap=nsmap,
-                                          include_self=True)
+        name = names[0]
+        elements = self._get_index()[1].get(name, [])
+        if not all(name in (element.get('class') or '').split()
+                   and self._contains(element)
+                   for element in elements):
+            # changed outside of the DOM methods
+            self._invalidate_index()
+            elements = self._get_index()[1].get(name, [])
+        names = set(names[1:])
+        elements = [element for element in elements
+                    if names.issubset(element.get('class').split())]
+        if len(elements) == 0:
+            elements = get_elements_by_class_name(root,
+                                                  class_names,
+                                                  nsmap=nsmap,
+                                                  include_self=True)
+            if len(elements) > 0:
+                # added outside of the DOM methods
+                self._invalidate_index()
+        return elements
 
     def get_elements_by_tag_name(self, qualified_name, nsmap=None):
         """Finds all matching sub-elements, by the qualified name.
+        See also Document.get_element_by_id() for the element index.
 
         Arguments:
             qualified_name (str): The qualified name or '*'.
@@ -470,10 +665,31 @@ class Document(Node, NonElementParentNode, ParentNode, Collection):
         root = self._document_element
         if root is None:
             return []
-        return get_elements_by_tag_name(root,
-                                        qualified_name,
-                                        nsmap=nsmap,
-                                        include_self=True)
+
+        def _lookup():
+            _, _, _tag_names, _elements = self._get_index()
+            if qualified_name == '*':
+                return _elements
+            return _tag_names.get(qualified_name, [])
+
+        elements = _lookup()
+        if not all((qualified_name == '*'
+                    or element.tag_name == qualified_name)
+                   and self._contains(element)
+                   for element in elements):
+            # changed outside of the DOM methods
+            self._invalidate_index()
+            elements = _lookup()
+        elements = list(elements)
+        if len(elements) == 0:
+            elements = get_elements_by_tag_name(root,
+                                                qualified_name,
+                                                nsmap=nsmap,
+                                                include_self=True)
+            if len(elements) > 0:
+                # added outside of the DOM methods
+                self._invalidate_index()
+        return elements
 
     def get_elements_by_tag_name_ns(self, namespace, local_name,
                                     nsmap=None):
@@ -604,6 +820,7 @@ class Document(Node, NonElementParentNode, ParentNode, Collection):
         root = self._document_element
         if node == root:
             self._document_element = None
+            self._index = None
             return
         root.append(node)  # move
         root.remove(node)
@@ -664,6 +881,27 @@ class Document(Node, NonElementParentNode, ParentNode, Collection):
             return b''
         return etree.tostring(root.getroottree(), **kwargs)
 
+    def write_to(self, fileobj, chunk_size=None, **kwargs):
+        """Reimplemented from Node.write_to().
+
+        Serializes a document incrementally into a file. Writes nothing if
+        the document has no document element.
+
+        Arguments:
+            fileobj (str, os.PathLike, file-like object): A filename or a
+                file object opened in binary mode.
+            chunk_size (int, optional): The size in bytes of each write to
+                the file.
+            **kwargs: See lxml.etree._ElementTree.write().
+        """
+        root = self._document_element
+        if root is None:
+            return
+        node_write_to(fileobj,
+                      root.getroottree(),
+                      chunk_size=chunk_size,
+                      **kwargs)
+
 
 class DOMImplementation(ABC):
     """Represents the [DOM] DOMImplementation."""
@@ -709,14 +947,25 @@ class MediaQueryList(object):
         """
         self._browsing_context = browsing_context
         self._query = query
-        self._tree = mq.parse(self._query)
+        self._tree = MediaQueryList._parse(query)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _parse(query):
+        return mq.parse(query)
 
     @property
     def matches(self):
         """bool: The matches state of the associated media query list."""
         doc = self._browsing_context.document
         win = self._browsing_context.window
+        screen = win.screen
         context = doc.document_element
+        key = self._get_key(win, context)
+        matches = win._get_media_match(key) if key is not None else None
+        if matches is not None:
+            return matches
+
         if context is not None:
             _, _, vpw, vph = context.get_viewport_size()
             width = vpw.value()
@@ -725,7 +974,6 @@ class MediaQueryList(object):
             width = win.inner_width
             height = win.inner_height
         aspect_ratio = Fraction(int(width), int(height))
-        screen = win.screen
         device_aspect_ratio = Fraction(int(screen.width), int(screen.height))
         conditions = {
             'media': screen.media,
@@ -750,8 +998,44 @@ class MediaQueryList(object):
         }
         matches, _ = mq.match(self._tree, conditions, _mql_compare,
                               user_data=context)
+        if key is not None:
+            win._set_media_match(key, matches)
         return matches
 
+    def _get_key(self, win, context):
+        """Returns the key of the matches state from the inputs of the
+        evaluated media features, without computing the viewport size:
+        the screen state, the window size and zoom, the viewport attributes
+        of the document element, and the font size for the font-relative
+        lengths. Returns None if the state depends on the glyph metrics of
+        the font, that is not cached.
+        """
+        texts = [self._query]
+        if context is not None:
+            viewport = context.get('width'), context.get('height')
+            texts.extend(x for x in viewport if x is not None)
+        else:
+            viewport = None
+        units = set(unit.lower()
+                    for text in texts
+                    for unit in _RE_FONT_RELATIVE_LENGTH.findall(text))
+        font_size = None
+        if len(units) > 0:
+            if not units.issubset(('em', 'rem')):
+                return None  # ex, cap, ch and ic
+            font_size = Font.default_font_size
+            if context is not None and 'rem' in units:
+                font_size = (font_size,
+                             CSSUtils.compute_font_size(context))
+        return (self._query,
+                context,
+                win.screen.state,
+                win.page_zoom_scale,
+                win.inner_width,
+                win.inner_height,
+                viewport,
+                font_size)
+
     @property
     def media(self):
         """str: The serialized form of the associated media query list."""
@@ -824,16 +1108,23 @@ class SVGDOMImplementation(DOMImplementation):
                                    nsmap=nsmap)
         return doc
 
-    def parse(self, source):
+    def parse(self, source, prefetch=True):
         """Parses an SVG document, and returns the root element of it.
 
         Arguments:
             source (str, file): An URL or a file-like object of an SVG
                 document.
+            prefetch (bool, optional): If True, the external style sheets
+                that are referenced by the document are fetched
+                concurrently before returning. The prefetch is skipped if the
+                URL of the document is unknown. See also
+                CSSParser.prefetch().
         Returns:
             Element: A root element of the document.
         """
+        base_url = None
         if isinstance(source, str):
+            base_url = source
             data, headers = load(source)
             content_type = get_content_type(headers)
             if content_type is None:
@@ -844,12 +1135,24 @@ class SVGDOMImplementation(DOMImplementation):
         else:
             data = source
         tree = self._parser.parse(data)
-        return tree.getroot()
+        root = tree.getroot()
+        if base_url is None:
+            # the name of the file object if any
+            base_url = tree.docinfo.URL
+            if base_url is not None and os.path.isfile(base_url):
+                base_url = Path(base_url).resolve().as_uri()
+        if prefetch and root is not None and base_url is not None:
+            urls = get_style_sheet_urls(root, base_url)
+            if len(urls) > 0:
+                CSSParser.prefetch(urls)
+        return root
 
 
 class Window(object):
     """Represents the [HTML] Window."""
 
+    MAX_MEDIA_MATCHES = 256
+
     def __init__(self, implementation):
         """Constructs a Window object.
 
@@ -867,6 +1170,18 @@ class Window(object):
         self._inner_width = self._screen.width
         self._inner_height = self._screen.height
         self._page_zoom_scale = 1.
+        self._media_matches = OrderedDict()
+
+    def _get_media_match(self, key):
+        matches = self._media_matches.get(key)
+        if matches is not None:
+            self._media_matches.move_to_end(key)
+        return matches
+
+    def _set_media_match(self, key, matches):
+        self._media_matches[key] = matches
+        while len(self._media_matches) > Window.MAX_MEDIA_MATCHES:
+            self._media_matches.popitem(last=False)
 
     @property
     def device_pixel_ratio(self):
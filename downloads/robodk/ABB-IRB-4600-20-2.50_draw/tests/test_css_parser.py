@@ -0,0 +1,29 @@
+import unittest
+
+from svgpy.css import CSSParser, CSSRule
+
+
+class CSSParserTestCase(unittest.TestCase):
+    def tearDown(self):
+        CSSParser.clear_cache()
+
+    def test_parse_data_url(self):
+        style_sheet = CSSParser.parse(
+            'data:text/css,rect%7Bfill:red%7D%20circle%7Bfill:blue%7D')
+        css_rules = style_sheet.css_rules
+        self.assertEqual(len(css_rules), 2)
+        self.assertEqual(css_rules[0].type, CSSRule.STYLE_RULE)
+        self.assertEqual(css_rules[0].selector_text, 'rect')
+        self.assertEqual(css_rules[0].style['fill'], 'red')
+        self.assertEqual(css_rules[1].selector_text, 'circle')
+
+    def test_parse_data_url_same_as_fromstring(self):
+        text = 'rect{fill:red}'
+        rules = CSSParser.fromstring(text)
+        style_sheet = CSSParser.parse('data:text/css,' + text)
+        self.assertEqual([rule.css_text for rule in rules],
+                         [rule.css_text for rule in style_sheet.css_rules])
+
+
+if __name__ == '__main__':
+    unittest.main()
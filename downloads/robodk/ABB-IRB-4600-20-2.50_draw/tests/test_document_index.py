@@ -0,0 +1,73 @@
+import unittest
+from io import BytesIO
+
+from lxml import etree
+
+from svgpy.window import SVGDOMImplementation, XMLDocument
+
+
+def create_document(text):
+    impl = SVGDOMImplementation()
+    root = impl.parse(BytesIO(text.encode()), prefetch=False)
+    return XMLDocument(document_element=root, implementation=impl)
+
+
+class DocumentIndexTestCase(unittest.TestCase):
+    def test_move_element_between_documents(self):
+        d1 = create_document(
+            '<svg xmlns="http://www.w3.org/2000/svg">'
+            '<rect id="a" class="foo"/></svg>')
+        d2 = create_document(
+            '<svg xmlns="http://www.w3.org/2000/svg"/>')
+        a = d1.get_element_by_id('a')
+        self.assertEqual(d1.get_elements_by_class_name('foo'), [a])
+        self.assertEqual(d1.get_elements_by_tag_name('rect'), [a])
+        self.assertEqual(d2.get_elements_by_tag_name('rect'), [])
+
+        d2.document_element.append_child(a)
+        self.assertIs(a.owner_document, d2)
+        self.assertEqual(d1.get_elements_by_class_name('foo'), [])
+        self.assertEqual(d1.get_elements_by_tag_name('rect'), [])
+        self.assertIsNone(d1.get_element_by_id('a'))
+        self.assertEqual(d2.get_elements_by_class_name('foo'), [a])
+        self.assertEqual(d2.get_elements_by_tag_name('rect'), [a])
+        self.assertIs(d2.get_element_by_id('a'), a)
+
+    def test_change_attribute_by_lxml(self):
+        doc = create_document(
+            '<svg xmlns="http://www.w3.org/2000/svg">'
+            '<rect id="a" class="foo bar"/></svg>')
+        a = doc.get_element_by_id('a')
+        self.assertEqual(doc.get_elements_by_class_name('foo'), [a])
+
+        a.attrib['class'] = 'baz'
+        self.assertEqual(doc.get_elements_by_class_name('baz'), [a])
+        self.assertEqual(doc.get_elements_by_class_name('foo'), [])
+        self.assertEqual(doc.get_elements_by_class_name('foo bar'), [])
+
+        a.attrib['id'] = 'b'
+        self.assertIsNone(doc.get_element_by_id('a'))
+        self.assertIs(doc.get_element_by_id('b'), a)
+
+    def test_sub_element_by_lxml(self):
+        doc = create_document(
+            '<svg xmlns="http://www.w3.org/2000/svg">'
+            '<rect id="a"/></svg>')
+        root = doc.document_element
+        self.assertIsNone(doc.get_element_by_id('c'))
+        self.assertEqual(doc.get_elements_by_tag_name('circle'), [])
+
+        c = etree.SubElement(root, '{http://www.w3.org/2000/svg}circle',
+                             id='c')
+        self.assertIs(doc.get_element_by_id('c'), c)
+        self.assertEqual(doc.get_elements_by_tag_name('circle'), [c])
+        self.assertEqual(len(doc.get_elements_by_tag_name('*')), 3)
+
+        del root[-1]
+        self.assertIsNone(doc.get_element_by_id('c'))
+        self.assertEqual(doc.get_elements_by_tag_name('circle'), [])
+        self.assertEqual(len(doc.get_elements_by_tag_name('*')), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.error import HTTPError
+
+from svgpy.fetcher import DefaultFetcher, HTTPCache
+
+CONTENT = b'rect { fill: red; }'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.path, self.client_address,
+                                    self.headers.get('If-None-Match')))
+        if self.path == '/max-age.css':
+            self.send_content({'Cache-Control': 'max-age=3600'})
+        elif self.path == '/etag.css':
+            if self.headers.get('If-None-Match') == '"v1"':
+                self.send_response(304)
+                self.send_header('ETag', '"v1"')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            self.send_content({'Cache-Control': 'no-cache', 'ETag': '"v1"'})
+        else:
+            self.send_error(404)
+
+    def send_content(self, headers):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/css')
+        self.send_header('Content-Length', str(len(CONTENT)))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(CONTENT)
+
+    def log_message(self, format_, *args):
+        pass
+
+
+class DefaultFetcherTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        server.daemon_threads = True
+        server.lock = threading.Lock()
+        server.requests = list()
+        cls.server = server
+        cls.thread = threading.Thread(target=server.serve_forever)
+        cls.thread.daemon = True
+        cls.thread.start()
+        cls.base_url = 'http://127.0.0.1:{}'.format(server.server_port)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.thread.join()
+
+    def setUp(self):
+        with self.server.lock:
+            del self.server.requests[:]
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.cache = HTTPCache(os.path.join(self.tempdir.name, 'http'))
+        self.fetcher = DefaultFetcher(cache=self.cache, timeout=10)
+
+    def tearDown(self):
+        self.fetcher.close()
+        self.tempdir.cleanup()
+
+    def get_requests(self, path=None):
+        with self.server.lock:
+            return [request for request in self.server.requests
+                    if path is None or request[0] == path]
+
+    def test_keep_alive(self):
+        fetcher = DefaultFetcher(timeout=10)
+        try:
+            for _ in range(3):
+                data, _ = fetcher.fetch(self.base_url + '/etag.css')
+                self.assertEqual(data, CONTENT)
+        finally:
+            fetcher.close()
+        requests = self.get_requests()
+        self.assertEqual(len(requests), 3)
+        # all requests are sent through a single connection
+        self.assertEqual(len(set(request[1] for request in requests)), 1)
+
+    def test_max_age_from_disk(self):
+        url = self.base_url + '/max-age.css'
+        data, _ = self.fetcher.fetch(url)
+        self.assertEqual(data, CONTENT)
+
+        # a new fetcher with the same cache directory
+        fetcher = DefaultFetcher(cache=HTTPCache(self.cache.directory))
+        try:
+            data, headers = fetcher.fetch(url)
+        finally:
+            fetcher.close()
+        self.assertEqual(data, CONTENT)
+        self.assertIn(('Cache-Control', 'max-age=3600'), headers)
+        self.assertEqual(len(self.get_requests('/max-age.css')), 1)
+
+    def test_revalidate(self):
+        url = self.base_url + '/etag.css'
+        for _ in range(2):
+            data, headers = self.fetcher.fetch(url)
+            self.assertEqual(data, CONTENT)
+            self.assertIn(('ETag', '"v1"'), headers)
+        requests = self.get_requests('/etag.css')
+        self.assertEqual([request[2] for request in requests],
+                         [None, '"v1"'])
+
+        # the conditional request of the caller
+        with self.assertRaises(HTTPError) as cm:
+            self.fetcher.fetch(url, headers={'If-None-Match': '"v1"'})
+        self.assertEqual(cm.exception.code, 304)
+
+    def test_not_found(self):
+        with self.assertRaises(HTTPError) as cm:
+            self.fetcher.fetch(self.base_url + '/missing.css')
+        self.assertEqual(cm.exception.code, 404)
+        self.assertIsNone(self.cache.get(self.base_url + '/missing.css'))
+
+    def test_file(self):
+        path = Path(self.tempdir.name, 'style.css')
+        path.write_bytes(CONTENT)
+        data, headers = self.fetcher.fetch(path.resolve().as_uri())
+        self.assertEqual(data, CONTENT)
+        self.assertIn(('Content-type', 'text/css'), headers)
+        self.assertIn(('Content-length', str(len(CONTENT))), headers)
+
+        path.write_bytes(b'')
+        data, _ = self.fetcher.fetch(path.resolve().as_uri())
+        self.assertEqual(data, b'')
+
+
+if __name__ == '__main__':
+    unittest.main()
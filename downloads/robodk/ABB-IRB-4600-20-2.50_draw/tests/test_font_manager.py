@@ -0,0 +1,43 @@
+import threading
+import unittest
+from unittest import mock
+
+from svgpy.core import FontManager
+
+
+class FontManagerTestCase(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(FontManager, '_new_face',
+                                    side_effect=lambda *_: mock.Mock())
+        self.new_face = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(FontManager._faces.clear)
+
+    def test_face_pool_per_thread(self):
+        face = FontManager.get_sized_face('a.ttf', 0, 0, 16 * 64, 96, 96)
+        self.assertIs(
+            FontManager.get_sized_face('a.ttf', 0, 0, 16 * 64, 96, 96),
+            face)
+        self.assertIsNot(
+            FontManager.get_sized_face('a.ttf', 0, 0, 20 * 64, 96, 96),
+            face)
+
+        faces = list()
+
+        def _get_faces():
+            _face = FontManager.get_sized_face('a.ttf', 0, 0, 16 * 64, 96,
+                                               96)
+            faces.append(_face)
+            faces.append(FontManager.get_sized_face('a.ttf', 0, 0, 16 * 64,
+                                                    96, 96))
+
+        thread = threading.Thread(target=_get_faces)
+        thread.start()
+        thread.join()
+        self.assertIs(faces[0], faces[1])
+        self.assertIsNot(faces[0], face)
+        self.assertEqual(self.new_face.call_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
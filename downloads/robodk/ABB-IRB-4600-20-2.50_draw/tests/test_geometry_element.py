@@ -0,0 +1,31 @@
+import unittest
+from io import BytesIO
+
+from svgpy.window import SVGDOMImplementation
+
+SVG_NS = 'http://www.w3.org/2000/svg'
+
+
+def parse(text, prefetch=False):
+    impl = SVGDOMImplementation()
+    return impl.parse(BytesIO(text.encode()), prefetch=prefetch)
+
+
+class GeometryElementTestCase(unittest.TestCase):
+    def test_total_length_font_relative(self):
+        # same attributes, different font sizes
+        root = parse(
+            '<svg xmlns="http://www.w3.org/2000/svg">'
+            '<g font-size="40"><circle r="1em"/></g>'
+            '<g font-size="10"><circle r="1em"/></g>'
+            '</svg>')
+        circles = list(root.iter('{{{}}}circle'.format(SVG_NS)))
+        lengths = [circle.get_total_length() for circle in circles * 2]
+        self.assertAlmostEqual(lengths[0], 251.36, delta=0.01)
+        self.assertAlmostEqual(lengths[1], 62.84, delta=0.01)
+        self.assertAlmostEqual(lengths[2], 251.36, delta=0.01)
+        self.assertAlmostEqual(lengths[3], 62.84, delta=0.01)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,28 @@
+import unittest
+
+from svgpy.geometry.matrix import DOMMatrix
+
+
+class DOMMatrixTestCase(unittest.TestCase):
+    def test_matrix_is_read_only(self):
+        m2d = DOMMatrix([1, 2, 3, 4, 5, 6])
+        m3d = DOMMatrix([1, 0, 0, 0,
+                         0, 1, 0, 0,
+                         0, 0, 1, 0,
+                         5, 6, 7, 1])
+        for m in m2d, m3d:
+            array = m.matrix
+            with self.assertRaises(ValueError):
+                array[0, 3] = 100
+            self.assertNotEqual(m.e, 100)
+
+        m3d.e = 100
+        self.assertEqual(m3d.matrix[0, 3], 100)
+        m2d.e = 100
+        self.assertEqual(m2d.matrix[0, 3], 100)
+        self.assertTrue(m2d.is2d)
+        self.assertFalse(m3d.is2d)
+
+
+if __name__ == '__main__':
+    unittest.main()
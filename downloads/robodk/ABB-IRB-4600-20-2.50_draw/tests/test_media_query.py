@@ -0,0 +1,52 @@
+import unittest
+from unittest import mock
+
+from svgpy.base import SVGElement
+from svgpy.core import Font
+from svgpy.window import SVGDOMImplementation, Window
+
+
+class MediaQueryListTestCase(unittest.TestCase):
+    def setUp(self):
+        self.window = Window(SVGDOMImplementation())
+        self.root = self.window.document.document_element
+        self.root.set('width', '800')
+        self.root.set('height', '600')
+
+    def test_cache(self):
+        win = self.window
+        self.assertTrue(win.match_media('(min-width: 700px)').matches)
+        with mock.patch.object(SVGElement, 'get_viewport_size',
+                               autospec=True) as get_viewport_size:
+            self.assertTrue(win.match_media('(min-width: 700px)').matches)
+        get_viewport_size.assert_not_called()
+
+        self.root.set('width', '600')
+        self.assertFalse(win.match_media('(min-width: 700px)').matches)
+        self.root.set('width', '50%')
+        win.inner_width = 2000
+        self.assertTrue(win.match_media('(min-width: 700px)').matches)
+
+    def test_screen_state(self):
+        win = self.window
+        query = '(orientation: portrait)'
+        win.screen.width, win.screen.height = 1280, 1024
+        self.assertFalse(win.match_media(query).matches)
+        win.screen.width, win.screen.height = 1024, 1280
+        self.assertTrue(win.match_media(query).matches)
+
+    def test_font_relative_lengths(self):
+        win = self.window
+        query = '(min-width: 40em)'
+        default_font_size = Font.default_font_size
+        try:
+            Font.default_font_size = 16
+            self.assertTrue(win.match_media(query).matches)
+            Font.default_font_size = 25
+            self.assertFalse(win.match_media(query).matches)
+        finally:
+            Font.default_font_size = default_font_size
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import random
+import unittest
+
+import numpy as np
+
+from svgpy import formatter
+from svgpy.path import PathParser
+
+
+def create_path_data(r, length):
+    items = list()
+    for index in range(length):
+        command = r.choice('Mm' if index == 0 else 'MmLlHhVvCcSsQqZz')
+        size = {'M': 2, 'L': 2, 'H': 1, 'V': 1, 'C': 6, 'S': 4, 'Q': 4,
+                'Z': 0}[command.upper()]
+        numbers = ['{:.{}f}'.format(r.uniform(-300, 300), r.randint(0, 6))
+                   for _ in range(size * r.choice([1, 1, 2]))]
+        numbers += [r.choice(['0', '-0', '.5', '-.5', '5.', '+3'])
+                    for _ in range(size)]
+        text = r.choice([' ', ',', ', ']).join(numbers)
+        if r.random() < 0.3:
+            text = text.replace(' -', '-').replace(',-', '-')
+        items.append(command + r.choice(['', ' ']) + text)
+    return ' '.join(items)
+
+
+def dump(path_data):
+    return [(segment.type, [repr(x) for x in segment.values])
+            for segment in path_data]
+
+
+class PathDataArrayTestCase(unittest.TestCase):
+    def test_to_array(self):
+        r = random.Random(1)
+        for _ in range(50):
+            d = create_path_data(r, 300)
+            expected = PathParser._normalize(PathParser._iter_segments(d))
+            self.assertEqual(dump(PathParser.to_array(d).tolist()),
+                             dump(expected.tolist()), d)
+
+    def test_to_array_fallback(self):
+        for d in ('M0 0 A1 1 0 0 1 2 2 ' * 200, 'M1e2 2 ' * 300,
+                  'M0 0 L1 ' * 300, 'M0 0 T1 2 ' * 300):
+            expected = PathParser._normalize(PathParser._iter_segments(d))
+            self.assertEqual(dump(PathParser.to_array(d).tolist()),
+                             dump(expected.tolist()))
+
+    def test_tostring(self):
+        r = random.Random(2)
+        for _ in range(20):
+            path_data = PathParser.to_array(create_path_data(r, 100))
+            expected = ' '.join(segment.tostring()
+                                for segment in path_data.tolist())
+            self.assertEqual(path_data.tostring(), expected)
+            self.assertEqual(PathParser.tostring(path_data), expected)
+            self.assertEqual(PathParser.tostring(path_data.tolist()),
+                             expected)
+
+
+class FormatterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.precision = formatter.precision
+        self.chunk_size = formatter._CHUNK_SIZE
+
+    def tearDown(self):
+        formatter.precision = self.precision
+        formatter._CHUNK_SIZE = self.chunk_size
+
+    def test_format_number_sequence(self):
+        r = np.random.RandomState(3)
+        values = np.concatenate((
+            r.uniform(-1000, 1000, 1000), r.randint(-999, 999, 1000) / 8,
+            r.uniform(-1, 1, 1000) * 10.0 ** r.randint(-8, 12, 1000),
+            [0.0, -0.0, 0.5, -0.5, 1.5, 2.5, 999999.9999995, 1e-7, -1e-7]))
+        for precision in 1, 2, 3, 6, 8:
+            formatter.precision = precision
+            expected = [formatter._format_number(x)
+                        for x in values.tolist()]
+            self.assertEqual(formatter.format_number_sequence(values),
+                             expected)
+
+    def test_format_command_sequence(self):
+        commands = 'MLCZ' * 100
+        counts = [2, 2, 6, 0] * 100
+        values = np.random.RandomState(4).uniform(-100, 100, 1000)
+        values[[5, 500]] = np.nan, np.inf
+        numbers = iter(formatter._format_number(x) for x in values.tolist())
+        expected = ' '.join(
+            command + ' '.join(next(numbers) for _ in range(count))
+            for command, count in zip(commands, counts))
+        for chunk_size in 7, 1 << 16:
+            formatter._CHUNK_SIZE = chunk_size
+            self.assertEqual(formatter.format_command_sequence(
+                commands, counts, values), expected)
+        self.assertEqual(formatter.format_command_sequence(
+            commands[:8], counts[:8], values[:20]),
+            expected[:expected.index('Z', expected.index('Z') + 1) + 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import os
+import tempfile
+import unittest
+from io import BytesIO
+from unittest import mock
+
+from svgpy.css import CSSParser
+from svgpy.window import SVGDOMImplementation
+
+SOURCE = (
+    b'<?xml-stylesheet href="style.css"?>'
+    b'<svg xmlns="http://www.w3.org/2000/svg"/>')
+
+DATA_SOURCE = (
+    b'<?xml-stylesheet type="text/css"'
+    b' href="data:text/css,svg%7Crect%7Bfill:red%7D"?>'
+    b'<?xml-stylesheet type="text/xsl" href="transform.xsl"?>'
+    b'<svg xmlns="http://www.w3.org/2000/svg"><rect id="r"/></svg>')
+
+
+class PrefetchTestCase(unittest.TestCase):
+    def test_unknown_base_url(self):
+        impl = SVGDOMImplementation()
+        with mock.patch.object(CSSParser, 'prefetch') as prefetch:
+            root = impl.parse(BytesIO(SOURCE))
+        self.assertIsNotNone(root)
+        prefetch.assert_not_called()
+
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        for name in os.listdir(self.dirname):
+            os.remove(os.path.join(self.dirname, name))
+        os.rmdir(self.dirname)
+        CSSParser.clear_cache()
+
+    def write_file(self, data):
+        filename = os.path.join(self.dirname, 'image.svg')
+        with open(filename, 'wb') as fp:
+            fp.write(data)
+        return filename
+
+    def test_named_file(self):
+        impl = SVGDOMImplementation()
+        dirname = self.dirname
+        filename = self.write_file(SOURCE)
+        with mock.patch.object(CSSParser, 'prefetch') as prefetch:
+            with open(filename, 'rb') as fp:
+                impl.parse(fp)
+        prefetch.assert_called_once()
+        urls = prefetch.call_args[0][0]
+        self.assertEqual(len(urls), 1)
+        self.assertTrue(urls[0][0].endswith(
+            '/' + os.path.basename(dirname) + '/style.css'), urls)
+
+    def test_skip_data_and_non_css(self):
+        impl = SVGDOMImplementation()
+        filename = self.write_file(DATA_SOURCE)
+        with mock.patch.object(CSSParser, '_load_rules',
+                               wraps=CSSParser._load_rules) as load_rules:
+            with open(filename, 'rb') as fp:
+                root = impl.parse(fp)
+        load_rules.assert_not_called()
+        rect = root.get_element_by_id('r')
+        self.assertEqual(rect.get_computed_style()['fill'], 'red')
+
+    def test_errors_are_ignored(self):
+        impl = SVGDOMImplementation()
+        filename = self.write_file(SOURCE)
+        with mock.patch.object(CSSParser, '_load_rules',
+                               side_effect=TypeError('unexpected')):
+            with open(filename, 'rb') as fp:
+                root = impl.parse(fp)
+        self.assertIsNotNone(root)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+from io import BytesIO
+
+from svgpy.window import SVGDOMImplementation, XMLDocument
+
+SOURCE = (
+    '<?xml-stylesheet href="style.css"?>\n'
+    '<!-- leading comment -->\n'
+    '<svg xmlns="http://www.w3.org/2000/svg">'
+    '<g id="g1"><rect/>é</g>tail<!--inner--></svg>\n'
+    '<!-- trailing comment -->')
+
+
+def create_document(text):
+    impl = SVGDOMImplementation()
+    root = impl.parse(BytesIO(text.encode()), prefetch=False)
+    return XMLDocument(document_element=root, implementation=impl)
+
+
+def write_to(node, chunk_size=None, **kwargs):
+    fp = BytesIO()
+    node.write_to(fp, chunk_size=chunk_size, **kwargs)
+    return fp.getvalue()
+
+
+class WriteToTestCase(unittest.TestCase):
+    def test_document_element(self):
+        doc = create_document(SOURCE)
+        root = doc.document_element
+        for chunk_size in None, 1, 7:
+            self.assertEqual(write_to(root, chunk_size), root.tostring())
+        kwargs = dict(encoding='iso-8859-1', pretty_print=True)
+        self.assertEqual(write_to(root, **kwargs), root.tostring(**kwargs))
+        kwargs = dict(encoding='utf-8', xml_declaration=True)
+        self.assertEqual(write_to(root, **kwargs), root.tostring(**kwargs))
+
+    def test_document(self):
+        doc = create_document(SOURCE)
+        data = write_to(doc, chunk_size=5)
+        self.assertEqual(data, doc.tostring())
+        self.assertIn(b'<!-- trailing comment -->', data)
+
+    def test_sub_nodes(self):
+        doc = create_document(SOURCE)
+        root = doc.document_element
+        group = doc.get_element_by_id('g1')
+        self.assertEqual(write_to(group), group.tostring())
+        self.assertEqual(write_to(group, with_tail=False),
+                         group.tostring(with_tail=False))
+        comment = root[-1]
+        self.assertEqual(write_to(comment), b'<!--inner-->')
+
+    def test_filename(self):
+        doc = create_document(SOURCE)
+        root = doc.document_element
+        fd, filename = tempfile.mkstemp(suffix='.svg')
+        os.close(fd)
+        try:
+            root.write_to(filename)
+            with open(filename, 'rb') as fp:
+                self.assertEqual(fp.read(), root.tostring())
+        finally:
+            os.remove(filename)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+from io import BytesIO
+
+from svgpy.window import SVGDOMImplementation, XMLDocument
+
+SOURCE = '''<svg xmlns="http://www.w3.org/2000/svg" width="200" height="100">
+<style type="text/css">
+@namespace svg url(http://www.w3.org/2000/svg);
+svg|g #q { fill: red; }
+.c #q { stroke: blue; }
+svg|g > svg|rect { stroke-width: 3; }
+.c > .d svg|rect { stroke-linecap: round; }
+svg|rect + svg|circle { fill: green !important; }
+svg|svg > svg|g.c { font-size: 20px; }
+</style>
+<g class="c">
+  <rect id="q" width="10" height="10"/>
+  <circle r="5" fill="yellow"/>
+  <g class="d"><rect id="r" width="10" height="10"/></g>
+</g>
+<rect id="s" width="10" height="10"/>
+</svg>
+'''
+
+
+def create_document(text):
+    impl = SVGDOMImplementation()
+    root = impl.parse(BytesIO(text.encode()), prefetch=False)
+    return XMLDocument(document_element=root, implementation=impl)
+
+
+class ComputedStyleTestCase(unittest.TestCase):
+    def test_compute_all_styles(self):
+        doc = create_document(SOURCE)
+        root = doc.document_element
+        computed_styles = doc.compute_all_styles()
+        elements = list(root.iter())
+        self.assertEqual(list(computed_styles.keys()), elements)
+        for element in elements:
+            self.assertEqual(computed_styles[element],
+                             element.get_computed_style(),
+                             element.tag_name)
+
+        q = doc.get_element_by_id('q')
+        style = q.get_computed_style()
+        self.assertEqual(style['fill'], 'red')
+        self.assertEqual(style['stroke'], 'blue')
+        self.assertEqual(style['stroke-width'], 3)
+        r = doc.get_element_by_id('r')
+        self.assertEqual(r.get_computed_style()['stroke-linecap'], 'round')
+        s = doc.get_element_by_id('s')
+        self.assertEqual(s.get_computed_style()['fill'], 'black')
+        circle = root.get_elements_by_tag_name('circle')[0]
+        self.assertEqual(circle.get_computed_style()['fill'], 'green')
+
+
+if __name__ == '__main__':
+    unittest.main()
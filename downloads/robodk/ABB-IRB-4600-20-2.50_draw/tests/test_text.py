@@ -0,0 +1,56 @@
+import unittest
+from io import BytesIO
+from unittest import mock
+
+from svgpy.geometry.rect import DOMRect
+from svgpy.text import SVGTextContentElement
+from svgpy.window import SVGDOMImplementation
+
+SVG_NS = 'http://www.w3.org/2000/svg'
+
+
+def parse(text):
+    impl = SVGDOMImplementation()
+    return impl.parse(BytesIO(text.encode()), prefetch=False)
+
+
+def chars_info(*rects):
+    info = list()
+    for rect in rects:
+        item = [None] * 7
+        item[SVGTextContentElement._CHARS_BBOX] = rect
+        info.append(item)
+    return info
+
+
+class TextBoundingBoxTestCase(unittest.TestCase):
+    def test_bbox_in_transformed_group(self):
+        root = parse(
+            '<svg xmlns="http://www.w3.org/2000/svg">'
+            '<g transform="translate(100 100)"><text>A</text></g>'
+            '</svg>')
+        group = root[0]
+        text = group[0]
+        with mock.patch.object(SVGTextContentElement, '_get_chars_info',
+                               return_value=chars_info(
+                                   DOMRect(0, 0, 5, 10),
+                                   DOMRect(5, 0, 5, 10))):
+            self.assertEqual(text.get_bbox().get_rect(), (0, 0, 10, 10))
+            self.assertEqual(root.get_bbox().get_rect(),
+                             (100, 100, 10, 10))
+
+    def test_bbox_with_own_transform_in_group(self):
+        root = parse(
+            '<svg xmlns="http://www.w3.org/2000/svg">'
+            '<g transform="translate(100 0)">'
+            '<text transform="scale(2)">A</text></g>'
+            '</svg>')
+        with mock.patch.object(SVGTextContentElement, '_get_chars_info',
+                               return_value=chars_info(
+                                   DOMRect(0, 0, 5, 10))):
+            self.assertEqual(root.get_bbox().get_rect(),
+                             (100, 0, 10, 20))
+
+
+if __name__ == '__main__':
+    unittest.main()